@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import webpower.power_tests as power_tests
@@ -424,6 +425,47 @@ class TestOneProp:
         expected = 0.1630304
         assert alpha_results == pytest.approx(expected, abs=1e-05)
 
+    @staticmethod
+    def test_oneprop_batch_results() -> None:
+        batch_results = power_tests.wp_one_prop_test_batch(h=[0.25, 0.3], n=100, alpha=0.05)
+        # wp.prop(h=0.25, n1=100,power=NULL,alternative="two.sided",type="1p")
+        expected = 0.705418
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-06)
+        expected = power_tests.wp_one_prop_test(h=0.3, n=100, alpha=0.05, print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+
+        batch_results = power_tests.wp_one_prop_test_batch(h=[0.52, 0.4], power=0.8, alternative="greater")
+        # wp.prop(h=0.52,n1=NULL,power=0.8,alternative="greater",type="1p")
+        assert batch_results["n"][0] == 23
+        expected = power_tests.wp_one_prop_test(h=0.4, power=0.8, alpha=0.05, alternative="greater",
+                                                print_pretty=False)["n"]
+        assert batch_results["n"][1] == expected
+
+    @staticmethod
+    def test_oneprop_alpha_boundary() -> None:
+        # alpha of 0 never rejects and alpha of 1 always does, whatever the alternative
+        for alpha, expected in [(0, 0.0), (1, 1.0)]:
+            for alternative in ["two-sided", "greater", "less"]:
+                for test, test_batch in [
+                    (power_tests.wp_one_prop_test, power_tests.wp_one_prop_test_batch),
+                    (power_tests.wp_two_prop_one_n_test, power_tests.wp_two_prop_one_n_test_batch),
+                ]:
+                    power_results = test(h=0.3, n=100, alpha=alpha, alternative=alternative,
+                                         print_pretty=False)["power"]
+                    assert power_results == pytest.approx(expected)
+                    batch_results = test_batch(h=0.3, n=100, alpha=alpha, alternative=alternative)
+                    assert batch_results["power"] == pytest.approx(expected)
+
+    @staticmethod
+    def test_oneprop_batch_grid() -> None:
+        hs, ns = [0.2, 0.3, 0.5], [50, 100]
+        grid_results = power_tests.wp_one_prop_test_batch(h=np.array(hs)[:, None], n=np.array(ns), alpha=0.05)
+        assert grid_results.shape == (3, 2)
+        for i, h in enumerate(hs):
+            for j, n in enumerate(ns):
+                expected = power_tests.wp_one_prop_test(h=h, n=n, alpha=0.05, print_pretty=False)["power"]
+                assert grid_results["power"][i, j] == pytest.approx(expected)
+
 
 class TestTwoPropOneN:
     @staticmethod
@@ -558,6 +600,24 @@ class TestTwoPropTwoN:
         expected = 0.3208521
         assert alpha_results == pytest.approx(expected)
 
+    @staticmethod
+    def test_twoprop_twon_batch_results() -> None:
+        batch_results = power_tests.wp_two_prop_two_n_test_batch(h=None, n1=[10, 20], n2=5, power=0.8, alpha=0.05)
+        # wp.prop(h=NULL, n1=10, n2=5, power=0.8, alpha=0.05, alternative="two.sided", type = "2p2n")
+        expected = 1.534504
+        assert batch_results["effect_size"][0] == pytest.approx(expected, abs=1e-04)
+        expected = power_tests.wp_two_prop_two_n_test(n1=20, n2=5, power=0.8, alpha=0.05,
+                                                      print_pretty=False)["effect_size"]
+        assert batch_results["effect_size"][1] == pytest.approx(expected)
+
+        batch_results = power_tests.wp_two_prop_two_n_test_batch(h=-0.2, n2=[750, 300], power=0.8, alpha=0.1,
+                                                                 alternative="less")
+        # wp.prop(h=-0.2, n1=NULL, n2=750, power=0.8, alpha=0.1, alternative="less", type = "2p2n")
+        assert batch_results["n1"][0] == 133
+        expected = power_tests.wp_two_prop_two_n_test(h=-0.2, n2=300, power=0.8, alpha=0.1, alternative="less",
+                                                      print_pretty=False)["n1"]
+        assert batch_results["n1"][1] == expected
+
 
 # T TESTS
 
@@ -633,6 +693,26 @@ class TestOneT:
         expected = 0.3725015
         assert alpha_results == pytest.approx(expected, abs=1e-05)
 
+    @staticmethod
+    def test_onet_batch_results() -> None:
+        batch_results = power_tests.wp_t1_test_batch(n=[150, 300], d=0.2, alpha=0.05, test_type="one-sample")
+        # wp.t(n1=150, d=0.2, type="one.sample")
+        expected = 0.682153
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_t1_test(n=300, d=0.2, alpha=0.05, test_type="one-sample", print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_t1_test_batch(d=[0.4, 0.2], power=0.8, test_type="paired", alternative="greater")
+        # wp.t(d=0.4, power=0.8, type="paired", alternative="greater")
+        assert batch_results["n"][0] == 41
+        expected = power_tests.wp_t1_test(d=0.2, power=0.8, alpha=0.05, test_type="paired", alternative="greater",
+                                          print_pretty=False)["n"]
+        assert batch_results["n"][1] == expected
+        alphas = [0.01, 0.05, 0.1]
+        batch_results = power_tests.wp_t1_test_batch(n=50, d=0.5, alpha=alphas)
+        for i, alpha in enumerate(alphas):
+            expected = power_tests.wp_t1_test(n=50, d=0.5, alpha=alpha, print_pretty=False)["power"]
+            assert batch_results["power"][i] == pytest.approx(expected)
+
 
 class TestTwoT:
     @staticmethod
@@ -711,6 +791,26 @@ class TestTwoT:
         expected = 0.7387184
         assert alpha_results == pytest.approx(expected, abs=1e-05)
 
+    @staticmethod
+    def test_twot_batch_results() -> None:
+        batch_results = power_tests.wp_t2_test_batch(n1=30, n2=[40, 400], d=0.356, alpha=0.05)
+        assert batch_results.shape == (2,)
+        # wp.t(n1=30, n2=40, d=0.356, type="two.sample.2n", alternative="two.sided")
+        expected = 0.3064767
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_t2_test(n1=30, n2=400, d=0.356, alpha=0.05, print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_t2_test_batch(n1=[1_000, 100], n2=None, d=0.4, power=0.8)
+        # wp.t(n1=1000, n2=NULL, d=0.4, power=0.8, type="two.sample.2n", alternative="two.sided")
+        assert batch_results["n2"][0] == 52
+        expected = power_tests.wp_t2_test(n1=100, d=0.4, alpha=0.05, power=0.8, print_pretty=False)["n2"]
+        assert batch_results["n2"][1] == expected
+        alphas = [0.01, 0.05, 0.1]
+        batch_results = power_tests.wp_t2_test_batch(n1=30, n2=40, d=0.3, alpha=alphas)
+        for i, alpha in enumerate(alphas):
+            expected = power_tests.wp_t2_test(n1=30, n2=40, d=0.3, alpha=alpha, print_pretty=False)["power"]
+            assert batch_results["power"][i] == pytest.approx(expected)
+
 
 # REGRESSION
 
@@ -769,6 +869,20 @@ class TestRegression:
         expected = 0.1960784
         assert alpha_results == pytest.approx(expected, abs=1e-03)
 
+    @staticmethod
+    def test_regression_batch_results() -> None:
+        batch_results = power_tests.wp_regression_test_batch(n=[100, 150], p1=3, f2=0.1, alpha=0.05)
+        # wp.regression(n = 100, p1 = 3, f2 = 0.1, alpha = 0.05, power = NULL)
+        expected = 0.7420463
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_regression_test(n=150, p1=3, f2=0.1, alpha=0.05, print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_regression_test_batch(p1=[3, 5], f2=0.1, alpha=0.05, power=0.8)
+        expected = power_tests.wp_regression_test(p1=3, f2=0.1, alpha=0.05, power=0.8, print_pretty=False)["n"]
+        assert batch_results["n"][0] == expected
+        expected = power_tests.wp_regression_test(p1=5, f2=0.1, alpha=0.05, power=0.8, print_pretty=False)["n"]
+        assert batch_results["n"][1] == expected
+
 
 class TestPoisson:
     @staticmethod
@@ -896,6 +1010,37 @@ class TestPoisson:
         expected = 4689
         assert n_results == expected
 
+    @staticmethod
+    def test_poisson_divergent_moments() -> None:
+        with pytest.raises(ValueError, match="lognormal"):
+            power_tests.wp_poisson_test(n=100, exp0=2, exp1=1.3, alpha=0.05, family="lognormal", print_pretty=False)
+        with pytest.raises(ValueError, match="exponential"):
+            power_tests.wp_poisson_test(n=100, exp0=2, exp1=3, alpha=0.05, family="exponential", parameter=1,
+                                        print_pretty=False)
+
+    @staticmethod
+    def test_poisson_batch_results() -> None:
+        batch_results = power_tests.wp_poisson_test_batch(
+            n=[4406, 500], exp0=2.798, exp1=0.8938, alpha=0.05, family="Bernoulli", parameter=0.53
+        )
+        # wp.poisson(n = 4406, exp0 = 2.798, exp1 = 0.8938, alpha = 0.05, power = NULL, family = "Bernoulli", parameter = 0.53)
+        expected = 0.9999789
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_poisson_test(
+            n=500, exp0=2.798, exp1=0.8938, alpha=0.05, family="Bernoulli", parameter=0.53, print_pretty=False
+        )["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_poisson_test_batch(
+            exp0=1.5, exp1=0.9, alpha=0.05, family="uniform", power=[0.7, 0.9]
+        )
+        # wp.poisson(n=NULL, exp0=1.5, exp1=0.9, alpha=0.05, power=0.7, family="uniform", parameter=NULL)
+        expected = 4689
+        assert batch_results["n"][0] == expected
+        expected = power_tests.wp_poisson_test(
+            exp0=1.5, exp1=0.9, alpha=0.05, power=0.9, family="uniform", print_pretty=False
+        )["n"]
+        assert batch_results["n"][1] == expected
+
 
 class TestLogistic:
     @staticmethod
@@ -1002,6 +1147,19 @@ class TestLogistic:
         expected = 0.001653495
         assert power_results == pytest.approx(expected, abs=1e-05)
 
+    @staticmethod
+    def test_logistic_poisson_family() -> None:
+        # there is no R output to compare against for family="poisson", so check that the solved n is the smallest one
+        # reaching the target power
+        n_results = power_tests.wp_logistic_test(n=None, p0=0.15, p1=0.1, alpha=0.05, power=0.8, family="poisson",
+                                                 parameter=4.5, alternative="less", print_pretty=False)["n"]
+        power_at_n, power_below_n = [
+            power_tests.wp_logistic_test(n=n, p0=0.15, p1=0.1, alpha=0.05, power=None, family="poisson",
+                                         parameter=4.5, alternative="less", print_pretty=False)["power"]
+            for n in (n_results, n_results - 1)
+        ]
+        assert power_below_n < 0.8 <= power_at_n
+
 
 # STRUCTURAL EQUATION MODELING
 
@@ -1064,6 +1222,21 @@ class TestSEMChisq:
         expected = 0.3549963
         assert expected == pytest.approx(alpha_results, abs=1e-03)
 
+    @staticmethod
+    def test_sem_chisq_batch_results() -> None:
+        batch_results = power_tests.wp_sem_chisq_test_batch(n=[100, 300], df=4, effect=0.054, alpha=0.05)
+        # wp.sem.chisq(n=100, df=4, effect=0.054, power=NULL, alpha=0.05)
+        expected = 0.4221152
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_sem_chisq_test(n=300, df=4, effect=0.054, alpha=0.05, print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_sem_chisq_test_batch(df=4, effect=[0.054, 0.1], alpha=0.05, power=0.8)
+        # wp.sem.chisq(n = NULL, df = 4, effect = 0.054, power = 0.8, alpha = 0.05)
+        expected = 223
+        assert batch_results["n"][0] == expected
+        expected = power_tests.wp_sem_chisq_test(df=4, effect=0.1, alpha=0.05, power=0.8, print_pretty=False)["n"]
+        assert batch_results["n"][1] == expected
+
 
 class TestSEMRMSEA:
     @staticmethod
@@ -1127,6 +1300,23 @@ class TestSEMRMSEA:
         expected = 0.1195863
         assert expected == pytest.approx(alpha_results, abs=1e-03)
 
+    @staticmethod
+    def test_sem_rmsea_batch_results() -> None:
+        batch_results = power_tests.wp_sem_rmsea_test_batch(n=100, df=4, rmsea0=0, rmsea1=[0.116, 0.08], alpha=0.05)
+        # wp.sem.rmsea (n = 100, df = 4, rmsea0 = 0, rmsea1 = 0.116, power = NULL, alpha = 0.05)
+        expected = 0.4208173
+        assert batch_results["power"][0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_sem_rmsea_test(n=100, df=4, rmsea0=0, rmsea1=0.08, alpha=0.05,
+                                                 print_pretty=False)["power"]
+        assert batch_results["power"][1] == pytest.approx(expected)
+        batch_results = power_tests.wp_sem_rmsea_test_batch(df=[4, 10], rmsea0=0, rmsea1=0.116, alpha=0.05, power=0.8)
+        # wp.sem.rmsea (n = NULL, df = 4, rmsea0 = 0, rmsea1 = 0.116, power = 0.8, alpha = 0.05)
+        expected = 223
+        assert batch_results["n"][0] == expected
+        expected = power_tests.wp_sem_rmsea_test(df=10, rmsea0=0, rmsea1=0.116, alpha=0.05, power=0.8,
+                                                 print_pretty=False)["n"]
+        assert batch_results["n"][1] == expected
+
 
 # MISCELLANEOUS
 
@@ -1258,8 +1448,19 @@ class TestCorrelation:
         expected = 0.5221974
         assert alpha_results == pytest.approx(expected, abs=1e-05)
 
+    @staticmethod
+    def test_correlation_batch_results() -> None:
+        batch_results = power_tests.wp_correlation_test_batch(n=[[50], [100]], r=[0.3, 0.1], alpha=0.05)
+        assert batch_results.shape == (2, 2)
+        # wp.correlation(n=50, r=0.3, alternative="two.sided")
+        expected = 0.5728731
+        assert batch_results["power"][0, 0] == pytest.approx(expected, abs=1e-05)
+        expected = power_tests.wp_correlation_test(n=100, r=0.1, alpha=0.05, print_pretty=False)["power"]
+        assert batch_results["power"][1, 1] == pytest.approx(expected)
+
 
 # RANDOMIZED TRIALS
+
 class TestMRT2Arm:
     @staticmethod
     def test_mrt2arm_results() -> None:
@@ -1343,6 +1544,32 @@ class TestMRT2Arm:
         expected = 0.5845826
         assert f_results == pytest.approx(expected, abs=1e-03)
 
+    @staticmethod
+    def test_mrt2arm_site_variance_n() -> None:
+        # the site and variance tests depend on n through their degrees of freedom, so the smallest n reaching the
+        # target power should fall short of it one subject earlier
+        for test_type in ["site", "variance"]:
+            n_results = power_tests.wp_mrt2arm_test(n=None, f=0.5, J=20, tau00=0.5, tau11=0.5, sg2=1.25, alpha=0.05,
+                                                    power=0.8, test_type=test_type, print_pretty=False)["n"]
+            power_at_n, power_below_n = [
+                power_tests.wp_mrt2arm_test(n=n, f=0.5, J=20, tau00=0.5, tau11=0.5, sg2=1.25, alpha=0.05, power=None,
+                                            test_type=test_type, print_pretty=False)["power"]
+                for n in (n_results, n_results - 1)
+            ]
+            assert power_below_n < 0.8 <= power_at_n
+
+    @staticmethod
+    def test_mrt2arm_greater() -> None:
+        # "greater" and "less" are computed as the one-sided test
+        for test_type in ["main", "site", "variance"]:
+            greater_results = power_tests.wp_mrt2arm_test(n=45, f=0.1, J=20, tau00=0.5, tau11=0.5, sg2=1.25,
+                                                          alpha=0.05, alternative="greater", test_type=test_type,
+                                                          print_pretty=False)["power"]
+            expected = power_tests.wp_mrt2arm_test(n=45, f=0.1, J=20, tau00=0.5, tau11=0.5, sg2=1.25, alpha=0.05,
+                                                   alternative="one-sided", test_type=test_type,
+                                                   print_pretty=False)["power"]
+            assert greater_results == pytest.approx(expected)
+
 
 class TestMRT3Arm:
     @staticmethod
@@ -1548,3 +1775,100 @@ class TestCRT3Arm:
         # URL: http://psychstat.org/crt3arm
         expected = 0.08915664
         assert alpha_results == pytest.approx(expected, abs=1e-05)
+
+    @staticmethod
+    def test_crt3arm_omnibus_results() -> None:
+        # at the J that wp.crt3arm(f = 0.5, n = 200, J = NULL, icc = 0.4, alpha = 0.05, power = 0.8,
+        # type = "omnibus") returns, the omnibus power is 0.8 and the icc and alpha solves give back their inputs
+        J = 18.87456
+        power_results = power_tests.wp_crt3arm_test(f=0.5, n=200, J=J, icc=0.4, alpha=0.05, power=None,
+                                                    test_type="omnibus", print_pretty=False)["power"]
+        assert power_results == pytest.approx(0.8, abs=1e-05)
+        icc_results = power_tests.wp_crt3arm_test(f=0.5, n=200, J=J, icc=None, alpha=0.05, power=0.8,
+                                                  test_type="omnibus", print_pretty=False)["icc"]
+        assert icc_results == pytest.approx(0.4, abs=1e-05)
+        alpha_results = power_tests.wp_crt3arm_test(f=0.5, n=200, J=J, icc=0.4, alpha=None, power=0.8,
+                                                    test_type="omnibus", print_pretty=False)["alpha"]
+        assert alpha_results == pytest.approx(0.05, abs=1e-05)
+
+        power_results = power_tests.wp_crt3arm_test(f=0.5, n=20, J=30, icc=0.1, alpha=0.05, power=None,
+                                                    test_type="omnibus", print_pretty=False)["power"]
+        # 1 - pf(qf(0.95, 2, 27), 2, 27, ncp = 30 * 0.5^2 / (0.1 + 0.9 / 20))
+        expected = 0.9999956
+        assert power_results == pytest.approx(expected, abs=1e-06)
+
+
+# BATCH FUNCTIONS
+
+_ALPHAS = [0.01, 0.05, 0.1]
+# batch function, scalar wrapper, the field compared, the parameter laid out down the column, its values and the
+# remaining arguments shared by both calls
+_BATCH_GRIDS = [
+    pytest.param(power_tests.wp_one_prop_test_batch, power_tests.wp_one_prop_test, "n", "h", [0.2, 0.3, 0.5],
+                 {"power": 0.8}, id="one_prop-n"),
+    pytest.param(power_tests.wp_one_prop_test_batch, power_tests.wp_one_prop_test, "effect_size", "n", [50, 100],
+                 {"power": 0.8, "alternative": "greater"}, id="one_prop-h"),
+    pytest.param(power_tests.wp_two_prop_one_n_test_batch, power_tests.wp_two_prop_one_n_test, "power", "h",
+                 [0.2, 0.3, 0.5], {"n": 100}, id="two_prop_one_n-power"),
+    pytest.param(power_tests.wp_two_prop_one_n_test_batch, power_tests.wp_two_prop_one_n_test, "n", "h",
+                 [0.2, 0.3, 0.5], {"power": 0.8}, id="two_prop_one_n-n"),
+    pytest.param(power_tests.wp_two_prop_one_n_test_batch, power_tests.wp_two_prop_one_n_test, "effect_size", "n",
+                 [50, 100], {"power": 0.8}, id="two_prop_one_n-h"),
+    pytest.param(power_tests.wp_two_prop_two_n_test_batch, power_tests.wp_two_prop_two_n_test, "power", "h",
+                 [0.2, 0.3, 0.5], {"n1": 80, "n2": 120}, id="two_prop_two_n-power"),
+    pytest.param(power_tests.wp_two_prop_two_n_test_batch, power_tests.wp_two_prop_two_n_test, "n1", "h",
+                 [0.2, 0.3, 0.5], {"n2": 300, "power": 0.8}, id="two_prop_two_n-n1"),
+    pytest.param(power_tests.wp_two_prop_two_n_test_batch, power_tests.wp_two_prop_two_n_test, "effect_size", "n1",
+                 [50, 100], {"n2": 60, "power": 0.8}, id="two_prop_two_n-h"),
+    pytest.param(power_tests.wp_t1_test_batch, power_tests.wp_t1_test, "power", "d", [0.2, 0.3, 0.5],
+                 {"n": 60, "test_type": "paired"}, id="t1-power"),
+    pytest.param(power_tests.wp_t1_test_batch, power_tests.wp_t1_test, "n", "d", [0.2, 0.3, 0.5],
+                 {"power": 0.8, "alternative": "greater"}, id="t1-n"),
+    pytest.param(power_tests.wp_t2_test_batch, power_tests.wp_t2_test, "power", "n2", [40, 400],
+                 {"n1": 30, "d": 0.3}, id="t2-power"),
+    pytest.param(power_tests.wp_t2_test_batch, power_tests.wp_t2_test, "n2", "n1", [1_000, 100],
+                 {"d": -0.4, "power": 0.8, "alternative": "less"}, id="t2-n2"),
+    pytest.param(power_tests.wp_regression_test_batch, power_tests.wp_regression_test, "power", "f2",
+                 [0.05, 0.1, 0.2], {"n": 100, "p1": 4, "p2": 2}, id="regression-power"),
+    pytest.param(power_tests.wp_regression_test_batch, power_tests.wp_regression_test, "n", "p1", [3, 5],
+                 {"f2": 0.1, "power": 0.8, "test_type": "cohen"}, id="regression-n"),
+    pytest.param(power_tests.wp_poisson_test_batch, power_tests.wp_poisson_test, "power", "n", [200, 500],
+                 {"exp0": 2.798, "exp1": 0.8938, "family": "Bernoulli", "parameter": 0.53}, id="poisson-power"),
+    pytest.param(power_tests.wp_poisson_test_batch, power_tests.wp_poisson_test, "n", "power", [0.7, 0.9],
+                 {"exp0": 1.5, "exp1": 0.9, "family": "uniform"}, id="poisson-n"),
+    pytest.param(power_tests.wp_sem_chisq_test_batch, power_tests.wp_sem_chisq_test, "power", "effect",
+                 [0.054, 0.1], {"n": 100, "df": 4}, id="sem_chisq-power"),
+    pytest.param(power_tests.wp_sem_chisq_test_batch, power_tests.wp_sem_chisq_test, "n", "df", [4, 10],
+                 {"effect": 0.054, "power": 0.8}, id="sem_chisq-n"),
+    pytest.param(power_tests.wp_sem_rmsea_test_batch, power_tests.wp_sem_rmsea_test, "power", "rmsea1",
+                 [0.08, 0.116], {"n": 100, "df": 4, "rmsea0": 0}, id="sem_rmsea-power"),
+    pytest.param(power_tests.wp_sem_rmsea_test_batch, power_tests.wp_sem_rmsea_test, "n", "df", [4, 10],
+                 {"rmsea0": 0.05, "rmsea1": 0.02, "power": 0.8, "test_type": "notclose"}, id="sem_rmsea-n"),
+    pytest.param(power_tests.wp_correlation_test_batch, power_tests.wp_correlation_test, "power", "n", [50, 100],
+                 {"r": -0.3, "alternative": "less"}, id="correlation-power"),
+]
+
+
+class TestBatchGrid:
+    @staticmethod
+    @pytest.mark.parametrize("batch_test, test, field, name, values, kwargs", _BATCH_GRIDS)
+    def test_batch_alpha_grid(batch_test, test, field: str, name: str, values: list, kwargs: dict) -> None:
+        # a column of one parameter broadcast against a row of alphas has to match the scalar wrapper at every element
+        grid_results = batch_test(**{name: np.array(values)[:, None]}, alpha=np.array(_ALPHAS), **kwargs)
+        assert grid_results.shape == (len(values), len(_ALPHAS))
+        for i, value in enumerate(values):
+            for j, alpha in enumerate(_ALPHAS):
+                expected = test(**{name: value}, alpha=alpha, print_pretty=False, **kwargs)[field]
+                assert grid_results[field][i, j] == pytest.approx(expected)
+
+    @staticmethod
+    @pytest.mark.parametrize("batch_test, kwargs", [
+        pytest.param(power_tests.wp_t1_test_batch, {"d": [0.0, 0.5]}, id="t1"),
+        pytest.param(power_tests.wp_t2_test_batch, {"n1": 30, "d": [0.0, 0.5]}, id="t2"),
+        pytest.param(power_tests.wp_sem_chisq_test_batch, {"effect": [0.1, 0.0]}, id="sem_chisq"),
+        pytest.param(power_tests.wp_sem_rmsea_test_batch, {"rmsea0": 0.05, "rmsea1": [0.05, 0.08]}, id="sem_rmsea"),
+    ])
+    def test_batch_zero_effect(batch_test, kwargs: dict) -> None:
+        # with no effect the power is alpha at every sample size, so there is no sample size to solve for
+        with pytest.raises(ValueError, match="power equals alpha"):
+            batch_test(power=0.8, **kwargs)
@@ -1,11 +1,15 @@
 from math import ceil, sqrt, pow
 from typing import Dict, Optional
 
-from scipy.stats import chi2, ncx2, ncf, nct, f as f_dist, t as t_dist
+from scipy.special import chdtri, chndtr, fdtri, stdtrit
+from scipy.stats import ncf, nct
 from scipy.optimize import brentq, bisect
 
 
 class WpAnovaClass:
+    method = "Power for One-way ANOVA"
+    url = "http://psychstat.org/anova"
+
     def __init__(
         self,
         k: Optional[int] = None,
@@ -21,7 +25,6 @@ class WpAnovaClass:
         self.alpha = alpha
         self.power = power
         self.test_type = test_type.casefold()
-        self.method = "Power for One-way ANOVA"
         if self.test_type == "overall":
             self.note = "n is the total sample size (overall)"
         elif self.test_type == "greater":
@@ -30,13 +33,12 @@ class WpAnovaClass:
             self.note = "n is the total sample size (contrast, less)"
         else:
             self.note = "n is the total sample size (contrast, two-sided)"
-        self.url = "http://psychstat.org/anova"
 
     def _get_power(self) -> float:
         if self.test_type == "overall":
             lambda_ = self.n * pow(self.f, 2)
             power = ncf.sf(
-                f_dist.isf(self.alpha, self.k - 1, self.n - self.k),
+                fdtri(self.k - 1, self.n - self.k, 1 - self.alpha),
                 self.k - 1,
                 self.n - self.k,
                 lambda_,
@@ -44,7 +46,7 @@ class WpAnovaClass:
         elif self.test_type == "two-sided":
             lambda_ = self.n * pow(self.f, 2)
             power = ncf.sf(
-                f_dist.isf(self.alpha, self.k - 1, self.n - self.k),
+                fdtri(self.k - 1, self.n - self.k, 1 - self.alpha),
                 1,
                 self.n - self.k,
                 lambda_,
@@ -52,12 +54,12 @@ class WpAnovaClass:
         elif self.test_type == "greater":
             lambda_ = sqrt(self.n) * self.f
             power = nct.sf(
-                t_dist.isf(self.alpha, self.n - self.k), self.n - self.k, lambda_
+                stdtrit(self.n - self.k, 1 - self.alpha), self.n - self.k, lambda_
             )
         else:
             lambda_ = sqrt(self.n) * self.f
             power = nct.cdf(
-                t_dist.ppf(self.alpha, self.n - self.k), self.n - self.k, lambda_
+                stdtrit(self.n - self.k, self.alpha), self.n - self.k, lambda_
             )
         return power
 
@@ -66,7 +68,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(self.f, 2)
             k = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, k - 1, self.n - k),
+                    fdtri(k - 1, self.n - k, 1 - self.alpha),
                     k - 1,
                     self.n - k,
                     lambda_,
@@ -77,7 +79,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(self.f, 2)
             k = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, k - 1, self.n - k),
+                    fdtri(k - 1, self.n - k, 1 - self.alpha),
                     1,
                     self.n - self.k,
                     lambda_,
@@ -87,13 +89,13 @@ class WpAnovaClass:
         elif self.test_type == "greater":
             lambda_ = sqrt(self.n) * self.f
             k = (
-                nct.sf(t_dist.isf(self.alpha, self.n - k), self.n - k, lambda_)
+                nct.sf(stdtrit(self.n - k, 1 - self.alpha), self.n - k, lambda_)
                 - self.power
             )
         else:
             lambda_ = sqrt(self.n) * self.f
             k = (
-                nct.cdf(t_dist.ppf(self.alpha, self.n - k), self.n - k, lambda_)
+                nct.cdf(stdtrit(self.n - k, self.alpha), self.n - k, lambda_)
                 - self.power
             )
         return k
@@ -103,7 +105,7 @@ class WpAnovaClass:
             lambda_ = n * pow(self.f, 2)
             n = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, self.k - 1, n - self.k),
+                    fdtri(self.k - 1, n - self.k, 1 - self.alpha),
                     self.k - 1,
                     n - self.k,
                     lambda_,
@@ -114,7 +116,7 @@ class WpAnovaClass:
             lambda_ = n * pow(self.f, 2)
             n = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, self.k - 1, n - self.k),
+                    fdtri(self.k - 1, n - self.k, 1 - self.alpha),
                     1,
                     n - self.k,
                     lambda_,
@@ -124,13 +126,13 @@ class WpAnovaClass:
         elif self.test_type == "greater":
             lambda_ = sqrt(n) * self.f
             n = (
-                nct.sf(t_dist.isf(self.alpha, n - self.k), n - self.k, lambda_)
+                nct.sf(stdtrit(n - self.k, 1 - self.alpha), n - self.k, lambda_)
                 - self.power
             )
         else:
             lambda_ = sqrt(n) * self.f
             n = (
-                nct.cdf(t_dist.ppf(self.alpha, n - self.k), n - self.k, lambda_)
+                nct.cdf(stdtrit(n - self.k, self.alpha), n - self.k, lambda_)
                 - self.power
             )
         return n
@@ -140,7 +142,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(f, 2)
             f = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, self.k - 1, self.n - self.k),
+                    fdtri(self.k - 1, self.n - self.k, 1 - self.alpha),
                     self.k - 1,
                     self.n - self.k,
                     lambda_,
@@ -151,7 +153,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(f, 2)
             f = (
                 ncf.sf(
-                    f_dist.isf(self.alpha, self.k - 1, self.n - self.k),
+                    fdtri(self.k - 1, self.n - self.k, 1 - self.alpha),
                     1,
                     self.n - self.k,
                     lambda_,
@@ -162,7 +164,7 @@ class WpAnovaClass:
             lambda_ = sqrt(self.n) * f
             f = (
                 nct.sf(
-                    t_dist.isf(self.alpha, self.n - self.k), self.n - self.k, lambda_
+                    stdtrit(self.n - self.k, 1 - self.alpha), self.n - self.k, lambda_
                 )
                 - self.power
             )
@@ -170,7 +172,7 @@ class WpAnovaClass:
             lambda_ = sqrt(self.n) * f
             f = (
                 nct.cdf(
-                    t_dist.ppf(self.alpha, self.n - self.k), self.n - self.k, lambda_
+                    stdtrit(self.n - self.k, self.alpha), self.n - self.k, lambda_
                 )
                 - self.power
             )
@@ -181,7 +183,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(self.f, 2)
             alpha = (
                 ncf.sf(
-                    f_dist.isf(alpha, self.k - 1, self.n - self.k),
+                    fdtri(self.k - 1, self.n - self.k, 1 - alpha),
                     self.k - 1,
                     self.n - self.k,
                     lambda_,
@@ -192,7 +194,7 @@ class WpAnovaClass:
             lambda_ = self.n * pow(self.f, 2)
             alpha = (
                 ncf.sf(
-                    f_dist.isf(alpha, self.k - 1, self.n - self.k),
+                    fdtri(self.k - 1, self.n - self.k, 1 - alpha),
                     1,
                     self.n - self.k,
                     lambda_,
@@ -202,13 +204,13 @@ class WpAnovaClass:
         elif self.test_type == "greater":
             lambda_ = sqrt(self.n) * self.f
             alpha = (
-                nct.sf(t_dist.isf(alpha, self.n - self.k), self.n - self.k, lambda_)
+                nct.sf(stdtrit(self.n - self.k, 1 - alpha), self.n - self.k, lambda_)
                 - self.power
             )
         else:
             lambda_ = sqrt(self.n) * self.f
             alpha = (
-                nct.cdf(t_dist.ppf(alpha, self.n - self.k), self.n - self.k, lambda_)
+                nct.cdf(stdtrit(self.n - self.k, alpha), self.n - self.k, lambda_)
                 - self.power
             )
         return alpha
@@ -237,6 +239,10 @@ class WpAnovaClass:
 
 
 class WpAnovaBinaryClass:
+    method = "One-way Analogous ANOVA with Binary Data"
+    url = "http://psychstat.org/anovabinary"
+    note = "n is the total sample size"
+
     def __init__(
         self,
         k: Optional[int] = None,
@@ -250,43 +256,40 @@ class WpAnovaBinaryClass:
         self.V = V
         self.alpha = alpha
         self.power = power
-        self.method = "One-way Analogous ANOVA with Binary Data"
-        self.url = "http://psychstat.org/anovabinary"
-        self.note = "n is the total sample size"
 
     def _get_power(self) -> float:
         chi = pow(self.V, 2) * self.n * (self.k - 1)
         df = self.k - 1
-        crit_value = chi2.ppf(1 - self.alpha, df)
-        power = ncx2.sf(crit_value, df, chi)
+        crit_value = chdtri(df, self.alpha)
+        power = 1 - chndtr(crit_value, df, chi)
         return power
 
     def _get_groups(self, k: int) -> float:
         chi = pow(self.V, 2) * self.n * (k - 1)
         df = k - 1
-        crit_value = chi2.ppf(1 - self.alpha, df)
-        k = ncx2.sf(crit_value, df, chi) - self.power
+        crit_value = chdtri(df, self.alpha)
+        k = 1 - chndtr(crit_value, df, chi) - self.power
         return k
 
     def _get_sample_size(self, n: int) -> float:
         chi = pow(self.V, 2) * n * (self.k - 1)
         df = self.k - 1
-        crit_value = chi2.ppf(1 - self.alpha, df)
-        n = ncx2.sf(crit_value, df, chi) - self.power
+        crit_value = chdtri(df, self.alpha)
+        n = 1 - chndtr(crit_value, df, chi) - self.power
         return n
 
     def _get_effect_size(self, V: float) -> float:
         chi = pow(V, 2) * self.n * (self.k - 1)
         df = self.k - 1
-        crit_value = chi2.ppf(1 - self.alpha, df)
-        V = ncx2.sf(crit_value, df, chi) - self.power
+        crit_value = chdtri(df, self.alpha)
+        V = 1 - chndtr(crit_value, df, chi) - self.power
         return V
 
     def _get_alpha(self, alpha: float) -> float:
         chi = pow(self.V, 2) * self.n * (self.k - 1)
         df = self.k - 1
-        crit_value = chi2.ppf(1 - alpha, df)
-        alpha = ncx2.sf(crit_value, df, chi) - self.power
+        crit_value = chdtri(df, alpha)
+        alpha = 1 - chndtr(crit_value, df, chi) - self.power
         return alpha
 
     def pwr_test(self) -> Dict:
@@ -313,21 +316,15 @@ class WpAnovaBinaryClass:
 
 
 class WpAnovaCountClass(WpAnovaBinaryClass):
-    def __init__(
-        self,
-        k: Optional[int] = None,
-        n: Optional[int] = None,
-        V: Optional[float] = None,
-        alpha: Optional[float] = None,
-        power: Optional[float] = None,
-    ) -> None:
-        super().__init__(k, n, V, alpha, power)
-        self.method = "One-way Analogous ANOVA with Count Data"
-        self.url = "http://psychstat.org/anovacount"
-        self.note = "n is the total sample size"
+    method = "One-way Analogous ANOVA with Count Data"
+    url = "http://psychstat.org/anovacount"
 
 
 class WpKAnovaClass:
+    method = "Multiple way ANOVA analysis"
+    url = "http://psychstat.org/kanova"
+    note = "Sample size is the total sample size"
+
     def __init__(
         self,
         n: Optional[int] = None,
@@ -343,21 +340,18 @@ class WpKAnovaClass:
         self.ng = ng
         self.alpha = alpha
         self.power = power
-        self.method = "Multiple way ANOVA analysis"
-        self.url = "http://psychstat.org/kanova"
-        self.note = "Sample size is the total sample size"
 
     def _get_power(self) -> float:
         lambda_ = pow(self.f, 2) * self.n
         ddf = self.n - self.ng
-        power = ncf.sf(f_dist.isf(self.alpha, self.ndf, ddf), self.ndf, ddf, lambda_)
+        power = ncf.sf(fdtri(self.ndf, ddf, 1 - self.alpha), self.ndf, ddf, lambda_)
         return power
 
     def _get_sample_size(self, n: int) -> float:
         lambda_ = pow(self.f, 2) * n
         ddf = n - self.ng
         n = (
-            ncf.sf(f_dist.isf(self.alpha, self.ndf, ddf), self.ndf, ddf, lambda_)
+            ncf.sf(fdtri(self.ndf, ddf, 1 - self.alpha), self.ndf, ddf, lambda_)
             - self.power
         )
         return n
@@ -365,14 +359,14 @@ class WpKAnovaClass:
     def _get_numerator_df(self, ndf: int) -> float:
         lambda_ = pow(self.f, 2) * self.n
         ddf = self.n - self.ng
-        ndf = ncf.sf(f_dist.isf(self.alpha, ndf, ddf), ndf, ddf, lambda_) - self.power
+        ndf = ncf.sf(fdtri(ndf, ddf, 1 - self.alpha), ndf, ddf, lambda_) - self.power
         return ndf
 
     def _get_effect_size(self, f: float) -> float:
         lambda_ = pow(f, 2) * self.n
         ddf = self.n - self.ng
         f = (
-            ncf.sf(f_dist.isf(self.alpha, self.ndf, ddf), self.ndf, ddf, lambda_)
+            ncf.sf(fdtri(self.ndf, ddf, 1 - self.alpha), self.ndf, ddf, lambda_)
             - self.power
         )
         return f
@@ -381,7 +375,7 @@ class WpKAnovaClass:
         lambda_ = pow(self.f, 2) * self.n
         ddf = self.n - ng
         ng = (
-            ncf.sf(f_dist.isf(self.alpha, self.ndf, ddf), self.ndf, ddf, lambda_)
+            ncf.sf(fdtri(self.ndf, ddf, 1 - self.alpha), self.ndf, ddf, lambda_)
             - self.power
         )
         return ng
@@ -390,7 +384,7 @@ class WpKAnovaClass:
         lambda_ = pow(self.f, 2) * self.n
         ddf = self.n - self.ng
         alpha = (
-            ncf.sf(f_dist.isf(alpha, self.ndf, ddf), self.ndf, ddf, lambda_)
+            ncf.sf(fdtri(self.ndf, ddf, 1 - alpha), self.ndf, ddf, lambda_)
             - self.power
         )
         return alpha
@@ -424,6 +418,9 @@ class WpKAnovaClass:
 
 
 class WpRMAnovaClass:
+    method = "Repeated-measures ANOVA analysis"
+    url = "http://psychstat.org/rmanova"
+
     def __init__(
         self,
         n: Optional[int] = None,
@@ -443,8 +440,6 @@ class WpRMAnovaClass:
         self.alpha = alpha
         self.power = power
         self.test_type = test_type
-        self.method = "Repeated-measures ANOVA analysis"
-        self.url = "http://psychstat.org/rmanova"
         if self.test_type == "between":
             self.note = "Power analysis for between-effect test"
         elif self.test_type == "within":
@@ -463,7 +458,7 @@ class WpRMAnovaClass:
             df_1 = (self.ng - 1) * (self.nm - 1) * self.nscor
             df_2 = (self.n - self.ng) * (self.nm - 1) * self.nscor
         lambda_ = pow(self.f, 2) * self.n * self.nscor
-        power = ncf.sf(f_dist.isf(self.alpha, df_1, df_2), df_1, df_2, lambda_)
+        power = ncf.sf(fdtri(df_1, df_2, 1 - self.alpha), df_1, df_2, lambda_)
         return power
 
     def _get_groups(self, ng: int) -> float:
@@ -478,7 +473,7 @@ class WpRMAnovaClass:
             df_2 = (self.n - ng) * (self.nm - 1) * self.nscor
         lambda_ = pow(self.f, 2) * self.n * self.nscor
         ng = (
-            ncf.sf(f_dist.isf(self.alpha, df_1, df_2), df_1, df_2, lambda_) - self.power
+            ncf.sf(fdtri(df_1, df_2, 1 - self.alpha), df_1, df_2, lambda_) - self.power
         )
         return ng
 
@@ -493,7 +488,7 @@ class WpRMAnovaClass:
             df_2 = (self.n - self.ng) * (nm - 1) * self.nscor
         lambda_ = pow(self.f, 2) * self.n * self.nscor
         nm = (
-            ncf.sf(f_dist.isf(self.alpha, df_1, df_2), df_1, df_2, lambda_) - self.power
+            ncf.sf(fdtri(df_1, df_2, 1 - self.alpha), df_1, df_2, lambda_) - self.power
         )
         return nm
 
@@ -508,7 +503,7 @@ class WpRMAnovaClass:
             df_1 = (self.ng - 1) * (self.nm - 1) * self.nscor
             df_2 = (n - self.ng) * (self.nm - 1) * self.nscor
         lambda_ = pow(self.f, 2) * n * self.nscor
-        n = ncf.sf(f_dist.isf(self.alpha, df_1, df_2), df_1, df_2, lambda_) - self.power
+        n = ncf.sf(fdtri(df_1, df_2, 1 - self.alpha), df_1, df_2, lambda_) - self.power
         return n
 
     def _get_effect_size(self, f: float) -> float:
@@ -522,7 +517,7 @@ class WpRMAnovaClass:
             df_1 = (self.ng - 1) * (self.nm - 1) * self.nscor
             df_2 = (self.n - self.ng) * (self.nm - 1) * self.nscor
         lambda_ = pow(f, 2) * self.n * self.nscor
-        f = ncf.sf(f_dist.isf(self.alpha, df_1, df_2), df_1, df_2, lambda_) - self.power
+        f = ncf.sf(fdtri(df_1, df_2, 1 - self.alpha), df_1, df_2, lambda_) - self.power
         return f
 
     def _get_alpha(self, alpha: float) -> float:
@@ -536,7 +531,7 @@ class WpRMAnovaClass:
             df_1 = (self.ng - 1) * (self.nm - 1) * self.nscor
             df_2 = (self.n - self.ng) * (self.nm - 1) * self.nscor
         lambda_ = pow(self.f, 2) * self.n * self.nscor
-        alpha = ncf.sf(f_dist.isf(alpha, df_1, df_2), df_1, df_2, lambda_) - self.power
+        alpha = ncf.sf(fdtri(df_1, df_2, 1 - alpha), df_1, df_2, lambda_) - self.power
         return alpha
 
     def pwr_test(self) -> Dict:
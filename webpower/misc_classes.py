@@ -1,13 +1,91 @@
+import numpy as np
+
 from typing import Optional, Dict
-from math import sqrt, pow, ceil, log
+from math import sqrt, ceil
 
-from scipy.stats import norm
+from scipy.special import ndtr, ndtri
 from scipy.optimize import brentq
 
 from webpower.utils import nuniroot
 
 
+def _sobel_power(n: float, a: float, b: float, var_x: float, var_y: float, var_m: float, alpha: float) -> float:
+    """Power of the two-sided Sobel test for a simple mediation model. This is kept as a plain function of scipy.special
+    ufuncs so that every root-finding iteration avoids the overhead of scipy.stats' frozen distribution machinery, and
+    it accepts NumPy arrays so that the grid nuniroot brackets the root on is evaluated in one call
+
+    Parameters
+    ----------
+    n: float
+        Sample size
+    a: float
+        Regression coefficient from x to m
+    b: float
+        Regression coefficient from m to y
+    var_x: float
+        Variance of x
+    var_y: float
+        Variance of y
+    var_m: float
+        Variance of m
+    alpha: float
+        Significance level of the test
+
+    Returns
+    -------
+    The power of the Sobel test
+    """
+    var_m_resid = var_m - a * a * var_x
+    delta = np.sqrt(n) * a * b / np.sqrt(a * a * var_y / var_m_resid + b * b * var_m_resid / var_x)
+    za2 = ndtri(1 - alpha / 2)
+    return ndtr(delta - za2) + ndtr(-za2 - delta)
+
+
+def _fisher_z_power(n: float, r: float, p: int, rho0: float, alpha: float, alternative: str) -> float:
+    """Power of the test of a correlation coefficient, using Fisher's z transformation with the higher-order
+    corrections to its mean and variance. This is a closed form, so asking for the power never goes through a root
+    finder, and it accepts NumPy arrays for n, r and alpha
+
+    Parameters
+    ----------
+    n: float
+        Sample size
+    r: float
+        Effect size or correlation
+    p: int
+        Number of variables to partial out
+    rho0: float
+        Null correlation coefficient
+    alpha: float
+        Significance level of the test
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    The power of the test
+    """
+    m = n - 1 - p
+    delta = np.sqrt(n - 3 - p) * (
+            np.log((1 + r) / (1 - r)) / 2
+            + r / m / 2 * (1 + (5 + r ** 2) / m / 4 + (11 + 2 * r ** 2 + 3 * r ** 4) / m ** 2 / 8)
+            - np.log((1 + rho0) / (1 - rho0)) / 2
+            - rho0 / m / 2
+    )
+    sd = np.sqrt((n - 3 - p) / m * (1 + (4 - r ** 2) / m / 2 + (22 - 6 * r ** 2 - 3 * r ** 4) / m ** 2 / 6))
+    if alternative == "two-sided":
+        z_alpha = ndtri(1 - alpha / 2)
+        return ndtr((delta - z_alpha) / sd) + ndtr((-delta - z_alpha) / sd)
+    z_alpha = ndtri(1 - alpha)
+    if alternative == "greater":
+        return ndtr((delta - z_alpha) / sd)
+    return ndtr((-delta - z_alpha) / sd)
+
+
 class WpMediation:
+    method = "Power for simple mediation"
+    url = "http://psychstat.org/mediation"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -27,80 +105,24 @@ class WpMediation:
         self.var_y = var_y
         self.var_m = var_m
         self.alpha = alpha
-        self.method = "Power for simple mediation"
-        self.url = "http://psychstat.org/mediation"
 
     def _get_power(self) -> float:
-        numerator = sqrt(self.n) * self.a * self.b
-        denominator = sqrt(
-            pow(self.a, 2) * self.var_y / (self.var_m - pow(self.a, 2) * self.var_x)
-            + pow(self.b, 2) * (self.var_m - pow(self.a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = self.alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        power = norm.sf(za2 - delta) + norm.cdf(-za2 - delta)
-        return power
+        return _sobel_power(self.n, self.a, self.b, self.var_x, self.var_y, self.var_m, self.alpha)
 
     def _get_n(self, n: int) -> float:
-        numerator = sqrt(n) * self.a * self.b
-        denominator = sqrt(
-            pow(self.a, 2) * self.var_y / (self.var_m - pow(self.a, 2) * self.var_x)
-            + pow(self.b, 2) * (self.var_m - pow(self.a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = self.alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        n = norm.sf(za2 - delta) + norm.cdf(-za2 - delta) - self.power
-        return n
+        return _sobel_power(n, self.a, self.b, self.var_x, self.var_y, self.var_m, self.alpha) - self.power
 
     def _get_var_y(self, var_y: float) -> float:
-        numerator = sqrt(self.n) * self.a * self.b
-        denominator = sqrt(
-            pow(self.a, 2) * var_y / (self.var_m - pow(self.a, 2) * self.var_x)
-            + pow(self.b, 2) * (self.var_m - pow(self.a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = self.alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        var_y = norm.sf(za2 - delta) + norm.cdf(-za2 - delta) - self.power
-        return var_y
+        return _sobel_power(self.n, self.a, self.b, self.var_x, var_y, self.var_m, self.alpha) - self.power
 
     def _get_a(self, a: float) -> float:
-        numerator = sqrt(self.n) * a * self.b
-        denominator = sqrt(
-            pow(a, 2) * self.var_y / (self.var_m - pow(a, 2) * self.var_x)
-            + pow(self.b, 2) * (self.var_m - pow(a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = self.alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        a = norm.sf(za2 - delta) + norm.cdf(-za2 - delta) - self.power
-        return a
+        return _sobel_power(self.n, a, self.b, self.var_x, self.var_y, self.var_m, self.alpha) - self.power
 
     def _get_b(self, b: float) -> float:
-        numerator = sqrt(self.n) * self.a * b
-        denominator = sqrt(
-            pow(self.a, 2) * self.var_y / (self.var_m - pow(self.a, 2) * self.var_x)
-            + pow(b, 2) * (self.var_m - pow(self.a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = self.alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        b = norm.sf(za2 - delta) + norm.cdf(-za2 - delta) - self.power
-        return b
+        return _sobel_power(self.n, self.a, b, self.var_x, self.var_y, self.var_m, self.alpha) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        numerator = sqrt(self.n) * self.a * self.b
-        denominator = sqrt(
-            pow(self.a, 2) * self.var_y / (self.var_m - pow(self.a, 2) * self.var_x)
-            + pow(self.b, 2) * (self.var_m - pow(self.a, 2) * self.var_x) / self.var_x
-        )
-        delta = numerator / denominator
-        alpha2 = alpha / 2
-        za2 = norm.ppf(1 - alpha2)
-        alpha = norm.sf(za2 - delta) + norm.cdf(-za2 - delta) - self.power
-        return alpha
+        return _sobel_power(self.n, self.a, self.b, self.var_x, self.var_y, self.var_m, alpha) - self.power
 
     def pwr_test(self) -> Dict:
         if self.power is None:
@@ -108,16 +130,16 @@ class WpMediation:
         elif self.n is None:
             self.n = ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
         elif self.var_y is None:
-            self.var_y = nuniroot(self._get_var_y, 1e-10, 1e07)
+            self.var_y = nuniroot(self._get_var_y, 1e-10, 1e07, vectorized=True)
         elif self.a is None:
             astart = self.var_m / self.var_x
             alow = -sqrt(astart) + 1e-06
             aup = sqrt(astart) - 1e-06
-            self.a = nuniroot(self._get_a, alow, aup)
+            self.a = nuniroot(self._get_a, alow, aup, vectorized=True)
         elif self.b is None:
-            self.b = nuniroot(self._get_b, -10, 10)
+            self.b = nuniroot(self._get_b, -10, 10, vectorized=True)
         else:
-            self.alpha = nuniroot(self._get_alpha, 1e-10, 1 - 1e-10)
+            self.alpha = nuniroot(self._get_alpha, 1e-10, 1 - 1e-10, vectorized=True)
         return {
             "n": self.n,
             "a": self.a,
@@ -133,6 +155,9 @@ class WpMediation:
 
 
 class WpCorrelation:
+    method = "Power for correlation"
+    url = "http://psychstat.org/correlation"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -150,175 +175,18 @@ class WpCorrelation:
         self.rho0 = rho0
         self.alpha = alpha
         self.alternative = alternative.casefold()
-        self.method = "Power for correlation"
-        self.url = "http://psychstat.org/correlation"
 
     def _get_power(self) -> float:
-        delta = sqrt(self.n - 3 - self.p) * (
-                log((1 + self.r) / (1 - self.r)) / 2
-                + self.r
-                / (self.n - 1 - self.p)
-                / 2
-                * (
-                        1
-                        + (5 + pow(self.r, 2)) / (self.n - 1 - self.p) / 4
-                        + (
-                                11
-                                + 2 * pow(self.r, 2)
-                                + 3 * pow(self.r, 4)) / pow(self.n - 1 - self.p, 2)
-                        / 8
-                )
-                - log((1 + self.rho0) / (1 - self.rho0)) / 2
-                - self.rho0 / (self.n - 1 - self.p) / 2
-        )
-        v = (
-                (self.n - 3 - self.p)
-                / (self.n - 1 - self.p)
-                * (
-                        1
-                        + (4 - pow(self.r, 2)) / (self.n - 1 - self.p) / 2
-                        + (22 - 6 * pow(self.r, 2) - 3 * pow(self.r, 4))
-                        / pow(self.n - 1 - self.p, 2)
-                        / 6
-                )
-        )
-        if self.alternative == "two-sided":
-            z_alpha = norm.ppf(1 - self.alpha / 2)
-            power = norm.cdf((delta - z_alpha) / sqrt(v)) + norm.cdf(
-                (-delta - z_alpha) / sqrt(v)
-            )
-        else:
-            z_alpha = norm.ppf(1 - self.alpha)
-            if self.alternative == "greater":
-                power = norm.cdf((delta - z_alpha) / sqrt(v))
-            else:
-                power = norm.cdf((-delta - z_alpha) / sqrt(v))
-        return power
+        return _fisher_z_power(self.n, self.r, self.p, self.rho0, self.alpha, self.alternative)
 
     def _get_n(self, n: int) -> float:
-        delta = sqrt(n - 3 - self.p) * (
-                log((1 + self.r) / (1 - self.r)) / 2
-                + self.r
-                / (n - 1 - self.p)
-                / 2
-                * (
-                        1
-                        + (5 + pow(self.r, 2)) / (n - 1 - self.p) / 4
-                        + (
-                                11
-                                + 2 * pow(self.r, 2)
-                                + 3 * pow(self.r, 4)) / pow(n - 1 - self.p, 2)
-                        / 8
-                )
-                - log((1 + self.rho0) / (1 - self.rho0)) / 2
-                - self.rho0 / (n - 1 - self.p) / 2
-        )
-        v = (
-                (n - 3 - self.p)
-                / (n - 1 - self.p)
-                * (
-                        1
-                        + (4 - pow(self.r, 2)) / (n - 1 - self.p) / 2
-                        + (22 - 6 * pow(self.r, 2) - 3 * pow(self.r, 4))
-                        / pow(n - 1 - self.p, 2)
-                        / 6
-                )
-        )
-        if self.alternative == "two-sided":
-            z_alpha = norm.ppf(1 - self.alpha / 2)
-            n = norm.cdf((delta - z_alpha) / sqrt(v)) + norm.cdf(
-                (-delta - z_alpha) / sqrt(v)
-            ) - self.power
-        else:
-            z_alpha = norm.ppf(1 - self.alpha)
-            if self.alternative == "greater":
-                n = norm.cdf((delta - z_alpha) / sqrt(v)) - self.power
-            else:
-                n = norm.cdf((-delta - z_alpha) / sqrt(v)) - self.power
-        return n
+        return _fisher_z_power(n, self.r, self.p, self.rho0, self.alpha, self.alternative) - self.power
 
     def _get_effect_size(self, effect_size: float) -> float:
-        delta = sqrt(self.n - 3 - self.p) * (
-                log((1 + effect_size) / (1 - effect_size)) / 2
-                + effect_size
-                / (self.n - 1 - self.p)
-                / 2
-                * (
-                        1
-                        + (5 + pow(effect_size, 2)) / (self.n - 1 - self.p) / 4
-                        + (
-                                11
-                                + 2 * pow(effect_size, 2)
-                                + 3 * pow(effect_size, 4)) / pow(self.n - 1 - self.p, 2)
-                        / 8
-                )
-                - log((1 + self.rho0) / (1 - self.rho0)) / 2
-                - self.rho0 / (self.n - 1 - self.p) / 2
-        )
-        v = (
-                (self.n - 3 - self.p)
-                / (self.n - 1 - self.p)
-                * (
-                        1
-                        + (4 - pow(effect_size, 2)) / (self.n - 1 - self.p) / 2
-                        + (22 - 6 * pow(effect_size, 2) - 3 * pow(effect_size, 4))
-                        / pow(self.n - 1 - self.p, 2)
-                        / 6
-                )
-        )
-        if self.alternative == "two-sided":
-            z_alpha = norm.ppf(1 - self.alpha / 2)
-            effect_size = norm.cdf((delta - z_alpha) / sqrt(v)) + norm.cdf(
-                (-delta - z_alpha) / sqrt(v)
-            ) - self.power
-        else:
-            z_alpha = norm.ppf(1 - self.alpha)
-            if self.alternative == "greater":
-                effect_size = norm.cdf((delta - z_alpha) / sqrt(v)) - self.power
-            else:
-                effect_size = norm.cdf((-delta - z_alpha) / sqrt(v)) - self.power
-        return effect_size
+        return _fisher_z_power(self.n, effect_size, self.p, self.rho0, self.alpha, self.alternative) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        delta = sqrt(self.n - 3 - self.p) * (
-                log((1 + self.r) / (1 - self.r)) / 2
-                + self.r
-                / (self.n - 1 - self.p)
-                / 2
-                * (
-                        1
-                        + (5 + pow(self.r, 2)) / (self.n - 1 - self.p) / 4
-                        + (
-                                11
-                                + 2 * pow(self.r, 2)
-                                + 3 * pow(self.r, 4)) / pow(self.n - 1 - self.p, 2)
-                        / 8
-                )
-                - log((1 + self.rho0) / (1 - self.rho0)) / 2
-                - self.rho0 / (self.n - 1 - self.p) / 2
-        )
-        v = (
-                (self.n - 3 - self.p)
-                / (self.n - 1 - self.p)
-                * (
-                        1
-                        + (4 - pow(self.r, 2)) / (self.n - 1 - self.p) / 2
-                        + (22 - 6 * pow(self.r, 2) - 3 * pow(self.r, 4))
-                        / pow(self.n - 1 - self.p, 2)
-                        / 6
-                )
-        )
-        if self.alternative == "two-sided":
-            z_alpha = norm.ppf(1 - alpha / 2)
-            alpha = norm.cdf((delta - z_alpha) / sqrt(v)) + norm.cdf(
-                (-delta - z_alpha) / sqrt(v)) - self.power
-        else:
-            z_alpha = norm.ppf(1 - alpha)
-            if self.alternative == "greater":
-                alpha = norm.cdf((delta - z_alpha) / sqrt(v)) - self.power
-            else:
-                alpha = norm.cdf((-delta - z_alpha) / sqrt(v)) - self.power
-        return alpha
+        return _fisher_z_power(self.n, self.r, self.p, self.rho0, alpha, self.alternative) - self.power
 
     def pwr_test(self) -> Dict:
         if self.power is None:
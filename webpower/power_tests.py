@@ -1,4 +1,9 @@
-from typing import Dict, Optional, Union
+import sys
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
 
 from webpower.anova_classes import (
     WpAnovaClass,
@@ -7,12 +12,346 @@ from webpower.anova_classes import (
     WpKAnovaClass,
     WpRMAnovaClass,
 )
-from webpower.proportion_classes import WpOneProp, WpTwoPropOneN, WpTwoPropTwoN
+from webpower.proportion_classes import (
+    WpOneProp,
+    WpTwoPropOneN,
+    WpTwoPropTwoN,
+    _batch_ncp,
+    _batch_power,
+    _batch_scale,
+)
 from webpower.t_test_classes import WpOneT, WpTwoT
 from webpower.regression_classes import WPRegression, WpPoisson, WpLogistic
 from webpower.sem_classes import WPSEMChisq, WPSEMRMSEA
 from webpower.misc_classes import WpMediation, WpCorrelation
 from webpower.randomized_trial_classes import WpMRT2Arm, WpMRT3Arm, WpCRT2Arm, WpCRT3Arm
+from webpower.utils import vec_chandrupatla
+
+_ALTERNATIVES = frozenset(("two-sided", "greater", "less"))
+_TRIAL_ALTERNATIVES = frozenset(("two-sided", "one-sided"))
+# the two-arm multisite trial has always treated "greater" and "less" as one-sided as well
+_MRT2ARM_ALTERNATIVES = _TRIAL_ALTERNATIVES | _ALTERNATIVES
+_RMANOVA_TYPES = frozenset(("between", "within", "interaction"))
+_REGRESSION_TYPES = frozenset(("cohen", "regular"))
+_RMSEA_TYPES = frozenset(("close", "notclose"))
+_MRT2ARM_TYPES = frozenset(("main", "site", "variance"))
+_TRIAL_TYPES = frozenset(("main", "treatment", "omnibus"))
+
+
+def _table_template(*columns: Tuple[str, str, str, int], note: bool = False) -> str:
+    """Partially evaluates the printed table of a power analysis. The header row is rendered once, when the module is
+    imported, so that each call only has to format the row of values
+
+    Parameters
+    ----------
+    columns: tuple
+        The (label, key, format_spec, width) of each column, where key is the field of the results dictionary
+    note: bool, default=False
+        Whether the results carry a note to print beneath the table
+
+    Returns
+    -------
+    A template to fill from the results dictionary with str.format_map. It ends with a newline so that it can be handed
+    straight to sys.stdout.write
+    """
+    header = " ".join(label.rjust(width) for label, _, _, width in columns)
+    row = " ".join(f"{{{key}:>{width}{spec}}}" for _, key, spec, width in columns)
+    template = "{method}\n\n\t" + header + "\n\t" + row + "\n\n"
+    if note:
+        template += "Note: {note}\n"
+    return template + "URL: {url}\n"
+
+
+_ANOVA_TABLE = _table_template(
+    ("k", "k", "", 4),
+    ("n", "n", "", 6),
+    ("f", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_ANOVA_V_TABLE = _table_template(
+    ("k", "k", "", 4),
+    ("n", "n", "", 6),
+    ("V", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_KANOVA_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("ndf", "ndf", "", 4),
+    ("ddf", "ddf", "", 4),
+    ("f", "effect_size", ".4f", 8),
+    ("ng", "ng", "", 4),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_RMANOVA_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("f", "effect_size", ".4f", 8),
+    ("ng", "ng", "", 4),
+    ("nm", "nm", "", 4),
+    ("nscor", "nscor", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_PROP_TABLE = _table_template(
+    ("h", "effect_size", ".4f", 8),
+    ("n", "n", "", 6),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_PROP_TWO_N_TABLE = _table_template(
+    ("h", "effect_size", ".4f", 8),
+    ("n1", "n1", "", 6),
+    ("n2", "n2", "", 6),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_T1_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("d", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_T1_TABLE_NO_NOTE = _table_template(
+    ("n", "n", "", 6),
+    ("d", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+)
+_T2_TABLE = _table_template(
+    ("n1", "n1", "", 6),
+    ("n2", "n2", "", 6),
+    ("d", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    note=True,
+)
+_REGRESSION_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("p1", "p1", "", 3),
+    ("p2", "p2", "", 3),
+    ("f2", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+)
+_POISSON_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    ("exp0", "exp0", ".2f", 6),
+    ("exp1", "exp1", ".2f", 6),
+    ("beta0", "beta0", ".2f", 6),
+    ("beta1", "beta1", ".2f", 6),
+)
+_LOGISTIC_TABLE = _table_template(
+    ("p0", "p0", "", 6),
+    ("p1", "p1", "", 6),
+    ("beta0", "beta0", ".4f", 8),
+    ("beta1", "beta1", ".4f", 8),
+    ("n", "n", "", 6),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+)
+_SEM_CHISQ_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("df", "df", "", 4),
+    ("effect", "effect_size", ".4f", 8),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+)
+_SEM_RMSEA_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("df", "df", "", 4),
+    ("rmsea0", "rmsea0", ".4f", 8),
+    ("rmsea1", "rmsea1", ".4f", 8),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+)
+_MEDIATION_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("power", "power", ".2f", 5),
+    ("a", "a", ".2f", 5),
+    ("b", "b", ".2f", 5),
+    ("var_x", "var_x", ".2f", 5),
+    ("var_m", "var_m", ".2f", 5),
+    ("var_y", "var_y", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+)
+_CORRELATION_TABLE = _table_template(
+    ("n", "n", "", 6),
+    ("r", "effect_size", ".4f", 8),
+    ("alpha", "alpha", ".2f", 5),
+    ("power", "power", ".2f", 5),
+)
+_MRT2ARM_TABLE = _table_template(
+    ("J", "J", "", 4),
+    ("n", "n", "", 6),
+    ("f", "effect_size", ".4f", 8),
+    ("tau00", "tau00", ".2f", 5),
+    ("tau11", "tau11", ".2f", 5),
+    ("sg2", "sg2", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    note=True,
+)
+_MRT2ARM_NO_F_TABLE = _table_template(
+    ("J", "J", "", 4),
+    ("n", "n", "", 6),
+    ("tau00", "tau00", ".2f", 5),
+    ("tau11", "tau11", ".2f", 5),
+    ("sg2", "sg2", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    note=True,
+)
+_MRT3ARM_TABLE = _table_template(
+    ("J", "J", "", 4),
+    ("n", "n", "", 6),
+    ("f1", "f1", ".4f", 8),
+    ("f2", "f2", ".4f", 8),
+    ("tau", "tau", ".2f", 5),
+    ("sg2", "sg2", ".2f", 5),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    note=True,
+)
+_CRT_TABLE = _table_template(
+    ("J", "J", "", 4),
+    ("n", "n", "", 6),
+    ("f", "effect_size", ".4f", 8),
+    ("icc", "icc", ".4f", 8),
+    ("power", "power", ".2f", 5),
+    ("alpha", "alpha", ".2f", 5),
+    note=True,
+)
+
+
+@lru_cache(maxsize=4096)
+def _pwr_test(solver: type, *args) -> Dict:
+    """Memoizes the results of a power analysis so that repeated calls with identical arguments, such as those made when
+    sweeping a power curve, do not repeat the root-finding
+
+    Parameters
+    ----------
+    solver: type
+        The power analysis class, e.g. WpTwoT
+    args: tuple
+        The positional arguments of the class. These must be hashable
+
+    Returns
+    -------
+    The cached results dictionary. Callers must copy it before handing it out
+    """
+    return solver(*args).pwr_test()
+
+
+def _to_records(**columns) -> np.ndarray:
+    """Broadcasts the columns of a batch power analysis against each other and packs them into a structured array
+
+    Parameters
+    ----------
+    columns: array_like
+        The named columns of our results
+
+    Returns
+    -------
+    A structured NumPy array with one float field per column
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(column, dtype=float) for column in columns.values()])
+    records = np.empty(arrays[0].shape, dtype=[(name, float) for name in columns])
+    for name, array in zip(columns, arrays):
+        records[name] = array
+    return records
+
+
+def _count_none(values: tuple) -> int:
+    """Counts the arguments left as None, stopping as soon as more than one has been seen since that is already an
+    error"""
+    count = 0
+    for value in values:
+        if value is None:
+            count += 1
+            if count > 1:
+                break
+    return count
+
+
+def _check_probability(x: Optional[float], name: str) -> None:
+    """Raises if a probability-valued argument, such as alpha or power, is given and falls outside of [0, 1]"""
+    if x is not None and not 0 <= x <= 1:
+        raise ValueError(f"{name} must be between 0 and 1")
+
+
+def _make_validator(names: Tuple[str, ...], probabilities: Tuple[str, ...] = ("alpha", "power")):
+    """Specializes the argument validation shared by the wrappers: exactly one of the arguments must be left as None
+    and the probability-valued ones must lie in [0, 1]. The error messages and field positions are worked out once, when
+    the module is imported
+
+    Parameters
+    ----------
+    names: tuple
+        The names of the arguments, one of which is solved for
+    probabilities: tuple, default=("alpha", "power")
+        The names of the arguments that must lie between 0 and 1
+
+    Returns
+    -------
+    A function taking the tuple of argument values, in the order of names, and raising a ValueError if they are invalid
+    """
+    listed = ", ".join(names[:-1]) + " or " + names[-1]
+    none_message = f"One of {listed} must be None"
+    many_message = f"Only one of {listed} may be None"
+    checks = tuple((names.index(name), name) for name in probabilities)
+
+    def validate(values: tuple) -> None:
+        count = _count_none(values)
+        if count == 0:
+            raise ValueError(none_message)
+        if count > 1:
+            raise ValueError(many_message)
+        for index, name in checks:
+            _check_probability(values[index], name)
+
+    return validate
+
+
+def _check_batch_probability(x: np.ndarray, name: str) -> None:
+    """Raises if any probability of a batch power analysis falls outside of [0, 1]"""
+    if np.any((x < 0) | (x > 1)):
+        raise ValueError(f"{name} must be between 0 and 1")
+
+
+_VALIDATE_ANOVA = _make_validator(("k", "n", "f", "alpha", "power"))
+_VALIDATE_ANOVA_BINARY = _make_validator(("k", "n", "V", "alpha", "power"))
+_VALIDATE_ANOVA_COUNT = _make_validator(("k", "n", "V", "alpha", "power"))
+_VALIDATE_KANOVA = _make_validator(("n", "ndf", "f", "ng", "alpha", "power"))
+_VALIDATE_RMANOVA = _make_validator(("n", "ng", "nm", "f", "alpha", "power"))
+_VALIDATE_ONE_PROP = _make_validator(("h", "n", "alpha", "power"))
+_VALIDATE_TWO_PROP_ONE_N = _make_validator(("h", "n", "alpha", "power"))
+_VALIDATE_TWO_PROP_TWO_N = _make_validator(("h", "n1", "n2", "alpha", "power"))
+_VALIDATE_PROP_BATCH = _make_validator(("h", "n", "power"), probabilities=())
+_VALIDATE_PROP_TWO_N_BATCH = _make_validator(("h", "n1", "n2", "power"), probabilities=())
+_VALIDATE_T1 = _make_validator(("n", "d", "alpha", "power"))
+_VALIDATE_T2 = _make_validator(("n1", "n2", "d", "alpha", "power"))
+_VALIDATE_REGRESSION = _make_validator(("n", "f2", "alpha", "power"))
+_VALIDATE_N_BATCH = _make_validator(("n", "power"), probabilities=())
+_VALIDATE_N2_BATCH = _make_validator(("n2", "power"), probabilities=())
+_VALIDATE_POISSON = _make_validator(("n", "alpha", "power"))
+_VALIDATE_LOGISTIC = _make_validator(("n", "alpha", "power"))
+_VALIDATE_SEM_CHISQ = _make_validator(("n", "df", "effect", "power", "alpha"))
+_VALIDATE_SEM_RMSEA = _make_validator(("n", "df", "rmsea0", "rmsea1", "power", "alpha"))
+_VALIDATE_MEDIATION = _make_validator(("n", "a", "b", "var_x", "var_y", "var_m", "power", "alpha"))
+_VALIDATE_CORRELATION = _make_validator(("n", "r", "power", "alpha"))
+_VALIDATE_MRT3ARM = _make_validator(("n", "f1", "J", "power"), probabilities=("power",))
+_VALIDATE_CRT = _make_validator(("n", "f", "J", "icc", "power", "alpha"), probabilities=("alpha", "power", "icc"))
 
 
 def wp_anova_test(
@@ -55,51 +394,15 @@ def wp_anova_test(
     -----
     Behavior is similar to pyPWR where one of the variables must be left as None and the other ones filled.
     """
-    if not any(v is None for v in [k, n, f, alpha, power]):
-        raise ValueError("One of k, n, f, alpha or power must be None")
-    if sum([v is None for v in [k, n, f, alpha, power]]) > 1:
-        raise ValueError("Only one of k, n, f, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_ANOVA((k, n, f, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     if k is not None and k < 1:
         raise ValueError("k must be a positive integer")
     test_type = test_type.casefold()
-    test = WpAnovaClass(k, n, f, alpha, power, test_type).pwr_test()
+    test = dict(_pwr_test(WpAnovaClass, k, n, f, alpha, power, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["k"])) - 1)
-            + "k"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "f"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['k']}"
-            + " "
-            + f"{test['n']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_ANOVA_TABLE.format_map(test))
     return test
 
 
@@ -134,50 +437,14 @@ def wp_anova_binary_test(
     -------
     A dictionary containing k, n, V, alpha and power
     """
-    if not any(v is None for v in [k, n, V, alpha, power]):
-        raise ValueError("One of k, n, V, alpha or power must be None")
-    if sum([v is None for v in [k, n, V, alpha, power]]) > 1:
-        raise ValueError("Only one of k, n, v, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_ANOVA_BINARY((k, n, V, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     if k is not None and k < 1:
         raise ValueError("k must be a positive integer")
-    test = WpAnovaBinaryClass(k, n, V, alpha, power).pwr_test()
+    test = dict(_pwr_test(WpAnovaBinaryClass, k, n, V, alpha, power))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["k"])) - 1)
-            + "k"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "V"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['k']}"
-            + " "
-            + f"{test['n']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_ANOVA_V_TABLE.format_map(test))
     return test
 
 
@@ -212,50 +479,14 @@ def wp_anova_count_test(
     -------
     A dictionary containing k, n, V, alpha and power
     """
-    if not any(v is None for v in [k, n, V, alpha, power]):
-        raise ValueError("One of k, n, V, alpha or power must be None")
-    if sum([v is None for v in [k, n, V, alpha, power]]) > 1:
-        raise ValueError("Only one of k, n, v, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_ANOVA_COUNT((k, n, V, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     if k is not None and k < 1:
         raise ValueError("k must be a positive integer")
-    test = WpAnovaCountClass(k, n, V, alpha, power).pwr_test()
+    test = dict(_pwr_test(WpAnovaCountClass, k, n, V, alpha, power))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["k"])) - 1)
-            + "k"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "V"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['k']}"
-            + " "
-            + f"{test['n']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_ANOVA_V_TABLE.format_map(test))
     return test
 
 
@@ -291,60 +522,16 @@ def wp_kanova_test(
     -------
     A dictionary containing n, ndf, f, ng, alpha and power
     """
-    if not any(v is None for v in [n, ndf, f, ng, alpha, power]):
-        raise ValueError("One of n, ndf, f, ng, alpha or power must be None")
-    if sum([v is None for v in [n, ndf, f, ng, alpha, power]]) > 1:
-        raise ValueError("Only one of n, ndf, f, ng, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_KANOVA((n, ndf, f, ng, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     if ndf is not None and ndf < 1:
         raise ValueError("ndf must be a positive integer")
     if ng is not None and ng < 1:
         raise ValueError("k must be a positive integer")
-    test = WpKAnovaClass(n, ndf, f, ng, alpha, power).pwr_test()
+    test = dict(_pwr_test(WpKAnovaClass, n, ndf, f, ng, alpha, power))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " " * max(1, len(str(test["ndf"])) - 3)
-            + "ndf"
-            + " " * max(1, len(str(test["ddf"])) - 3)
-            + "ddf"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "f"
-            + " " * max(1, len(str(test["ng"])) - 2)
-            + "ng"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + " \n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * max(len(str(test["ndf"])), 4 - len(str(test["ndf"])))
-            + f"{test['ndf']}"
-            + " " * max(1, 4 - len(str(test["ddf"])))
-            + f"{test['ddf']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * 2
-            + f"{test['ng']}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + "\n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_KANOVA_TABLE.format_map(test))
     return test
 
 
@@ -396,14 +583,7 @@ def wp_rmanova_test(
     -------
     A dictionary containing n, ng, nm, f, alpha and power
     """
-    if not any(v is None for v in [n, ng, nm, f, alpha, power]):
-        raise ValueError("One of n, ng, nm, f, alpha and power must be None")
-    if sum([v is None for v in [n, ng, nm, f, alpha, power]]) > 1:
-        raise ValueError("Only one of n, ng, nm, f, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_RMANOVA((n, ng, nm, f, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     if ng is not None and ng < 1:
@@ -411,48 +591,11 @@ def wp_rmanova_test(
     if nm is not None and nm < 1:
         raise ValueError("nm must be a positive integer")
     test_type = test_type.casefold()
-    if test_type not in ["between", "within", "interaction"]:
+    if test_type not in _RMANOVA_TYPES:
         raise ValueError(f"{test_type} not supported for test_type")
-    test = WpRMAnovaClass(n, ng, nm, f, nscor, alpha, power, test_type).pwr_test()
+    test = dict(_pwr_test(WpRMAnovaClass, n, ng, nm, f, nscor, alpha, power, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "f"
-            + " " * max(1, len(str(test["ng"])) - 1)
-            + "ng"
-            + " " * max(1, len(str(test["nm"])) - 1)
-            + "nm"
-            + " "
-            + "nscor"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * max(1, 3 - len(str(test["ng"])))
-            + f"{test['ng']}"
-            + " " * max(1, 3 - len(str(test["nm"])))
-            + f"{test['nm']}"
-            + " " * (6 - len(str(round(test["nscor"], 2))))
-            + f"{round(test['nscor'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_RMANOVA_TABLE.format_map(test))
     return test
 
 
@@ -488,50 +631,77 @@ def wp_one_prop_test(
     -------
     A dictionary containing h, n, alpha, power and our alternative hypothesis
     """
-    if not any(v is None for v in [h, n, alpha, power]):
-        raise ValueError("One of h, n, alpha and power must be None")
-    if sum([v is None for v in [h, n, alpha, power]]) > 1:
-        raise ValueError("Only one of h, n, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_ONE_PROP((h, n, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     alternative = alternative.casefold()
-    if alternative not in ["two-sided", "greater", "less"]:
+    if alternative not in _ALTERNATIVES:
         raise ValueError(f"{alternative} not supported for alternative")
-    test = WpOneProp(h, n, alpha, power, alternative).pwr_test()
+    test = dict(_pwr_test(WpOneProp, h, n, alpha, power, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(round(test["effect_size"], 4))) - 1)
-            + "h"
-            + " " * len(str(test["n"]))
-            + "n"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{round(test['effect_size'], 4)}"
-            + " "
-            + f"{test['n']}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_PROP_TABLE.format_map(test))
     return test
 
 
+def _prop_test_batch(
+        solver: type,
+        h: Optional[np.ndarray],
+        n: Optional[np.ndarray],
+        alpha: np.ndarray,
+        power: Optional[np.ndarray],
+        alternative: str,
+) -> np.ndarray:
+    """Batch power analysis shared by the one-sample and equal n proportion tests, which only differ in the fraction
+    of n, solver._n_ratio, that enters the noncentrality"""
+    h, n, power = (None if v is None else np.asarray(v, dtype=float) for v in [h, n, power])
+    alpha = np.asarray(alpha, dtype=float)
+    _VALIDATE_PROP_BATCH((h, n, power))
+    _check_batch_probability(alpha, "alpha")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if power is None:
+        power = _batch_power(h * np.sqrt(n * solver._n_ratio), alpha, alternative)
+    else:
+        _check_batch_probability(power, "power")
+        ncp = _batch_ncp(alpha, power, alternative)
+        if h is None:
+            h = ncp / np.sqrt(n * solver._n_ratio)
+        else:
+            n = np.ceil(_batch_scale(ncp, h, alternative) ** 2 / solver._n_ratio)
+    return _to_records(effect_size=h, n=n, alpha=alpha, power=power)
+
+
+def wp_one_prop_test_batch(
+        h: Union[float, np.ndarray, None] = None,
+        n: Union[int, np.ndarray, None] = None,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized one-sample test of proportion. All inputs are broadcast against each other and whichever of h, n and
+    power is None is solved for every element at once, using a single vectorized root search for h and n.
+
+    Parameters
+    ----------
+    h: float or array_like, default=None
+        Effect size of the proportion comparison
+    n: int or array_like, default=None
+        The sample size of the group
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields effect_size, n, alpha and power
+    """
+    return _prop_test_batch(WpOneProp, h, n, alpha, power, alternative)
+
+
 def wp_two_prop_one_n_test(
         h: Optional[float] = None,
         n: Optional[int] = None,
@@ -565,50 +735,48 @@ def wp_two_prop_one_n_test(
     -------
     A dictionary containing h, n, alpha, power and our alternative hypothesis
     """
-    if not any(v is None for v in [h, n, alpha, power]):
-        raise ValueError("One of h, n, alpha and power must be None")
-    if sum([v is None for v in [h, n, alpha, power]]) > 1:
-        raise ValueError("Only one of h, n, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_TWO_PROP_ONE_N((h, n, alpha, power))
     if n is not None and n < 1:
         raise ValueError("n must be a positive integer")
     alternative = alternative.casefold()
-    if alternative not in ["two-sided", "greater", "less"]:
+    if alternative not in _ALTERNATIVES:
         raise ValueError(f"{alternative} not supported for alternative")
-    test = WpTwoPropOneN(h, n, alpha, power, alternative).pwr_test()
+    test = dict(_pwr_test(WpTwoPropOneN, h, n, alpha, power, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(round(test["effect_size"], 4))) - 1)
-            + "h"
-            + " " * len(str(test["n"]))
-            + "n"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{round(test['effect_size'], 4)}"
-            + " "
-            + f"{test['n']}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_PROP_TABLE.format_map(test))
     return test
 
 
+def wp_two_prop_one_n_test_batch(
+        h: Union[float, np.ndarray, None] = None,
+        n: Union[int, np.ndarray, None] = None,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized two-sample test of proportions with equal sample sizes. All inputs are broadcast against each other
+    and whichever of h, n and power is None is solved for every element at once.
+
+    Parameters
+    ----------
+    h: float or array_like, default=None
+        Effect size of the proportion comparison
+    n: int or array_like, default=None
+        The sample size of each group
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields effect_size, n, alpha and power
+    """
+    return _prop_test_batch(WpTwoPropOneN, h, n, alpha, power, alternative)
+
+
 def wp_two_prop_two_n_test(
         h: Optional[float] = None,
         n1: Optional[int] = None,
@@ -645,58 +813,76 @@ def wp_two_prop_two_n_test(
     -------
     A dictionary containing h, n, alpha, power and our alternative hypothesis
     """
-    if not any(v is None for v in [h, n1, n2, alpha, power]):
-        raise ValueError("One of h, n, alpha and power must be None")
-    if sum([v is None for v in [h, n1, n2, alpha, power]]) > 1:
-        raise ValueError("Only one of h, n, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_TWO_PROP_TWO_N((h, n1, n2, alpha, power))
     if n1 is not None and n1 < 2:
         raise ValueError("n1 must be a positive integer greater than 1")
     if n2 is not None and n2 < 2:
         raise ValueError("n2 must be a positive integer greater than 1")
     alternative = alternative.casefold()
-    if alternative not in ["two-sided", "greater", "less"]:
+    if alternative not in _ALTERNATIVES:
         raise ValueError(f"{alternative} not supported for alternative")
-    if alternative.casefold() == "alternative":
-        h = abs(h)
-    test = WpTwoPropTwoN(h, n1, n2, alpha, power, alternative).pwr_test()
+    test = dict(_pwr_test(WpTwoPropTwoN, h, n1, n2, alpha, power, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(round(test["effect_size"], 4))) - 1)
-            + "h"
-            + " " * max(1, (len(str(test["n1"])) - 1))
-            + "n1"
-            + " " * max(1, (len(str(test["n2"])) - 1))
-            + "n2"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{round(test['effect_size'], 4)}"
-            + " " * max(1, 3 - len(str(test["n1"])))
-            + f"{test['n1']}"
-            + " " * max(1, 3 - len(str(test["n2"])))
-            + f"{test['n2']}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_PROP_TWO_N_TABLE.format_map(test))
     return test
 
 
+def wp_two_prop_two_n_test_batch(
+        h: Union[float, np.ndarray, None] = None,
+        n1: Union[int, np.ndarray, None] = None,
+        n2: Union[int, np.ndarray, None] = None,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized two-sample test of proportions with unequal sample sizes. All inputs are broadcast against each other
+    and whichever of h, n1, n2 and power is None is solved for every element at once.
+
+    Parameters
+    ----------
+    h: float or array_like, default=None
+        Effect size of the proportion comparison
+    n1: int or array_like, default=None
+        The sample size of the first group
+    n2: int or array_like, default=None
+        The sample size of the second group
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields effect_size, n1, n2, alpha and power
+    """
+    h, n1, n2, power = (None if v is None else np.asarray(v, dtype=float) for v in [h, n1, n2, power])
+    alpha = np.asarray(alpha, dtype=float)
+    _VALIDATE_PROP_TWO_N_BATCH((h, n1, n2, power))
+    _check_batch_probability(alpha, "alpha")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if power is None:
+        power = _batch_power(h * np.sqrt(n1 * n2 / (n1 + n2)), alpha, alternative)
+    else:
+        _check_batch_probability(power, "power")
+        ncp = _batch_ncp(alpha, power, alternative)
+        if h is None:
+            h = ncp / np.sqrt(n1 * n2 / (n1 + n2))
+        else:
+            # n1 * n2 / (n1 + n2) has to equal the squared scale, which is out of reach once the known group alone is
+            # too small
+            scale2 = _batch_scale(ncp, h, alternative) ** 2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if n1 is None:
+                    n1 = np.ceil(np.where(n2 > scale2, scale2 * n2 / (n2 - scale2), np.nan))
+                else:
+                    n2 = np.ceil(np.where(n1 > scale2, scale2 * n1 / (n1 - scale2), np.nan))
+    return _to_records(effect_size=h, n1=n1, n2=n2, alpha=alpha, power=power)
+
+
 def wp_t1_test(
         n: Optional[int] = None,
         d: Optional[float] = None,
@@ -732,79 +918,76 @@ def wp_t1_test(
     -------
     A dictionary containing n, d, alpha, power and our alternative hypothesis
     """
-    if not any(x is None for x in [n, d, alpha, power]):
-        raise ValueError("One of n, d, alpha or power must be None")
-    if sum([x is None for x in [n, d, alpha, power]]) > 1:
-        raise ValueError("Only one of n, d, alpha or power may be None")
+    _VALIDATE_T1((n, d, alpha, power))
     if n is not None and n < 2:
         raise ValueError("Number of observations must be at least 2")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
     test_type = test_type.casefold()
     if test_type not in ("two-sample", "one-sample", "paired"):
         raise ValueError(f"{test_type} not supported for a t-test")
     alternative = alternative.casefold()
-    if alternative not in ["two-sided", "greater", "less"]:
+    if alternative not in _ALTERNATIVES:
         raise ValueError(f"{alternative} not supported for alternative")
-    test = WpOneT(n, d, alpha, power, test_type, alternative).pwr_test()
+    if n is None and d == 0:
+        raise ValueError("d must be non-zero to solve for n, as the power equals alpha at every sample size")
+    test = dict(_pwr_test(WpOneT, n, d, alpha, power, test_type, alternative))
     if print_pretty:
-        if "note" in test:
-            print(
-                f"{test['method']}"
-                + "\n" * 2
-                + "\t"
-                + " " * len(str(test["n"]))
-                + "n"
-                + " " * (len(str(round(test["effect_size"], 4))) - 1)
-                + "h"
-                + " "
-                + "alpha"
-                + " "
-                + "power"
-                + "\n"
-                + "\t"
-                + f"{test['n']}"
-                + " "
-                + f"{round(test['effect_size'], 4)}"
-                + " " * (6 - len(str(round(test["alpha"], 2))))
-                + f"{round(test['alpha'], 2)}"
-                + " " * (6 - len(str(round(test["power"], 2))))
-                + f"{round(test['power'], 2)}"
-                + " \n" * 2
-                + f"Note: {test['note']}"
-                + "\n"
-                + f"URL: {test['url']}"
-            )
-        else:
-            print(
-                f"{test['method']}"
-                + "\n" * 2
-                + "\t"
-                + " " * (len(str(test["n"])) - 1)
-                + "n"
-                + " " * (len(str(round(test["effect_size"], 4))))
-                + "h"
-                + " "
-                + "alpha"
-                + " "
-                + "power"
-                + "\n"
-                + "\t"
-                + f"{test['n']}"
-                + " "
-                + f"{round(test['effect_size'], 4)}"
-                + " " * (6 - len(str(round(test["alpha"], 2))))
-                + f"{round(test['alpha'], 2)}"
-                + " " * (6 - len(str(round(test["power"], 2))))
-                + f"{round(test['power'], 2)}"
-                + " \n" * 2
-                + f"URL: {test['url']}"
-            )
+        sys.stdout.write((_T1_TABLE if "note" in test else _T1_TABLE_NO_NOTE).format_map(test))
     return test
 
 
+def wp_t1_test_batch(
+        n: Union[int, np.ndarray, None] = None,
+        d: Union[float, np.ndarray] = 0.5,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        test_type: str = "two-sample",
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized power analysis of the one-sample, paired or balanced two-sample t-test, useful for drawing power
+    curves. All inputs are broadcast against each other and either the power is evaluated in a single pass over the
+    non-central t distribution, or, when n is None, the sample size is solved for every element by one vectorized root
+    search.
+
+    Parameters
+    ----------
+    n: int or array_like, default=None
+        If test_type='one-sample', then the sample size of our group; otherwise the sample size of both groups.
+    d: float or array_like, default=0.5
+        Effect size
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    test_type: {'two-sample', 'paired', 'one-sample'}
+        Whether our test is a two-sample test, a paired test or a one-sample test.
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields n, effect_size, alpha and power
+    """
+    _VALIDATE_N_BATCH((n, power))
+    d, alpha = (np.asarray(v, dtype=float) for v in [d, alpha])
+    _check_batch_probability(alpha, "alpha")
+    test_type = test_type.casefold()
+    if test_type not in ("two-sample", "one-sample", "paired"):
+        raise ValueError(f"{test_type} not supported for a t-test")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if power is None:
+        n = np.asarray(n, dtype=float)
+        power = WpOneT(n, d, alpha, None, test_type, alternative)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        if np.any(d == 0):
+            raise ValueError("d must be non-zero to solve for n, as the power equals alpha at every sample size")
+        n = np.ceil(vec_chandrupatla(WpOneT(None, d, alpha, power, test_type, alternative)._get_n, 2 + 1e-10, 1e09))
+    return _to_records(n=n, effect_size=d, alpha=alpha, power=power)
+
+
 def wp_t2_test(
         n1: Optional[int] = None,
         n2: Optional[int] = None,
@@ -840,10 +1023,7 @@ def wp_t2_test(
     -------
     A dictionary containing n1, n2, d, alpha, power and our alternative hypothesis
     """
-    if not any(x is None for x in [n1, n2, d, alpha, power]):
-        raise ValueError("One of n1, n2, d, alpha or power must be None")
-    if sum([x is None for x in [n1, n2, d, alpha, power]]) > 1:
-        raise ValueError("Only one of n1, n2, d, alpha or power may be None")
+    _VALIDATE_T2((n1, n2, d, alpha, power))
     if n1 is not None and n1 < 2:
         raise ValueError(
             "Number of observations for the first group must be at least 2"
@@ -852,49 +1032,69 @@ def wp_t2_test(
         raise ValueError(
             "Number of observations for the second group must be at least 2"
         )
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
     alternative = alternative.casefold()
-    if alternative not in ["two-sided", "greater", "less"]:
+    if alternative not in _ALTERNATIVES:
         raise ValueError(f"{alternative} not supported for alternative")
-    test = WpTwoT(n1, n2, d, alpha, power, alternative).pwr_test()
+    if (n1 is None or n2 is None) and d == 0:
+        raise ValueError("d must be non-zero to solve for n1 or n2, as the power equals alpha at every sample size")
+    test = dict(_pwr_test(WpTwoT, n1, n2, d, alpha, power, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * max(0, (len(str(test["n1"])) - 2))
-            + "n1"
-            + " " * max(1, (len(str(test["n2"])) - 1))
-            + "n2"
-            + " " * (len(str(round(test["effect_size"], 4))))
-            + "d"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['n1']}"
-            + " " * max(1, 3 - len(str(test["n2"])))
-            + f"{test['n2']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " "
-            + " " * (5 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_T2_TABLE.format_map(test))
     return test
 
 
+def wp_t2_test_batch(
+        n1: Union[int, np.ndarray, None] = None,
+        n2: Union[int, np.ndarray, None] = None,
+        d: Union[float, np.ndarray] = 0.5,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized power analysis of the unbalanced two-sample t-test, useful for drawing power curves. All inputs are
+    broadcast against each other and either the power is evaluated in a single pass over the non-central t
+    distribution, or, when n2 is None, the size of the second group is solved for every element by one vectorized root
+    search.
+
+    Parameters
+    ----------
+    n1: int or array_like, default=None
+        Sample size of the first group, which is always required
+    n2: int or array_like, default=None
+        Sample size of the second group
+    d: float or array_like, default=0.5
+        Effect size
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields n1, n2, effect_size, alpha and power
+    """
+    _VALIDATE_N2_BATCH((n2, power))
+    if n1 is None:
+        raise ValueError("n1 must be supplied, only n2 or power can be solved for")
+    n1, d, alpha = (np.asarray(v, dtype=float) for v in [n1, d, alpha])
+    _check_batch_probability(alpha, "alpha")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if power is None:
+        n2 = np.asarray(n2, dtype=float)
+        power = WpTwoT(n1, n2, d, alpha, None, alternative)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        if np.any(d == 0):
+            raise ValueError("d must be non-zero to solve for n2, as the power equals alpha at every sample size")
+        n2 = np.ceil(vec_chandrupatla(WpTwoT(n1, None, d, alpha, power, alternative)._get_n2, 2 + 1e-10, 1e09))
+    return _to_records(n1=n1, n2=n2, effect_size=d, alpha=alpha, power=power)
+
+
 def wp_regression_test(
         n: Optional[int] = None,
         p1: int = 1,
@@ -937,10 +1137,7 @@ def wp_regression_test(
     -------
     A dictionary containing n, p1, p2, f2, alpha and the power of our test
     """
-    if not any(x is None for x in [n, f2, alpha, power]):
-        raise ValueError("One of n, f2, alpha or power must be None")
-    if sum([x is None for x in [n, f2, alpha, power]]) > 1:
-        raise ValueError("Only one of n, f2, alpha or power may be None")
+    _VALIDATE_REGRESSION((n, f2, alpha, power))
     if p1 < p2:
         raise ValueError(
             "Number of predictors in the full model has to be larger than that in the reduced model"
@@ -951,47 +1148,66 @@ def wp_regression_test(
         raise ValueError("Sample size must be at least 5")
     if f2 is not None and f2 < 0:
         raise ValueError("f2 must be positive")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WPRegression(n, p1, p2, f2, alpha, power, test_type).pwr_test()
+    test_type = test_type.casefold()
+    if test_type not in _REGRESSION_TYPES:
+        raise ValueError(f"{test_type} not supported for test_type")
+    test = dict(_pwr_test(WPRegression, n, p1, p2, f2, alpha, power, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * max(0, (len(str(test["n"])) - 1))
-            + "n"
-            + " " * max(1, (len(str(test["p1"])) - 1))
-            + "p1"
-            + " " * max(1, (len(str(test["p2"])) - 1))
-            + "p2"
-            + " " * (len(str(round(test["effect_size"], 4))) - 1)
-            + "f2"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * max(1, 3 - len(str(test["p1"])))
-            + f"{test['p1']}"
-            + " " * max(1, 3 - len(str(test["p2"])))
-            + f"{test['p2']}"
-            + " "
-            + f"{round(test['effect_size'], 4)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_REGRESSION_TABLE.format_map(test))
     return test
 
 
+def wp_regression_test_batch(
+        n: Union[int, np.ndarray, None] = None,
+        p1: Union[int, np.ndarray] = 1,
+        p2: Union[int, np.ndarray] = 0,
+        f2: Union[float, np.ndarray] = 0.1,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        test_type: str = "regular",
+) -> np.ndarray:
+    """Vectorized power analysis for multiple regression, useful for drawing power curves. All inputs are broadcast
+    against each other and either the power is evaluated in a single pass over the non-central F distribution, or, when
+    n is None, the sample size reaching the given power is solved for every element by one vectorized root search.
+
+    Parameters
+    ----------
+    n: int or array_like, default=None
+        Sample size
+    p1: int or array_like, default=1
+        Number of predictors in the full model
+    p2: int or array_like, default=0
+        Number of predictors in the reduced model
+    f2: float or array_like, default=0.1
+        Effect size
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    test_type: {'regular', 'cohen'}
+        Whether to use the non-centrality parameter of Cohen (1988) or the regular one
+
+    Returns
+    -------
+    A structured array with the fields n, p1, p2, effect_size, alpha and power
+    """
+    _VALIDATE_N_BATCH((n, power))
+    p1, p2, f2, alpha = (np.asarray(v, dtype=float) for v in [p1, p2, f2, alpha])
+    _check_batch_probability(alpha, "alpha")
+    test_type = test_type.casefold()
+    if test_type not in _REGRESSION_TYPES:
+        raise ValueError(f"{test_type} not supported for test_type")
+    if power is None:
+        n = np.asarray(n, dtype=float)
+        power = WPRegression(n, p1, p2, f2, alpha, None, test_type)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        solver = WPRegression(None, p1, p2, f2, alpha, power, test_type)
+        n = np.ceil(vec_chandrupatla(solver._get_n, 5 + p1 + 1e-10, 1e05))
+    return _to_records(n=n, p1=p1, p2=p2, effect_size=f2, alpha=alpha, power=power)
+
+
 def wp_poisson_test(
         n: Optional[int] = None,
         exp0: float = 1,
@@ -1037,59 +1253,80 @@ def wp_poisson_test(
     -------
     A dict containing n, alpha and power of our test
     """
-    if not any(x is None for x in [n, alpha, power]):
-        raise ValueError("One of n, alpha or power must be None")
-    if sum([x is None for x in [n, alpha, power]]) > 1:
-        raise ValueError("Only one of n, alpha or power may be None")
+    _VALIDATE_POISSON((n, alpha, power))
     if exp0 <= 0:
         raise ValueError("exp0 cannot be less than or equal to 0")
     if exp1 <= 0:
         raise ValueError("exp1 cannot be less than or equal to 0")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WpPoisson(n, exp0, exp1, alpha, power, alternative, family, parameter).pwr_test()
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if isinstance(parameter, list):
+        parameter = tuple(parameter)
+    test = dict(_pwr_test(WpPoisson, n, exp0, exp1, alpha, power, alternative, family, parameter))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * max(0, (len(str(test["n"])) - 1))
-            + "n"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + " " * max(1, 4 - len(str(round(test["exp0"], 2))))
-            + "exp0"
-            + " " * max(1, 4 - len(str(round(test["exp1"], 2))))
-            + "exp1"
-            + " " * max(1, 5 - len(str(round(test["beta0"], 2))))
-            + "beta0"
-            + " " * max(1, 5 - len(str(round(test["beta1"], 2))))
-            + "beta1"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (5 - len(str(round(test["exp0"], 2))))
-            + f"{round(test['exp0'], 2)}"
-            + " " * (5 - len(str(round(test["exp1"], 2))))
-            + f"{round(test['exp1'], 2)}"
-            + " " * (6 - len(str(round(test["beta0"], 2))))
-            + f"{round(test['beta0'], 2)}"
-            + " " * (6 - len(str(round(test["beta1"], 2))))
-            + f"{round(test['beta1'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_POISSON_TABLE.format_map(test))
     return test
 
 
+def wp_poisson_test_batch(
+        n: Union[int, np.ndarray, None] = None,
+        exp0: float = 1,
+        exp1: float = 0.5,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        alternative: str = "two-sided",
+        family: str = "Bernoulli",
+        parameter: Optional[Union[int, float, list, tuple]] = None,
+) -> np.ndarray:
+    """Vectorized power analysis for Poisson regression, useful for drawing power curves. The moments of the predictor's
+    distribution are computed once and then n or power and alpha are broadcast against each other; when n is None the
+    sample size is solved for every element by one vectorized root search.
+
+    Parameters
+    ----------
+    n: int or array_like, default=None
+        Sample size
+    exp0: float, default=1
+        The base rate under the null hypothesis
+    exp1: float, default=0.5
+        The relative increase of the event rate
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    power: float or array_like, default=None
+        Statistical power
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+    family: {'bernoulli', 'exponential', 'lognormal', 'normal', 'poisson', 'uniform'}
+        Distribution of the predictor
+    parameter: float, int or iterable
+        Corresponding parameter for the predictor's distribution
+
+    Returns
+    -------
+    A structured array with the fields n, alpha and power
+    """
+    _VALIDATE_N_BATCH((n, power))
+    alpha = np.asarray(alpha, dtype=float)
+    _check_batch_probability(alpha, "alpha")
+    if exp0 <= 0:
+        raise ValueError("exp0 cannot be less than or equal to 0")
+    if exp1 <= 0:
+        raise ValueError("exp1 cannot be less than or equal to 0")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if power is None:
+        n = np.asarray(n, dtype=float)
+        power = WpPoisson(n, exp0, exp1, alpha, None, alternative, family, parameter)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        solver = WpPoisson(None, exp0, exp1, alpha, power, alternative, family, parameter)
+        n = np.ceil(vec_chandrupatla(solver._get_n, 2 + 1e-10, 1e07))
+    return _to_records(n=n, alpha=alpha, power=power)
+
+
 def wp_logistic_test(
         n: Optional[int] = None,
         p0: float = 0.5,
@@ -1133,52 +1370,15 @@ def wp_logistic_test(
     -------
     A dict containing n, alpha and the power of our test
     """
-    if not any(x is None for x in [n, alpha, power]):
-        raise ValueError("One of n, alpha or power must be None")
-    if sum([x is None for x in [n, alpha, power]]) > 1:
-        raise ValueError("Only one of n, alpha or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WpLogistic(n, p0, p1, alpha, power, alternative, family, parameter).pwr_test()
+    _VALIDATE_LOGISTIC((n, alpha, power))
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    if isinstance(parameter, list):
+        parameter = tuple(parameter)
+    test = dict(_pwr_test(WpLogistic, n, p0, p1, alpha, power, alternative, family, parameter))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * 2
-            + "p0"
-            + " " * 3
-            + "p1"
-            + " " * max(1, (len(str(round(test['beta0'], 4))) - 4))
-            + "beta0"
-            + " " * max(1, (len(str(round(test['beta1'], 4))) - 4))
-            + "beta1"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{'{0:.2f}'.format(test['p0'])}"
-            + " "
-            + f"{'{0:.2f}'.format(test['p1'])}"
-            + " "
-            + f"{round(test['beta0'], 4)}"
-            + " "
-            + f"{round(test['beta1'], 4)}"
-            + " "
-            + f"{test['n']}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_LOGISTIC_TABLE.format_map(test))
     return test
 
 
@@ -1218,47 +1418,58 @@ def wp_sem_chisq_test(
     -------
     A dictionary containing n, df, effect, power and alpha of our test
     """
-    if not any(x is None for x in [n, df, effect, power, alpha]):
-        raise ValueError("One of n, df, effect, power or alpha must be None")
-    if sum([x is None for x in [n, df, effect, power, alpha]]) > 1:
-        raise ValueError("Only one of n, df, effect, power or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WPSEMChisq(n, df, effect, alpha, power).pwr_test()
+    _VALIDATE_SEM_CHISQ((n, df, effect, power, alpha))
+    if n is None and effect == 0:
+        raise ValueError("effect must be non-zero to solve for n, as the power equals alpha at every sample size")
+    test = dict(_pwr_test(WPSEMChisq, n, df, effect, alpha, power))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " " * max(1, (len(str(test["df"])) - 2))
-            + "df"
-            + " "
-            + "effect"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * (3 - len(str(test["df"])))
-            + f"{test['df']}"
-            + " " * (7 - len(str(round(test["effect_size"], 4))))
-            + f"{round(test['effect_size'], 4)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_SEM_CHISQ_TABLE.format_map(test))
     return test
 
 
+def wp_sem_chisq_test_batch(
+        n: Union[int, np.ndarray, None] = None,
+        df: Union[int, np.ndarray] = 1,
+        effect: Union[float, np.ndarray] = 0.1,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+) -> np.ndarray:
+    """Vectorized power analysis for SEM based on the likelihood ratio test, useful for drawing power curves. All inputs
+    are broadcast against each other and either the power is evaluated in a single pass over the non-central chi-squared
+    distribution, or, when n is None, the sample size is solved for every element by one vectorized root search.
+
+    Parameters
+    ----------
+    n: int or array_like, default=None
+        Sample size
+    df: int or array_like, default=1
+        The degrees of freedom for our test, based on the Chi-Squared Test
+    effect: float or array_like, default=0.1
+        Effect size, the population misfit of the reduced SEM model
+    alpha: float or array_like, default=0.05
+        Significance level chosen for the test
+    power: float or array_like, default=None
+        Statistical power
+
+    Returns
+    -------
+    A structured array with the fields n, df, effect_size, alpha and power
+    """
+    _VALIDATE_N_BATCH((n, power))
+    df, effect, alpha = (np.asarray(v, dtype=float) for v in [df, effect, alpha])
+    _check_batch_probability(alpha, "alpha")
+    if power is None:
+        n = np.asarray(n, dtype=float)
+        power = WPSEMChisq(n, df, effect, alpha, None)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        if np.any(effect == 0):
+            raise ValueError("effect must be non-zero to solve for n, as the power equals alpha at every sample size")
+        n = np.ceil(vec_chandrupatla(WPSEMChisq(None, df, effect, alpha, power)._get_n, 10 + 1e-10, 1e09))
+    return _to_records(n=n, df=df, effect_size=effect, alpha=alpha, power=power)
+
+
 def wp_sem_rmsea_test(
         n: Optional[int] = None,
         df: Optional[int] = None,
@@ -1298,53 +1509,71 @@ def wp_sem_rmsea_test(
     -------
     A dictionary containing n, df, rmsea0, rmsea1, alpha and the power of the test
     """
-    if not any(x is None for x in [n, df, rmsea0, rmsea1, power, alpha]):
-        raise ValueError("One of n, df, rmsea0, rmsea1, power or alpha must be None")
-    if sum([x is None for x in [n, df, rmsea0, rmsea1, power, alpha]]) > 1:
-        raise ValueError("Only one of n, df, rmsea0, rmsea1, power or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    if test_type.casefold() not in ("close", "notclose"):
+    _VALIDATE_SEM_RMSEA((n, df, rmsea0, rmsea1, power, alpha))
+    if test_type.casefold() not in _RMSEA_TYPES:
         raise ValueError(f"{test_type} must be either close or notclose")
-    test = WPSEMRMSEA(n, df, rmsea0, rmsea1, power, alpha, test_type).pwr_test()
+    if n is None and rmsea0 == rmsea1:
+        raise ValueError("rmsea0 and rmsea1 must differ to solve for n, as the power equals alpha at every sample size")
+    test = dict(_pwr_test(WPSEMRMSEA, n, df, rmsea0, rmsea1, power, alpha, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " " * max(1, (len(str(test["df"])) - 2))
-            + "df"
-            + " "
-            + "rmsea0"
-            + " "
-            + "rmsea1"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * (3 - len(str(test["df"])))
-            + f"{test['df']}"
-            + " " * (7 - len(str(round(test["rmsea0"], 4))))
-            + f"{round(test['rmsea0'], 4)}"
-            + " " * (7 - len(str(round(test["rmsea1"], 4))))
-            + f"{round(test['rmsea1'], 4)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_SEM_RMSEA_TABLE.format_map(test))
     return test
 
 
+def wp_sem_rmsea_test_batch(
+        n: Union[int, np.ndarray, None] = None,
+        df: Union[int, np.ndarray] = 1,
+        rmsea0: Union[float, np.ndarray] = 0.0,
+        rmsea1: Union[float, np.ndarray] = 0.05,
+        alpha: Union[float, np.ndarray] = 0.05,
+        power: Union[float, np.ndarray, None] = None,
+        test_type: str = "close",
+) -> np.ndarray:
+    """Vectorized power analysis for SEM based on RMSEA, useful for drawing power curves over n or either RMSEA. All
+    inputs are broadcast against each other and either the power is evaluated in a single pass, or, when n is None, the
+    sample size is solved for every element by one vectorized root search.
+
+    Parameters
+    ----------
+    n: int or array_like, default=None
+        Sample size
+    df: int or array_like, default=1
+        The degrees of freedom for our test, based on the Chi-Squared Test
+    rmsea0: float or array_like, default=0.0
+        The RMSEA for H0
+    rmsea1: float or array_like, default=0.05
+        The RMSEA for H1
+    alpha: float or array_like, default=0.05
+        Significance level chosen for the test
+    power: float or array_like, default=None
+        Statistical power
+    test_type: {'close' , 'notclose'}
+        Close fit or not-close fit
+
+    Returns
+    -------
+    A structured array with the fields n, df, rmsea0, rmsea1, alpha and power
+    """
+    _VALIDATE_N_BATCH((n, power))
+    df, rmsea0, rmsea1, alpha = (np.asarray(v, dtype=float) for v in [df, rmsea0, rmsea1, alpha])
+    _check_batch_probability(alpha, "alpha")
+    if test_type.casefold() not in _RMSEA_TYPES:
+        raise ValueError(f"{test_type} must be either close or notclose")
+    if power is None:
+        n = np.asarray(n, dtype=float)
+        power = WPSEMRMSEA(n, df, rmsea0, rmsea1, None, alpha, test_type)._get_power()
+    else:
+        power = np.asarray(power, dtype=float)
+        _check_batch_probability(power, "power")
+        if np.any(rmsea0 == rmsea1):
+            raise ValueError(
+                "rmsea0 and rmsea1 must differ to solve for n, as the power equals alpha at every sample size"
+            )
+        solver = WPSEMRMSEA(None, df, rmsea0, rmsea1, power, alpha, test_type)
+        n = np.ceil(vec_chandrupatla(solver._get_n, 2 + 1e-10, 1e09))
+    return _to_records(n=n, df=df, rmsea0=rmsea0, rmsea1=rmsea1, alpha=alpha, power=power)
+
+
 def wp_mediation_test(
         n: Optional[int] = None,
         power: Optional[float] = None,
@@ -1387,56 +1616,10 @@ def wp_mediation_test(
     -------
     A dictionary containing n, a, b, var_x, var_y, var_m, alpha and the power of the test
     """
-    if not any(x is None for x in [n, a, b, var_x, var_y, var_m, power, alpha]):
-        raise ValueError("One of n, a, b, var_x, var_y, var_m, power or alpha must be None")
-    if sum([x is None for x in [n, a, b, var_x, var_y, var_m, power, alpha]]) > 1:
-        raise ValueError("Only one of n, a, b, var_x, var_y, var_m, power or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WpMediation(n, power, a, b, var_x, var_y, var_m, alpha).pwr_test()
+    _VALIDATE_MEDIATION((n, a, b, var_x, var_y, var_m, power, alpha))
+    test = dict(_pwr_test(WpMediation, n, power, a, b, var_x, var_y, var_m, alpha))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " "
-            + "power"
-            + " " * (len(str(round(test["a"], 2))))
-            + "a"
-            + " " * (len(str(round(test["b"], 2))))
-            + "b"
-            + " " * max(len(str(round(test["var_x"], 2))) - 6, 1)
-            + "var_x"
-            + " " * max(len(str(round(test["var_m"], 2))) - 6, 1)
-            + "var_m"
-            + " " * max(len(str(round(test["var_y"], 2))) - 6, 1)
-            + "var_y"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " "
-            + f"{round(test['a'], 2)}"
-            + " "
-            + f"{round(test['b'], 2)}"
-            + " " * (6 - len(str(round(test["var_x"], 2))))
-            + f"{round(test['var_x'], 2)}"
-            + " " * (6 - len(str(round(test["var_m"], 2))))
-            + f"{round(test['var_m'], 2)}"
-            + " " * (6 - len(str(round(test["var_y"], 2))))
-            + f"{round(test['var_y'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_MEDIATION_TABLE.format_map(test))
     return test
 
 
@@ -1478,43 +1661,55 @@ def wp_correlation_test(
     -------
     A dictionary containing n, r, power, p, rho0, alpha and the alternative hypothesis of the test
     """
-    if not any(x is None for x in [n, r, power, alpha]):
-        raise ValueError("One of n, r, power or alpha must be None")
-    if sum([x is None for x in [n, r, power, alpha]]) > 1:
-        raise ValueError("Only one of n, r, power or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    test = WpCorrelation(n, r, power, p, rho0, alpha, alternative).pwr_test()
+    _VALIDATE_CORRELATION((n, r, power, alpha))
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    test = dict(_pwr_test(WpCorrelation, n, r, power, p, rho0, alpha, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["n"])) - 1)
-            + "n"
-            + " " * (len(str(round(test["effect_size"], 2))))
-            + "r"
-            + " "
-            + "alpha"
-            + " "
-            + "power"
-            + "\n"
-            + "\t"
-            + f"{test['n']}"
-            + " "
-            + f"{round(test['effect_size'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " \n" * 2
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_CORRELATION_TABLE.format_map(test))
     return test
 
 
+def wp_correlation_test_batch(
+        n: Union[int, np.ndarray],
+        r: Union[float, np.ndarray],
+        p: int = 0,
+        rho0: float = 0.0,
+        alpha: Union[float, np.ndarray] = 0.05,
+        alternative: str = "two-sided",
+) -> np.ndarray:
+    """Vectorized power for correlation, useful for drawing power curves. Fisher's z transformation is evaluated in a
+    single pass with all inputs broadcast against each other.
+
+    Parameters
+    ----------
+    n: int or array_like
+        Sample size
+    r: float or array_like
+        Effect size or correlation
+    p: int, default=0
+        Number of variables to partial out
+    rho0: float, default=0.0
+        Null correlation coefficient
+    alpha: float or array_like, default=0.05
+        Significance level of the test
+    alternative: {'two-sided', 'greater', 'less'}
+        Direction of the alternative hypothesis
+
+    Returns
+    -------
+    A structured array with the fields n, effect_size, alpha and power
+    """
+    n, r, alpha = (np.asarray(v, dtype=float) for v in [n, r, alpha])
+    _check_batch_probability(alpha, "alpha")
+    alternative = alternative.casefold()
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(f"{alternative} not supported for alternative")
+    power = WpCorrelation(n, r, None, p, rho0, alpha, alternative)._get_power()
+    return _to_records(n=n, effect_size=r, alpha=alpha, power=power)
+
+
 def wp_mrt2arm_test(
         n: Optional[int] = None,
         f: Optional[float] = None,
@@ -1572,19 +1767,15 @@ def wp_mrt2arm_test(
     -------
     A dictionary containing n, J, f, power and alpha of our test
     """
-    test = WpMRT2Arm(n, f, J, tau00, tau11, sg2, power, alpha, alternative, test_type).pwr_test()
+    _check_probability(alpha, "alpha")
+    _check_probability(power, "power")
+    if alternative.casefold() not in _MRT2ARM_ALTERNATIVES:
+        raise ValueError("alternative must be `two-sided`, `one-sided`, `greater` or `less`")
+    if test_type.casefold() not in _MRT2ARM_TYPES:
+        raise ValueError("test_type must be `main`, `site` or `variance`")
+    test = dict(_pwr_test(WpMRT2Arm, n, f, J, tau00, tau11, sg2, power, alpha, alternative, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + "\n"
-            + "\t"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write((_MRT2ARM_TABLE if test["effect_size"] is not None else _MRT2ARM_NO_F_TABLE).format_map(test))
     return test
 
 
@@ -1643,14 +1834,8 @@ def wp_mrt3arm_test(
     -------
     A dictionary containing n, r, power, p, rho0, alpha and the alternative hypothesis of the test
     """
-    if not any(x is None for x in [n, f1, J, power]):
-        raise ValueError("One of n, f1, J, or power must be None")
-    if sum([x is None for x in [n, f1, J, power]]) > 1:
-        raise ValueError("Only one of n, f1, J, or power may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_MRT3ARM((n, f1, J, power))
+    _check_probability(alpha, "alpha")
     if f1 is not None and f1 < 0:
         raise ValueError("f1 must be positive")
     if f2 is not None and f2 < 0:
@@ -1663,54 +1848,13 @@ def wp_mrt3arm_test(
         raise ValueError("Variance of treatment main effects across sites must be positive")
     if sg2 < 0:
         raise ValueError("Between-person variation must be a positive number")
-    if alternative.casefold() not in ["two-sided", "one-sided"]:
+    if alternative.casefold() not in _TRIAL_ALTERNATIVES:
         raise ValueError("alternative must be `two-sided` or `one-sided`")
-    if test_type.casefold() not in ["main", "treatment", "omnibus"]:
+    if test_type.casefold() not in _TRIAL_TYPES:
         raise ValueError("test_type must be `main`, `treatment` or `omnibus`")
-    test = WpMRT3Arm(n, f1, f2, J, tau, sg2, power, alpha, alternative, test_type).pwr_test()
+    test = dict(_pwr_test(WpMRT3Arm, n, f1, f2, J, tau, sg2, power, alpha, alternative, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["J"])) - 1)
-            + "J"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * max(1, len(str(round(test["f1"], 2))) - 1)
-            + "f1"
-            + " " * max(1, len(str(round(test["f2"], 2))) - 1)
-            + "f2"
-            + " " * max(1, len(str(round(test["tau"], 2))) - 2)
-            + "tau"
-            + " " * max(1, len(str(round(test["sg2"], 2))) - 2)
-            + "sg2"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['J']}"
-            + " "
-            + f"{test['n']}"
-            + " " * max(3 - len(str(round(test["f1"], 2))), 1)
-            + f"{round(test['f1'], 2)}"
-            + " " * max(3 - len(str(round(test["f2"], 2))), 1)
-            + f"{round(test['f2'], 2)}"
-            + " " * max(4 - len(str(round(test["tau"], 2))), 1)
-            + f"{round(test['tau'], 2)}"
-            + " " * max(4 - len(str(round(test["sg2"], 2))), 1)
-            + f"{round(test['sg2'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_MRT3ARM_TABLE.format_map(test))
     return test
 
 
@@ -1757,58 +1901,16 @@ def wp_crt2arm_test(
     -------
     A dictionary containing n, effect size, J, icc, power and alpha of our test
     """
-    if not any(x is None for x in [n, f, J, icc, power, alpha]):
-        raise ValueError("One of n, f, J, icc, power, or alpha must be None")
-    if sum([x is None for x in [n, f, J, icc, power, alpha]]) > 1:
-        raise ValueError("Only one of n, f, J, icc, power, or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_CRT((n, f, J, icc, power, alpha))
     if n is not None and n < 1:
         raise ValueError("n must be at least 1")
     if J is not None and J < 3:
         raise ValueError("J must be at least 3")
-    if icc is not None and (icc < 0 or icc > 1):
-        raise ValueError("icc must be between 0 and 1")
-    if alternative.casefold() not in ["two-sided", "one-sided"]:
+    if alternative.casefold() not in _TRIAL_ALTERNATIVES:
         raise ValueError("alternative must be one of `two-sided` or `one-sided`")
-    test = WpCRT2Arm(n, f, J, icc, power, alpha, alternative).pwr_test()
+    test = dict(_pwr_test(WpCRT2Arm, n, f, J, icc, power, alpha, alternative))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["J"])) - 1)
-            + "J"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * max(1, len(str(round(test["effect_size"], 2))))
-            + "f"
-            + " " * max(1, len(str(round(test["icc"], 2))) - 2)
-            + "icc"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['J']}"
-            + " "
-            + f"{test['n']}"
-            + " " * max(3 - len(str(round(test["effect_size"], 2))), 1)
-            + f"{round(test['effect_size'], 2)}"
-            + " " * max(3 - len(str(round(test["icc"], 2))), 1)
-            + f"{round(test['icc'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_CRT_TABLE.format_map(test))
     return test
 
 
@@ -1861,58 +1963,16 @@ def wp_crt3arm_test(
     -------
     A dictionary containing n, effect size, J, icc, power and alpha of our test
     """
-    if not any(x is None for x in [n, f, J, icc, power, alpha]):
-        raise ValueError("One of n, f, J, icc, power, or alpha must be None")
-    if sum([x is None for x in [n, f, J, icc, power, alpha]]) > 1:
-        raise ValueError("Only one of n, f, J, icc, power, or alpha may be None")
-    if alpha is not None and (alpha < 0 or alpha > 1):
-        raise ValueError("alpha must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
+    _VALIDATE_CRT((n, f, J, icc, power, alpha))
     if n is not None and n < 1:
         raise ValueError("n must be at least 1")
     if J is not None and J < 3:
         raise ValueError("J must be at least 3")
-    if icc is not None and (icc < 0 or icc > 1):
-        raise ValueError("icc must be between 0 and 1")
-    if alternative.casefold() not in ["two-sided", "one-sided"]:
+    if alternative.casefold() not in _TRIAL_ALTERNATIVES:
         raise ValueError("alternative must be one of `two-sided` or `one-sided`")
-    if test_type.casefold() not in ["main", "treatment", "omnibus"]:
+    if test_type.casefold() not in _TRIAL_TYPES:
         raise ValueError("test_type must be one of `main`, `treatment` or `omnibus`")
-    test = WpCRT3Arm(n, f, J, icc, power, alpha, alternative, test_type).pwr_test()
+    test = dict(_pwr_test(WpCRT3Arm, n, f, J, icc, power, alpha, alternative, test_type))
     if print_pretty:
-        print(
-            f"{test['method']}"
-            + "\n" * 2
-            + "\t"
-            + " " * (len(str(test["J"])) - 1)
-            + "J"
-            + " " * (len(str(test["n"])))
-            + "n"
-            + " " * max(1, len(str(round(test["effect_size"], 2))))
-            + "f"
-            + " " * max(1, len(str(round(test["icc"], 2))) - 2)
-            + "icc"
-            + " "
-            + "power"
-            + " "
-            + "alpha"
-            + "\n"
-            + "\t"
-            + f"{test['J']}"
-            + " "
-            + f"{test['n']}"
-            + " " * max(3 - len(str(round(test["effect_size"], 2))), 1)
-            + f"{round(test['effect_size'], 2)}"
-            + " " * max(3 - len(str(round(test["icc"], 2))), 1)
-            + f"{round(test['icc'], 2)}"
-            + " " * (6 - len(str(round(test["power"], 2))))
-            + f"{round(test['power'], 2)}"
-            + " " * (6 - len(str(round(test["alpha"], 2))))
-            + f"{round(test['alpha'], 2)}"
-            + " \n" * 2
-            + f"Note: {test['note']}"
-            + "\n"
-            + f"URL: {test['url']}"
-        )
+        sys.stdout.write(_CRT_TABLE.format_map(test))
     return test
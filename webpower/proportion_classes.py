@@ -1,105 +1,187 @@
-from math import ceil, sqrt
+from functools import lru_cache
+from math import erfc, exp, fabs, inf, log, sqrt
 from typing import Dict, Optional
 
-from scipy.stats import norm
+import numpy as np
+
 from scipy.optimize import brentq
+from scipy.special import ndtr, ndtri
 
+from webpower.utils import ceil_root, vec_chandrupatla
 
-class WpOneProp:
-    def __init__(
-        self,
-        h: Optional[float],
-        n: Optional[int],
-        alpha: Optional[float],
-        power: Optional[float],
-        alternative: str = "two-sided",
-    ) -> None:
-        self.h = h
-        self.n = n
-        self.alpha = alpha
-        self.power = power
-        self.alternative = alternative.casefold()
-        self.method = "Power for one-sample proportion test"
-        self.note = "NOTE: Sample size for each group"
-        self.url = "http://psychstat.org/prop"
+_SQRT1_2 = 0.7071067811865476
+_INV_SQRT_2PI = 0.3989422804014327
 
-    def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.alpha / 2) - self.h * sqrt(self.n)
-            ) + norm.cdf(norm.ppf(self.alpha / 2) - self.h * sqrt(self.n))
-        elif self.alternative == "greater":
-            power = norm.sf(norm.isf(self.alpha) - self.h * sqrt(self.n))
-        else:
-            power = norm.cdf(norm.ppf(self.alpha) - self.h * sqrt(self.n))
-        return power
 
-    def _get_effect_size(self, h: float) -> float:
-        if self.alternative == "two-sided":
-            h = (
-                norm.sf(norm.isf(self.alpha / 2) - h * sqrt(self.n))
-                + norm.cdf(norm.ppf(self.alpha / 2) - h * sqrt(self.n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            h = norm.sf(norm.isf(self.alpha) - h * sqrt(self.n)) - self.power
-        else:
-            h = norm.cdf(norm.ppf(self.alpha) - h * sqrt(self.n)) - self.power
-        return h
+def _norm_ppf(p: float) -> float:
+    """Quantile function of the standard normal distribution, using Wichura's AS241 rational approximation (the same
+    one behind statistics.NormalDist.inv_cdf), which is accurate to about 1e-16 and avoids scipy.stats' dispatch
+    overhead on every root-finding iteration
 
-    def _get_n(self, n: int) -> float:
-        if self.alternative == "two-sided":
-            n = (
-                norm.sf(norm.isf(self.alpha / 2) - self.h * sqrt(n))
-                + norm.cdf(norm.ppf(self.alpha / 2) - self.h * sqrt(n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = norm.sf(norm.isf(self.alpha) - self.h * sqrt(n)) - self.power
-        else:
-            n = norm.cdf(norm.ppf(self.alpha) - self.h * sqrt(n)) - self.power
-        return n
+    Parameters
+    ----------
+    p: float
+        Lower tail probability
 
-    def _get_alpha(self, alpha: float) -> float:
-        if self.alternative == "two-sided":
-            alpha = (
-                norm.sf(norm.isf(alpha / 2) - self.h * sqrt(self.n))
-                + norm.cdf(norm.ppf(alpha / 2) - self.h * sqrt(self.n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            alpha = norm.sf(norm.isf(alpha) - self.h * sqrt(self.n)) - self.power
-        else:
-            alpha = norm.cdf(norm.ppf(alpha) - self.h * sqrt(self.n)) - self.power
-        return alpha
+    Returns
+    -------
+    The value x such that P(Z <= x) = p, which is -inf at p <= 0 and inf at p >= 1 as with ndtri
+    """
+    if p <= 0.0:
+        return -inf
+    if p >= 1.0:
+        return inf
+    q = p - 0.5
+    if fabs(q) <= 0.425:
+        r = 0.180625 - q * q
+        num = (((((((2.5090809287301226727e+3 * r +
+                     3.3430575583588128105e+4) * r +
+                     6.7265770927008700853e+4) * r +
+                     4.5921953931549871457e+4) * r +
+                     1.3731693765509461125e+4) * r +
+                     1.9715909503065514427e+3) * r +
+                     1.3314166789178437745e+2) * r +
+                     3.3871328727963666080e+0) * q
+        den = (((((((5.2264952788528545610e+3 * r +
+                     2.8729085735721942674e+4) * r +
+                     3.9307895800092710610e+4) * r +
+                     2.1213794301586595867e+4) * r +
+                     5.3941960214247511077e+3) * r +
+                     6.8718700749205790830e+2) * r +
+                     4.2313330701600911252e+1) * r +
+                     1.0)
+        return num / den
+    r = p if q <= 0.0 else 1.0 - p
+    r = sqrt(-log(r))
+    if r <= 5.0:
+        r = r - 1.6
+        num = (((((((7.7454501427834140764e-4 * r +
+                     2.2723844989269184583e-2) * r +
+                     2.4178072517745061177e-1) * r +
+                     1.2704582524523683826e+0) * r +
+                     3.6478483247632045605e+0) * r +
+                     5.7694972214606914055e+0) * r +
+                     4.6303378461565452959e+0) * r +
+                     1.4234371107496835773e+0)
+        den = (((((((1.0507500716444168432e-9 * r +
+                     5.4759380849953449460e-4) * r +
+                     1.5198666563616457197e-2) * r +
+                     1.4810397642748007459e-1) * r +
+                     6.8976733498510000455e-1) * r +
+                     1.6763848301838038494e+0) * r +
+                     2.0531916266377588219e+0) * r +
+                     1.0)
+    else:
+        r = r - 5.0
+        num = (((((((2.0103343992922881327e-7 * r +
+                     2.7115555687434875782e-5) * r +
+                     1.2426609473880784386e-3) * r +
+                     2.6532189526576123093e-2) * r +
+                     2.9656057182850489123e-1) * r +
+                     1.7848265399172913358e+0) * r +
+                     5.4637849111641143699e+0) * r +
+                     6.6579046435011037772e+0)
+        den = (((((((2.0442631033899397856e-15 * r +
+                     1.4215117583164458887e-7) * r +
+                     1.8463183175100546818e-5) * r +
+                     7.8686913114561325910e-4) * r +
+                     1.4875361290850614853e-2) * r +
+                     1.3692988092273580531e-1) * r +
+                     5.9983220655588793769e-1) * r +
+                     1.0)
+    x = num / den
+    return -x if q < 0.0 else x
 
-    def pwr_test(self) -> Dict:
-        if self.power is None:
-            self.power = self._get_power()
-        elif self.h is None:
-            if self.alternative == "two-sided":
-                self.h = brentq(self._get_effect_size, 1e-10, 10)
-            elif self.alternative == "greater":
-                self.h = brentq(self._get_effect_size, -5, 10)
-            else:
-                self.h = brentq(self._get_effect_size, -10, 5)
-        elif self.n is None:
-            self.n = ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
-        else:
-            self.alpha = brentq(self._get_alpha, 1e-10, 1 - 1e-10)
-        return {
-            "effect_size": self.h,
-            "n": self.n,
-            "alpha": self.alpha,
-            "power": self.power,
-            "alternative": self.alternative,
-            "method": self.method,
-            "note": self.note,
-            "url": self.url,
-        }
+
+def _power_two_sided(ncp: float, z: float) -> float:
+    """Power of a two-sided z test, shared by all of the proportion tests since they only differ in how the sample
+    sizes scale the effect size into the noncentrality
+
+    Parameters
+    ----------
+    ncp: float
+        Noncentrality of the test statistic, the effect size times the sample size scale
+    z: float
+        Upper critical value of the test, at alpha / 2 for two-sided tests and alpha otherwise
+
+    Returns
+    -------
+    The power of the test
+    """
+    # the normal tails are written out through erfc, sf(x) = erfc(x / sqrt(2)) / 2, since this is evaluated on every
+    # root-finding iteration and each extra Python call costs more than the arithmetic. Beyond 8 standard deviations a
+    # tail is below 7e-16 and is dropped, which saves an erfc for any reasonably powered design
+    upper = z - ncp
+    lower = z + ncp
+    if lower > 8.0:
+        return 0.5 * erfc(upper * _SQRT1_2)
+    if upper > 8.0:
+        return 0.5 * erfc(lower * _SQRT1_2)
+    return 0.5 * (erfc(upper * _SQRT1_2) + erfc(lower * _SQRT1_2))
+
+
+def _power_greater(ncp: float, z: float) -> float:
+    """Power of an upper-tailed z test, see _power_two_sided"""
+    return 0.5 * erfc((z - ncp) * _SQRT1_2)
+
+
+def _power_less(ncp: float, z: float) -> float:
+    """Power of a lower-tailed z test, see _power_two_sided"""
+    return 0.5 * erfc((z + ncp) * _SQRT1_2)
 
 
-class WpTwoPropOneN:
+# The kernel is picked once per instance so that the residuals do not compare strings on every iteration
+_POWER_KERNELS = {"two-sided": _power_two_sided, "greater": _power_greater, "less": _power_less}
+
+
+def _batch_power(ncp: np.ndarray, alpha: np.ndarray, alternative: str) -> np.ndarray:
+    """NumPy counterpart of the power kernels for the batch API, taking alpha rather than the critical value so that the
+    quantiles are evaluated by ndtri over the whole array"""
+    if alternative == "two-sided":
+        z = -ndtri(alpha / 2)
+        return ndtr(ncp - z) + ndtr(-z - ncp)
+    z = -ndtri(alpha)
+    if alternative == "greater":
+        return ndtr(ncp - z)
+    return ndtr(-z - ncp)
+
+
+def _batch_ncp(alpha: np.ndarray, power: np.ndarray, alternative: str) -> np.ndarray:
+    """Noncentrality at which a batch of proportion tests reaches the given power, found by one vectorized root search
+    since the power only depends on the design through the noncentrality"""
+    low = 0.0 if alternative == "two-sided" else -40.0
+    return vec_chandrupatla(lambda ncp: _batch_power(ncp, alpha, alternative) - power, low, 40.0)
+
+
+def _batch_scale(ncp: np.ndarray, h: np.ndarray, alternative: str) -> np.ndarray:
+    """Sample size scale, sqrt(n) for the one-sample test, giving the noncentrality ncp at effect size h. It is NaN
+    wherever the sign of h cannot reach that noncentrality"""
+    if alternative == "two-sided":
+        h = np.abs(h)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = ncp / h
+    return np.where(scale > 0, scale, np.nan)
+
+
+@lru_cache(maxsize=256)
+def _critical_value(alpha: float, tails: int) -> float:
+    """Upper critical value of a z test, cached since the same few significance levels are used over and over"""
+    return -_norm_ppf(alpha / tails)
+
+
+def _norm_pdf(x: float) -> float:
+    """Density of the standard normal distribution"""
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
+
+
+class WpOneProp:
+    method = "Power for one-sample proportion test"
+    note = "NOTE: Sample size for each group"
+    url = "http://psychstat.org/prop"
+    # Fraction of n that enters the noncentrality of the test
+    _n_ratio = 1.0
+    __slots__ = ("h", "n", "alpha", "power", "alternative", "_kernel", "_tails", "_z", "_scale")
+
     def __init__(
         self,
         h: Optional[float],
@@ -113,72 +195,78 @@ class WpTwoPropOneN:
         self.alpha = alpha
         self.power = power
         self.alternative = alternative.casefold()
-        self.method = "Power for two-sample proportion (equal n)"
-        self.note = "NOTE: Sample sizes for EACH group"
-        self.url = "http://psychstat.org/prop2p"
+        self._kernel = _POWER_KERNELS.get(self.alternative, _power_less)
+        self._tails = 2 if self.alternative == "two-sided" else 1
+        # alpha and n are fixed through every root-finding iteration unless they are the unknown, so the critical
+        # value and the sample size scale are computed once here
+        self._z = _critical_value(alpha, self._tails) if alpha is not None else None
+        self._scale = sqrt(n * self._n_ratio) if n is not None else None
 
     def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.alpha / 2) - self.h * sqrt(self.n / 2)
-            ) + norm.cdf(norm.ppf(self.alpha / 2) - self.h * sqrt(self.n / 2))
-        elif self.alternative == "greater":
-            power = norm.sf(norm.isf(self.alpha) - self.h * sqrt(self.n / 2))
-        else:
-            power = norm.cdf(norm.ppf(self.alpha) - self.h * sqrt(self.n / 2))
-        return power
+        return self._kernel(self.h * self._scale, self._z)
 
     def _get_effect_size(self, h: float) -> float:
-        if self.alternative == "two-sided":
-            h = (
-                norm.sf(norm.isf(self.alpha / 2) - h * sqrt(self.n / 2))
-                + norm.cdf(norm.ppf(self.alpha / 2) - h * sqrt(self.n / 2))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            h = norm.sf(norm.isf(self.alpha) - h * sqrt(self.n / 2)) - self.power
-        else:
-            h = norm.cdf(norm.ppf(self.alpha) - h * sqrt(self.n / 2)) - self.power
-        return h
+        return self._kernel(h * self._scale, self._z) - self.power
 
     def _get_n(self, n: int) -> float:
-        if self.alternative == "two-sided":
-            n = (
-                norm.sf(norm.isf(self.alpha / 2) - self.h * sqrt(n / 2))
-                + norm.cdf(norm.ppf(self.alpha / 2) - self.h * sqrt(n / 2))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = norm.sf(norm.isf(self.alpha) - self.h * sqrt(n / 2)) - self.power
-        else:
-            n = norm.cdf(norm.ppf(self.alpha) - self.h * sqrt(n / 2)) - self.power
-        return n
+        return self._kernel(self.h * sqrt(n * self._n_ratio), self._z) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
+        return self._kernel(self.h * self._scale, -_norm_ppf(alpha / self._tails)) - self.power
+
+    def _scale_guess(self) -> Optional[float]:
+        """Squared sample size scale from the large-sample formula ((z_alpha + z_beta) / h) ** 2, which ignores the far
+        tail of a two-sided test"""
+        if self.h == 0 or not 0 < self.power < 1:
+            return None
+        shift = self._z + _norm_ppf(self.power)
+        return (shift / self.h) ** 2 if shift > 0 else None
+
+    def _newton_effect_size(self) -> Optional[float]:
+        """Solves for h by Newton's method, starting from the large-sample solution (z_alpha + z_beta) / scale, which is
+        already exact for one-sided tests. Returns None if it does not converge"""
+        if not 0 < self.power < 1:
+            return None
+        z, scale = self._z, self._scale
+        h = (z + _norm_ppf(self.power)) / scale
+        if self.alternative == "less":
+            h = -h
+        for _ in range(20):
+            ncp = h * scale
+            if self.alternative == "two-sided":
+                slope = _norm_pdf(z - ncp) - _norm_pdf(z + ncp)
+            elif self.alternative == "greater":
+                slope = _norm_pdf(z - ncp)
+            else:
+                slope = -_norm_pdf(z + ncp)
+            if slope == 0:
+                return None
+            step = self._get_effect_size(h) / (slope * scale)
+            h -= step
+            if abs(step) < 1e-12:
+                return h
+        return None
+
+    def _solve_effect_size(self) -> float:
         if self.alternative == "two-sided":
-            alpha = (
-                norm.sf(norm.isf(alpha / 2) - self.h * sqrt(self.n / 2))
-                + norm.cdf(norm.ppf(alpha / 2) - self.h * sqrt(self.n / 2))
-                - self.power
-            )
+            low, high = 1e-10, 10
         elif self.alternative == "greater":
-            alpha = norm.sf(norm.isf(alpha) - self.h * sqrt(self.n / 2)) - self.power
+            low, high = -5, 10
         else:
-            alpha = norm.cdf(norm.ppf(alpha) - self.h * sqrt(self.n / 2)) - self.power
-        return alpha
+            low, high = -10, 5
+        h = self._newton_effect_size()
+        if h is not None and low < h < high:
+            return h
+        return brentq(self._get_effect_size, low, high)
 
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
         elif self.h is None:
-            if self.alternative == "two-sided":
-                self.h = brentq(self._get_effect_size, 1e-10, 10)
-            elif self.alternative == "greater":
-                self.h = brentq(self._get_effect_size, -5, 10)
-            else:
-                self.h = brentq(self._get_effect_size, -10, 5)
+            self.h = self._solve_effect_size()
         elif self.n is None:
-            self.n = ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            scale2 = self._scale_guess()
+            self.n = ceil_root(self._get_n, scale2 / self._n_ratio if scale2 is not None else None)
         else:
             self.alpha = brentq(self._get_alpha, 1e-10, 1 - 1e-10)
         return {
@@ -193,7 +281,20 @@ class WpTwoPropOneN:
         }
 
 
-class WpTwoPropTwoN:
+class WpTwoPropOneN(WpOneProp):
+    method = "Power for two-sample proportion (equal n)"
+    note = "NOTE: Sample sizes for EACH group"
+    url = "http://psychstat.org/prop2p"
+    _n_ratio = 0.5
+    __slots__ = ()
+
+
+class WpTwoPropTwoN(WpOneProp):
+    method = "Power for two-sample proportion (unequal n)"
+    note = "NOTE: Sample size for each group"
+    url = "http://psychstat.org/prop2p2n"
+    __slots__ = ("n1", "n2")
+
     def __init__(
         self,
         h: Optional[float],
@@ -209,165 +310,33 @@ class WpTwoPropTwoN:
         self.alpha = alpha
         self.power = power
         self.alternative = alternative.casefold()
-        self.method = "Power for two-sample proportion (unequal n)"
-        self.note = "NOTE: Sample size for each group"
-        self.url = "http://psychstat.org/prop2p2n"
-
-    def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.alpha / 2)
-                - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            ) + norm.cdf(
-                norm.ppf(self.alpha / 2)
-                - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        elif self.alternative == "greater":
-            power = norm.sf(
-                norm.isf(self.alpha)
-                - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        else:
-            power = norm.cdf(
-                norm.ppf(self.alpha)
-                - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        return power
-
-    def _get_effect_size(self, h: float) -> float:
-        if self.alternative == "two-sided":
-            h = (
-                norm.sf(
-                    norm.isf(self.alpha / 2)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.alpha / 2)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            h = (
-                norm.sf(
-                    norm.isf(self.alpha)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            h = (
-                norm.cdf(
-                    norm.ppf(self.alpha)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        return h
+        self._kernel = _POWER_KERNELS.get(self.alternative, _power_less)
+        self._tails = 2 if self.alternative == "two-sided" else 1
+        self._z = _critical_value(alpha, self._tails) if alpha is not None else None
+        self._scale = sqrt(n1 * n2 / (n1 + n2)) if n1 is not None and n2 is not None else None
 
     def _get_n1(self, n1: int) -> float:
-        if self.alternative == "two-sided":
-            n1 = (
-                norm.sf(
-                    norm.isf(self.alpha / 2)
-                    - self.h * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.alpha / 2)
-                    - self.h * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n1 = (
-                norm.sf(
-                    norm.isf(self.alpha) - self.h * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            n1 = (
-                norm.cdf(
-                    norm.ppf(self.alpha) - self.h * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        return n1
+        return self._kernel(self.h * sqrt(n1 * self.n2 / (n1 + self.n2)), self._z) - self.power
 
     def _get_n2(self, n2: int) -> float:
-        if self.alternative == "two-sided":
-            n2 = (
-                norm.sf(
-                    norm.isf(self.alpha / 2)
-                    - self.h * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.alpha / 2)
-                    - self.h * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n2 = (
-                norm.sf(
-                    norm.isf(self.alpha) - self.h * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        else:
-            n2 = (
-                norm.cdf(
-                    norm.ppf(self.alpha) - self.h * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        return n2
+        return self._kernel(self.h * sqrt(self.n1 * n2 / (self.n1 + n2)), self._z) - self.power
 
-    def _get_alpha(self, alpha: float) -> float:
-        if self.alternative == "two-sided":
-            alpha = (
-                norm.sf(
-                    norm.isf(alpha / 2)
-                    - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(alpha / 2)
-                    - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            alpha = (
-                norm.sf(
-                    norm.isf(alpha)
-                    - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            alpha = (
-                norm.cdf(
-                    norm.ppf(alpha)
-                    - self.h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        return alpha
+    def _group_guess(self, other: int) -> Optional[float]:
+        """Approximate size of one group given the size of the other, from n1 * n2 / (n1 + n2) = scale ** 2"""
+        scale2 = self._scale_guess()
+        if scale2 is None or other <= scale2:
+            return None
+        return scale2 * other / (other - scale2)
 
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
         elif self.h is None:
-            if self.alternative == "two-sided":
-                self.h = brentq(self._get_effect_size, 1e-10, 10)
-            elif self.alternative == "greater":
-                self.h = brentq(self._get_effect_size, -5, 10)
-            else:
-                self.h = brentq(self._get_effect_size, -10, 5)
+            self.h = self._solve_effect_size()
         elif self.n1 is None:
-            self.n1 = ceil(brentq(self._get_n1, 2 + 1e-10, 1e09))
+            self.n1 = ceil_root(self._get_n1, self._group_guess(self.n2))
         elif self.n2 is None:
-            self.n2 = ceil(brentq(self._get_n2, 2 + 1e-10, 1e09))
+            self.n2 = ceil_root(self._get_n2, self._group_guess(self.n1))
         else:
             self.alpha = brentq(self._get_alpha, 1e-10, 1 - 1e-10)
         return {
@@ -1,12 +1,87 @@
-from typing import Optional, Dict
-from math import sqrt, ceil
-
-from scipy.stats import t as t_dist, nct, f as f_dist, ncf
-
-from webpower.utils import nuniroot
+from typing import Optional, Dict, Tuple
+
+import numpy as np
+
+from scipy.special import fdtrc, fdtri, nctdtr, stdtrit
+from scipy.stats import ncf
+
+from webpower.utils import nuniroot, nuniroot_ceil
+
+
+def _critical_t(df: float, alpha: float, two_sided: bool) -> float:
+    """Critical value of a t test. The designs below fix df and alpha for most of the unknowns, so this is worked out
+    once per instance rather than on every step of the root finder
+
+    Parameters
+    ----------
+    df: float
+        Degrees of freedom of the test
+    alpha: float
+        Significance level of the test
+    two_sided: bool
+        Whether the alternative hypothesis is two-sided
+
+    Returns
+    -------
+    The critical value of the t test
+    """
+    if two_sided:
+        return stdtrit(df, 1 - alpha / 2)
+    return stdtrit(df, 1 - alpha)
+
+
+def _t_power(df: float, lamda: float, t0: float, two_sided: bool) -> float:
+    """Power of a t test against a noncentral t alternative
+
+    Parameters
+    ----------
+    df: float
+        Degrees of freedom of the test
+    lamda: float
+        Noncentrality parameter
+    t0: float
+        Critical value of the test
+    two_sided: bool
+        Whether the alternative hypothesis is two-sided
+
+    Returns
+    -------
+    The power of the t test
+    """
+    if two_sided:
+        return 1 - nctdtr(df, lamda, t0) + nctdtr(df, lamda, -t0)
+    return 1 - nctdtr(df, lamda, t0)
+
+
+class _PowerSolverMixin:
+    """Shared pwr_test for the randomized trial designs. Subclasses map each quantity that can be solved for, in the
+    order they are checked, to its residual, its search interval and whether the answer is rounded up to an integer.
+    The last one is solved for whenever none of the others is missing. Subclasses also provide _get_power and _result,
+    which builds the returned dictionary"""
+    _solve_ranges: Dict[str, Tuple[str, float, float, bool]] = {}
 
+    def pwr_test(self) -> Dict:
+        if self.power is None:
+            self.power = self._get_power()
+        else:
+            *unknowns, last = self._solve_ranges
+            name = next((unknown for unknown in unknowns if getattr(self, unknown) is None), last)
+            residual, low, high, integer = self._solve_ranges[name]
+            solver = nuniroot_ceil if integer else nuniroot
+            setattr(self, name, solver(getattr(self, residual), low, high, vectorized=True))
+        return self._result()
+
+
+class WpMRT2Arm(_PowerSolverMixin):
+    note = "n is the number of subjects per cluster"
+    method = "Power analysis for Multileve model Multisite randomized trials with 2 arms"
+    url = "http://psychstat.org/mrt2arm"
+    _solve_ranges = {
+        "n": ("_get_n", 3 - 1e-10, 1e06, True),
+        "J": ("_get_J", 1 + 1e-10, 1e3, True),
+        "f": ("_get_f", 1e-07, 1e+07, False),
+    }
 
-class WpMRT2Arm:
     def __init__(self,
                  n: Optional[int] = None,
                  f: Optional[float] = None,
@@ -28,91 +103,64 @@ class WpMRT2Arm:
         self.power = power
         self.alpha = alpha
         self.alternative = alternative.casefold()
+        self._two_sided = self.alternative == "two-sided"
         self.test_type = test_type.casefold()
-        self.note = "n is the number of subjects per cluster"
-        self.method = "Power analysis for Multileve model Multisite randomized trials with 2 arms"
-        self.url = "http://psychstat.org/mrt2arm"
+        # critical values that stay fixed while solving for any unknown other than J or alpha
+        known = J is not None and alpha is not None
+        self._t0 = _critical_t(J - 1, alpha, self._two_sided) if known else None
+        self._f0 = fdtri(J - 1, J * (n - 2), 1 - alpha) if known and n is not None else None
+        self._tau00_sg2 = tau00 / sg2
+        self._tau11_sg2 = tau11 / sg2
+        # the noncentrality is proportional to f, so its multiplier is fixed while solving for f
+        self._f_scale = np.sqrt(J) / np.sqrt(4 / n + self._tau11_sg2) if J is not None and n is not None else None
+        # the test type never changes, so its power formula is picked once
+        self._power_core = {"main": self._main_power, "site": self._site_power}.get(self.test_type,
+                                                                                   self._variance_power)
+
+    def _main_power(self, n: float, J: float, f: float, t0: Optional[float] = None,
+                    f0: Optional[float] = None) -> float:
+        """Power of the test of the treatment main effect at n, J and f. The critical value t0 is worked out from J when
+        it is not supplied"""
+        df = J - 1
+        if t0 is None:
+            t0 = _critical_t(df, self.alpha, self._two_sided)
+        lamda1 = np.sqrt(J) * f / np.sqrt(4 / n + self._tau11_sg2)
+        return _t_power(df, lamda1, t0, self._two_sided)
+
+    def _site_power(self, n: float, J: float, f: float, t0: Optional[float] = None,
+                    f0: Optional[float] = None) -> float:
+        """Power of the test of the variance of the site means at n and J"""
+        return self._variance_component_power(n, J, n * self._tau00_sg2, f0)
+
+    def _variance_power(self, n: float, J: float, f: float, t0: Optional[float] = None,
+                        f0: Optional[float] = None) -> float:
+        """Power of the test of the variance of the treatment effects at n and J"""
+        return self._variance_component_power(n, J, n * self._tau11_sg2 / 4, f0)
+
+    def _variance_component_power(self, n: float, J: float, ratio: float, f0: Optional[float] = None) -> float:
+        """Power of an F test of a variance component, where ratio is the component's variance relative to that of its
+        estimate. The critical value f0 is worked out from n and J when it is not supplied"""
+        df = J - 1
+        df2 = J * (n - 2)
+        if f0 is None:
+            f0 = fdtri(df, df2, 1 - self.alpha)
+        return fdtrc(df, df2, f0 / (ratio + 1))
 
     def _get_power(self) -> float:
-        df = self.J - 1
-        if self.test_type == 'main':
-            lamda1 = sqrt(self.J) * self.f / sqrt(4 / self.n + self.tau11 / self.sg2)
-            if self.alternative == 'two-sided':
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                power = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1)
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                power = nct.sf(t0, df, lamda1)
-        else:
-            df2 = self.J * (self.n - 2)
-            f0 = f_dist.ppf(1 - self.alpha, df, df2)
-            if self.test_type == "site":
-                power = f_dist.sf(f0 / (self.n * self.tau00 / self.sg2 + 1), df, df2)
-            else:
-                power = f_dist.sf(f0 / (self.n * self.tau11 / self.sg2 / 4 + 1), df, df2)
-        return power
+        return self._power_core(self.n, self.J, self.f, self._t0, self._f0)
 
     def _get_n(self, n: int) -> float:
-        df = self.J - 1
-        if self.test_type == 'main':
-            lamda1 = sqrt(self.J) * self.f / sqrt(4 / n + self.tau11 / self.sg2)
-            if self.alternative == 'two-sided':
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                n = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                n = nct.sf(t0, df, lamda1) - self.power
-        else:
-            df2 = self.J * (self.n - 2)
-            f0 = f_dist.ppf(1 - self.alpha, df, df2)
-            if self.test_type == "site":
-                n = f_dist.sf(f0 / (self.n * self.tau00 / self.sg2 + 1), df, df2) - self.power
-            else:
-                n = f_dist.sf(f0 / (self.n * self.tau11 / self.sg2 / 4 + 1), df, df2) - self.power
-        return n
+        return self._power_core(n, self.J, self.f, self._t0) - self.power
 
     def _get_J(self, J: int) -> float:
-        df = J - 1
-        if self.test_type == 'main':
-            lamda1 = sqrt(J) * self.f / sqrt(4 / self.n + self.tau11 / self.sg2)
-            if self.alternative == 'two-sided':
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                J = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                J = nct.sf(t0, df, lamda1) - self.power
-        else:
-            df2 = J * (self.n - 2)
-            f0 = f_dist.ppf(1 - self.alpha, df, df2)
-            if self.test_type == "site":
-                J = f_dist.sf(f0 / (self.n * self.tau00 / self.sg2 + 1), df, df2) - self.power
-            else:
-                J = f_dist.sf(f0 / (self.n * self.tau11 / self.sg2 / 4 + 1), df, df2) - self.power
-        return J
+        return self._power_core(self.n, J, self.f) - self.power
 
     def _get_f(self, f: float) -> float:
-        df = self.J - 1
-        if self.test_type == 'main':
-            lamda1 = sqrt(self.J) * f / sqrt(4 / self.n + self.tau11 / self.sg2)
-            if self.alternative == 'two-sided':
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                f = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                f = nct.sf(t0, df, lamda1) - self.power
-        else:
+        if self.test_type != 'main':
             raise NotImplementedError("f not needed for `site` or `variance` tests")
-        return f
+        return _t_power(self.J - 1, f * self._f_scale, self._t0, self._two_sided) - self.power
 
-    def pwr_test(self) -> Dict:
-        if self.power is None:
-            self.power = self._get_power()
-        elif self.n is None:
-            self.n = ceil(nuniroot(self._get_n, 3 - 1e-10, 1e06))
-        elif self.J is None:
-            self.J = ceil(nuniroot(self._get_J, 1 + 1e-10, 1e3))
-        else:
-            self.f = nuniroot(self._get_f, 1e-07, 1e+07)
+    def _result(self) -> Dict:
         return {
             "J": self.J,
             "n": self.n,
@@ -128,7 +176,16 @@ class WpMRT2Arm:
         }
 
 
-class WpMRT3Arm:
+class WpMRT3Arm(_PowerSolverMixin):
+    note = "n is the number of subjects per cluster"
+    method = "Multisite randomized trials with 3 arms"
+    url = "http://psychstat.org/mrt3arm"
+    _solve_ranges = {
+        "J": ("_get_J", 2 - 1e-10, 1e03, True),
+        "n": ("_get_n", 3 - 1e-10, 1e07, True),
+        "f1": ("_get_f1", 1e-07, 1e07, False),
+    }
+
     def __init__(self,
                  n: Optional[int] = None,
                  f1: Optional[float] = None,
@@ -150,126 +207,72 @@ class WpMRT3Arm:
         self.power = power
         self.alpha = alpha
         self.alternative = alternative.casefold()
+        self._two_sided = self.alternative == "two-sided"
         self.test_type = test_type.casefold()
-        self.note = "n is the number of subjects per cluster"
-        self.method = "Multisite randomized trials with 3 arms"
-        self.url = "http://psychstat.org/mrt3arm"
+        # critical values that stay fixed while solving for any unknown other than J or alpha
+        known = J is not None and alpha is not None
+        self._t0 = _critical_t(J - 1, alpha, self._two_sided) if known else None
+        self._f0 = fdtri(2, 2 * (J - 1), 1 - alpha) if known else None
+        self._tau_sg2 = tau / sg2
+        # the noncentrality is proportional to f1, so its multiplier is fixed while solving for f1, and so is the
+        # contribution of f2 to the omnibus test
+        sized = J is not None and n is not None
+        self._f_scale = np.sqrt(J) / np.sqrt(4.5 / n + 1.5 * self._tau_sg2) if sized else None
+        self._lamda2 = np.sqrt(J) * f2 / np.sqrt(6 / n + 2 * self._tau_sg2) if sized else None
+        # the test type never changes, so its power formula is picked once
+        self._power_core = {"main": self._main_power, "treatment": self._treatment_power}.get(self.test_type,
+                                                                                              self._omnibus_power)
+
+    def _main_power(self, n: float, J: float, f1: float, t0: Optional[float] = None,
+                    f0: Optional[float] = None) -> float:
+        """Power of the test of the treatment main effect at n, J and f1. The critical value t0 is worked out from J
+        when it is not supplied"""
+        df = J - 1
+        if t0 is None:
+            t0 = _critical_t(df, self.alpha, self._two_sided)
+        lamda1 = np.sqrt(J) * f1 / np.sqrt(4.5 / n + 1.5 * self._tau_sg2)
+        return _t_power(df, lamda1, t0, self._two_sided)
+
+    def _treatment_power(self, n: float, J: float, f1: float, t0: Optional[float] = None,
+                         f0: Optional[float] = None) -> float:
+        """Power of the test comparing the two treatments at n and J. The critical value t0 is worked out from J when
+        it is not supplied"""
+        df = J - 1
+        if t0 is None:
+            t0 = _critical_t(df, self.alpha, self._two_sided)
+        lamda2 = np.sqrt(J) * self.f2 / np.sqrt(6 / n + 2 * self._tau_sg2)
+        return _t_power(df, lamda2, t0, self._two_sided)
+
+    def _omnibus_power(self, n: float, J: float, f1: float, t0: Optional[float] = None,
+                       f0: Optional[float] = None) -> float:
+        """Power of the omnibus test at n, J and f1. The critical value f0 is worked out from J when it is not
+        supplied"""
+        df1 = 2
+        df2 = 2 * (J - 1)
+        if f0 is None:
+            f0 = fdtri(df1, df2, 1 - self.alpha)
+        # both noncentralities scale with sqrt(J), so J factors out of the sum of their squares
+        lamda3 = J * (pow(f1, 2) / (4.5 / n + 1.5 * self._tau_sg2) + pow(self.f2, 2) / (6 / n + 2 * self._tau_sg2))
+        return ncf.sf(f0, df1, df2, lamda3)
 
     def _get_power(self) -> float:
-        df = self.J - 1
-        if self.test_type == "main":
-            lamda1 = sqrt(self.J) * self.f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                power = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1)
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                power = nct.sf(t0, df, lamda1)
-        elif self.test_type == "treatment":
-            lamda2 = sqrt(self.J) * self.f2 / sqrt(6 / self.n + 2 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                power = nct.sf(t0, df, lamda2) + nct.cdf(-t0, df, lamda2)
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                power = nct.sf(t0, df, lamda2)
-        else:
-            df1 = 2
-            df2 = 2 * (self.J - 1)
-            lamda1 = sqrt(self.J) * self.f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            lamda2 = sqrt(self.J) * self.f2 / sqrt(6 / self.n + 2 * self.tau / self.sg2)
-            lamda3 = pow(lamda1, 2) + pow(lamda2, 2)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df2)
-            power = ncf.sf(f0, df1, df2, lamda3)
-        return power
+        return self._power_core(self.n, self.J, self.f1, self._t0, self._f0)
 
     def _get_n(self, n: int) -> float:
-        df = self.J - 1
-        if self.test_type == "main":
-            lamda1 = sqrt(self.J) * self.f1 / sqrt(4.5 / n + 1.5 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                n = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                n = nct.sf(t0, df, lamda1) - self.power
-        elif self.test_type == "treatment":
-            lamda2 = sqrt(self.J) * self.f2 / sqrt(6 / n + 2 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                n = nct.sf(t0, df, lamda2) + nct.cdf(-t0, df, lamda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                n = nct.sf(t0, df, lamda2) - self.power
-        else:
-            df1 = 2
-            df2 = 2 * (self.J - 1)
-            lamda1 = sqrt(self.J) * self.f1 / sqrt(4.5 / n + 1.5 * self.tau / self.sg2)
-            lamda2 = sqrt(self.J) * self.f2 / sqrt(6 / n + 2 * self.tau / self.sg2)
-            lamda3 = pow(lamda1, 2) + pow(lamda2, 2)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df2)
-            n = ncf.sf(f0, df1, df2, lamda3) - self.power
-        return n
+        return self._power_core(n, self.J, self.f1, self._t0, self._f0) - self.power
 
     def _get_f1(self, f1: float) -> float:
-        df = self.J - 1
-        if self.test_type == "main":
-            lamda1 = sqrt(self.J) * f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                f1 = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                f1 = nct.sf(t0, df, lamda1) - self.power
-        elif self.test_type == "treatment":
+        if self.test_type == "treatment":
             raise ValueError("f1 not used if test_type is `treatment`")
-        else:
-            df1 = 2
-            df2 = 2 * (self.J - 1)
-            lamda1 = sqrt(self.J) * f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            lamda2 = sqrt(self.J) * self.f2 / sqrt(6 / self.n + 2 * self.tau / self.sg2)
-            lamda3 = pow(lamda1, 2) + pow(lamda2, 2)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df2)
-            f1 = ncf.sf(f0, df1, df2, lamda3) - self.power
-        return f1
+        lamda1 = f1 * self._f_scale
+        if self.test_type == "main":
+            return _t_power(self.J - 1, lamda1, self._t0, self._two_sided) - self.power
+        return ncf.sf(self._f0, 2, 2 * (self.J - 1), pow(lamda1, 2) + pow(self._lamda2, 2)) - self.power
 
     def _get_J(self, J: int) -> float:
-        df = J - 1
-        if self.test_type == "main":
-            lamda1 = sqrt(J) * self.f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                J = nct.sf(t0, df, lamda1) + nct.cdf(-t0, df, lamda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                J = nct.sf(t0, df, lamda1) - self.power
-        elif self.test_type == "treatment":
-            lamda2 = sqrt(J) * self.f2 / sqrt(6 / self.n + 2 * self.tau / self.sg2)
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                J = nct.sf(t0, df, lamda2) + nct.cdf(-t0, df, lamda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                J = nct.sf(t0, df, lamda2) - self.power
-        else:
-            df1 = 2
-            df2 = 2 * (J - 1)
-            lamda1 = sqrt(J) * self.f1 / sqrt(4.5 / self.n + 1.5 * self.tau / self.sg2)
-            lamda2 = sqrt(J) * self.f2 / sqrt(6 / self.n + 2 * self.tau / self.sg2)
-            lamda3 = pow(lamda1, 2) + pow(lamda2, 2)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df2)
-            J = ncf.sf(f0, df1, df2, lamda3) - self.power
-        return J
+        return self._power_core(self.n, J, self.f1) - self.power
 
-    def pwr_test(self) -> Dict:
-        if self.power is None:
-            self.power = self._get_power()
-        elif self.J is None:
-            self.J = ceil(nuniroot(self._get_J, 2 - 1e-10, 1e03))
-        elif self.n is None:
-            self.n = ceil(nuniroot(self._get_n, 3 - 1e-10, 1e07))
-        else:
-            self.f1 = nuniroot(self._get_f1, 1e-07, 1e07)
+    def _result(self) -> Dict:
         return {
             "power": self.power,
             "J": self.J,
@@ -285,7 +288,17 @@ class WpMRT3Arm:
         }
 
 
-class WpCRT2Arm:
+class WpCRT2Arm(_PowerSolverMixin):
+    method = "Cluster randomized trials with 2 arms"
+    note = "n is the number of subjects per cluster."
+    url = "http://psychstat.org/crt2arm"
+    _solve_ranges = {
+        "n": ("_get_n", 1, 1e+06, True),
+        "J": ("_get_J", 2 + 1e-10, 1_000, True),
+        "f": ("_get_effect_size", 1e-07, 1e+07, False),
+        "icc": ("_get_icc", 0, 1, False),
+        "alpha": ("_get_alpha", 1e-10, 1 - 1e-10, False),
+    }
 
     def __init__(self,
                  n: Optional[int] = None,
@@ -303,89 +316,42 @@ class WpCRT2Arm:
         self.power = power
         self.alpha = alpha
         self.alternative = alternative.casefold()
-        self.method = "Cluster randomized trials with 2 arms"
-        self.note = "n is the number of subjects per cluster."
-        self.url = "http://psychstat.org/crt2arm"
+        self._two_sided = self.alternative == "two-sided"
+        # critical values that stay fixed while solving for any unknown other than J or alpha
+        known = J is not None and alpha is not None
+        self._t0 = _critical_t(J - 2, alpha, self._two_sided) if known else None
+        # the noncentrality is proportional to f, so its multiplier is fixed while solving for f
+        self._f_scale = np.sqrt(J / (4 * icc + 4 * (1 - icc) / n)) if None not in (n, J, icc) else None
+
+    def _power_core(self, n: float, J: float, f: float, icc: float, alpha: float,
+                    t0: Optional[float] = None) -> float:
+        """Power of the design at n, J, f, icc and alpha. The critical value t0 is worked out from J and alpha when it
+        is not supplied"""
+        df = J - 2
+        if t0 is None:
+            t0 = _critical_t(df, alpha, self._two_sided)
+        lamda = np.sqrt(J * pow(f, 2) / (4 * icc + 4 * (1 - icc) / n))
+        return _t_power(df, lamda, t0, self._two_sided)
 
     def _get_power(self) -> float:
-        df = self.J - 2
-        lamda = sqrt(self.J * pow(self.f, 2) / (4 * self.icc + 4 * (1 - self.icc) / self.n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - self.alpha / 2, df)
-            power = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda)
-        else:
-            z_t = t_dist.ppf(1 - self.alpha, df)
-            power = nct.sf(z_t, df, lamda)
-        return power
+        return self._power_core(self.n, self.J, self.f, self.icc, self.alpha, self._t0)
 
     def _get_effect_size(self, effect_size: float) -> float:
-        df = self.J - 2
-        lamda = sqrt(self.J * pow(effect_size, 2) / (4 * self.icc + 4 * (1 - self.icc) / self.n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - self.alpha / 2, df)
-            effect_size = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda) - self.power
-        else:
-            z_t = t_dist.ppf(1 - self.alpha, df)
-            effect_size = nct.sf(z_t, df, lamda) - self.power
-        return effect_size
+        return _t_power(self.J - 2, effect_size * self._f_scale, self._t0, self._two_sided) - self.power
 
     def _get_n(self, n: int) -> float:
-        df = self.J - 2
-        lamda = sqrt(self.J * pow(self.f, 2) / (4 * self.icc + 4 * (1 - self.icc) / n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - self.alpha / 2, df)
-            n = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda) - self.power
-        else:
-            z_t = t_dist.ppf(1 - self.alpha, df)
-            n = nct.sf(z_t, df, lamda) - self.power
-        return n
+        return self._power_core(n, self.J, self.f, self.icc, self.alpha, self._t0) - self.power
 
     def _get_J(self, J: int) -> float:
-        df = J - 2
-        lamda = sqrt(J * pow(self.f, 2) / (4 * self.icc + 4 * (1 - self.icc) / self.n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - self.alpha / 2, df)
-            J = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda) - self.power
-        else:
-            z_t = t_dist.ppf(1 - self.alpha, df)
-            J = nct.sf(z_t, df, lamda) - self.power
-        return J
+        return self._power_core(self.n, J, self.f, self.icc, self.alpha) - self.power
 
     def _get_icc(self, icc: float) -> float:
-        df = self.J - 2
-        lamda = sqrt(self.J * pow(self.f, 2) / (4 * icc + 4 * (1 - icc) / self.n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - self.alpha / 2, df)
-            icc = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda) - self.power
-        else:
-            z_t = t_dist.ppf(1 - self.alpha, df)
-            icc = nct.sf(z_t, df, lamda) - self.power
-        return icc
+        return self._power_core(self.n, self.J, self.f, icc, self.alpha, self._t0) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        df = self.J - 2
-        lamda = sqrt(self.J * pow(self.f, 2) / (4 * self.icc + 4 * (1 - self.icc) / self.n))
-        if self.alternative == "two-sided":
-            z_t = t_dist.ppf(1 - alpha / 2, df)
-            alpha = nct.sf(z_t, df, lamda) + nct.cdf(-z_t, df, lamda) - self.power
-        else:
-            z_t = t_dist.ppf(1 - alpha, df)
-            alpha = nct.sf(z_t, df, lamda) - self.power
-        return alpha
+        return self._power_core(self.n, self.J, self.f, self.icc, alpha) - self.power
 
-    def pwr_test(self) -> Dict:
-        if self.power is None:
-            self.power = self._get_power()
-        elif self.n is None:
-            self.n = ceil(nuniroot(self._get_n, 1, 1e+06))
-        elif self.J is None:
-            self.J = ceil(nuniroot(self._get_J, 2 + 1e-10, 1_000))
-        elif self.f is None:
-            self.f = nuniroot(self._get_effect_size, 1e-07, 1e+07)
-        elif self.icc is None:
-            self.icc = nuniroot(self._get_icc, 0, 1)
-        else:
-            self.alpha = nuniroot(self._get_alpha, 1e-10, 1 - 1e-10)
+    def _result(self) -> Dict:
         return {
             "J": self.J,
             "n": self.n,
@@ -400,7 +366,17 @@ class WpCRT2Arm:
         }
 
 
-class WpCRT3Arm:
+class WpCRT3Arm(_PowerSolverMixin):
+    note = "n is the number of subjects per cluster."
+    method = "Cluster randomized trials with 3 arms"
+    url = "http://psychstat.org/crt3arm"
+    _solve_ranges = {
+        "f": ("_get_effect_size", 1e-07, 1e+07, False),
+        "n": ("_get_n", 2 + 1e-10, 1e+06, True),
+        "J": ("_get_J", 3 + 1e-10, 1_000, True),
+        "icc": ("_get_icc", 0, 1, False),
+        "alpha": ("_get_alpha", 1e-10, 1 - 1e-10, False),
+    }
 
     def __init__(self,
                  n: Optional[int] = None,
@@ -419,174 +395,72 @@ class WpCRT3Arm:
         self.power = power
         self.alpha = alpha
         self.alternative = alternative.casefold()
+        self._two_sided = self.alternative == "two-sided"
         self.test_type = test_type.casefold()
-        self.note = "n is the number of subjects per cluster."
-        self.method = "Cluster randomized trials with 3 arms"
-        self.url = "http://psychstat.org/crt3arm"
+        # critical values that stay fixed while solving for any unknown other than J or alpha
+        known = J is not None and alpha is not None
+        self._t0 = _critical_t(J - 3, alpha, self._two_sided) if known else None
+        self._f0 = fdtri(2, J - 3, 1 - alpha) if known else None
+        # the noncentrality is proportional to f, so its multiplier is fixed while solving for f
+        multiplier = {"main": 4.5, "treatment": 6}.get(self.test_type, 1)
+        self._f_scale = np.sqrt(J / (multiplier * (icc + (1 - icc) / n))) if None not in (n, J, icc) else None
+        # the test type never changes, so its power formula is picked once
+        self._power_core = {"main": self._main_power, "treatment": self._treatment_power}.get(self.test_type,
+                                                                                              self._omnibus_power)
+
+    def _main_power(self, n: float, J: float, f: float, icc: float, alpha: float, t0: Optional[float] = None,
+                    f0: Optional[float] = None) -> float:
+        """Power of the test of the treatment main effect at n, J, f, icc and alpha. The critical value t0 is worked
+        out from J and alpha when it is not supplied"""
+        df = J - 3
+        if t0 is None:
+            t0 = _critical_t(df, alpha, self._two_sided)
+        lambda1 = np.sqrt(J) * f / np.sqrt(4.5 * (icc + (1 - icc) / n))
+        return _t_power(df, lambda1, t0, self._two_sided)
+
+    def _treatment_power(self, n: float, J: float, f: float, icc: float, alpha: float, t0: Optional[float] = None,
+                         f0: Optional[float] = None) -> float:
+        """Power of the test comparing the two treatments at n, J, f, icc and alpha. The critical value t0 is worked
+        out from J and alpha when it is not supplied"""
+        df = J - 3
+        if t0 is None:
+            t0 = _critical_t(df, alpha, self._two_sided)
+        lambda2 = np.sqrt(J) * f / np.sqrt(6 * (icc + (1 - icc) / n))
+        return _t_power(df, lambda2, t0, self._two_sided)
+
+    def _omnibus_power(self, n: float, J: float, f: float, icc: float, alpha: float, t0: Optional[float] = None,
+                       f0: Optional[float] = None) -> float:
+        """Power of the omnibus test at n, J, f, icc and alpha. The critical value f0 is worked out from J and alpha
+        when it is not supplied"""
+        df = J - 3
+        df1 = 2
+        if f0 is None:
+            f0 = fdtri(df1, df, 1 - alpha)
+        lambda3 = J * pow(f, 2) / (icc + (1 - icc) / n)
+        return ncf.sf(f0, df1, df, lambda3)
 
     def _get_power(self) -> float:
-        df = self.J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(self.J) * self.f / sqrt(4.5 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                power = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1)
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                power = nct.sf(t0, df, lambda1)
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(self.J) * self.f / sqrt(6 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                power = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2)
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                power = nct.sf(t0, df, lambda2)
-        else:
-            df1 = 2
-            lambda3 = self.J * pow(self.f, 2) / (self.icc + (1 - self.icc) / self.n)
-            f0 = f_dist.ppf(1 - self.alpha, df, df1)
-            power = ncf.sf(f0, df1, df, lambda3)
-        return power
+        return self._power_core(self.n, self.J, self.f, self.icc, self.alpha, self._t0, self._f0)
 
     def _get_effect_size(self, effect_size: float) -> float:
-        df = self.J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(self.J) * effect_size/ sqrt(4.5 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                effect_size = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                effect_size = nct.sf(t0, df, lambda1) - self.power
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(self.J) * effect_size / sqrt(6 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                effect_size = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                effect_size = nct.sf(t0, df, lambda2) - self.power
-        else:
-            df1 = 2
-            lambda3 = self.J * pow(effect_size, 2) / (self.icc + (1 - self.icc) / self.n)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df)
-            effect_size = ncf.sf(f0, df1, df, lambda3) - self.power
-        return effect_size
-    
+        lamda = effect_size * self._f_scale
+        if self.test_type == "omnibus":
+            return ncf.sf(self._f0, 2, self.J - 3, pow(lamda, 2)) - self.power
+        return _t_power(self.J - 3, lamda, self._t0, self._two_sided) - self.power
+
     def _get_n(self, n: int) -> float:
-        df = self.J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(self.J) * self.f / sqrt(4.5 * (self.icc + (1 - self.icc) / n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                n = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                n = nct.sf(t0, df, lambda1) - self.power
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(self.J) * self.f / sqrt(6 * (self.icc + (1 - self.icc) / n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                n = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                n = nct.sf(t0, df, lambda2) - self.power
-        else:
-            df1 = 2
-            lambda3 = self.J * pow(self.f, 2) / (self.icc + (1 - self.icc) / n)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df)
-            n = ncf.sf(f0, df1, df, lambda3) - self.power
-        return n
+        return self._power_core(n, self.J, self.f, self.icc, self.alpha, self._t0, self._f0) - self.power
 
     def _get_J(self, J: int) -> float:
-        df = J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(J) * self.f / sqrt(4.5 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                J = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                J = nct.sf(t0, df, lambda1) - self.power
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(J) * self.f / sqrt(6 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                J = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                J = nct.sf(t0, df, lambda2) - self.power
-        else:
-            df1 = 2
-            lambda3 = J * pow(self.f, 2) / (self.icc + (1 - self.icc) / self.n)
-            f0 = f_dist.ppf(1 - self.alpha, df1, df)
-            J = ncf.sf(f0, df1, df, lambda3) - self.power
-        return J
+        return self._power_core(self.n, J, self.f, self.icc, self.alpha) - self.power
 
     def _get_icc(self, icc: float) -> float:
-        df = self.J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(self.J) * self.f / sqrt(4.5 * (icc + (1 - icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                icc = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                icc = nct.sf(t0, df, lambda1) - self.power
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(self.J) * self.f / sqrt(6 * (icc + (1 - icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - self.alpha / 2, df)
-                icc = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - self.alpha, df)
-                icc = nct.sf(t0, df, lambda2) - self.power
-        else:
-            df1 = 2
-            lambda3 = self.J * pow(self.f, 2) / (icc + (1 - icc) / self.n)
-            f0 = f_dist.ppf(1 - self.alpha, df, df1)
-            icc = ncf.sf(f0, df1, df, lambda3) - self.power
-        return icc
+        return self._power_core(self.n, self.J, self.f, icc, self.alpha, self._t0, self._f0) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        df = self.J - 3
-        if self.test_type == "main":
-            lambda1 = sqrt(self.J) * self.f / sqrt(4.5 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - alpha / 2, df)
-                alpha = nct.sf(t0, df, lambda1) + nct.cdf(-t0, df, lambda1) - self.power
-            else:
-                t0 = t_dist.ppf(1 - alpha, df)
-                alpha = nct.sf(t0, df, lambda1) - self.power
-        elif self.test_type == "treatment":
-            lambda2 = sqrt(self.J) * self.f / sqrt(6 * (self.icc + (1 - self.icc) / self.n))
-            if self.alternative == "two-sided":
-                t0 = t_dist.ppf(1 - alpha / 2, df)
-                alpha = nct.sf(t0, df, lambda2) + nct.cdf(-t0, df, lambda2) - self.power
-            else:
-                t0 = t_dist.ppf(1 - alpha, df)
-                alpha = nct.sf(t0, df, lambda2) - self.power
-        else:
-            df1 = 2
-            lambda3 = self.J * pow(self.f, 2) / (self.icc + (1 - self.icc) / self.n)
-            f0 = f_dist.ppf(1 - alpha, df, df1)
-            alpha = ncf.sf(f0, df1, df, lambda3) - self.power
-        return alpha
+        return self._power_core(self.n, self.J, self.f, self.icc, alpha) - self.power
 
-    def pwr_test(self) -> Dict:
-        if self.power is None:
-            self.power = self._get_power()
-        elif self.f is None:
-            self.f = nuniroot(self._get_effect_size, 1e-07, 1e+07)
-        elif self.n is None:
-            self.n = ceil(nuniroot(self._get_n, 2 + 1e-10, 1e+06))
-        elif self.J is None:
-            self.J = ceil(nuniroot(self._get_J, 3 + 1e-10, 1_000))
-        elif self.icc is None:
-            self.icc = nuniroot(self._get_icc, 0, 1)
-        else:
-            self.alpha = nuniroot(self._get_alpha, 1e-10, 1 - 1e-10)
+    def _result(self) -> Dict:
         return {
             "J": self.J,
             "n": self.n,
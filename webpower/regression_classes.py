@@ -1,14 +1,220 @@
 import numpy as np
 
-from math import ceil, log, exp, sqrt
+from functools import lru_cache
+from math import ceil, log, exp, pi, sqrt
 from typing import Dict, Optional, Tuple, Union
 
-from scipy.stats import ncf, f as f_dist, norm, lognorm, poisson, expon
+from scipy.special import expit, fdtri, log_expit, ndtr, ndtri
+from scipy.stats import ncf, poisson
 from scipy.optimize import brentq
-from scipy.integrate import quad
+from scipy.integrate import quad_vec
+
+
+_LOG_SQRT_2PI = log(sqrt(2 * pi))
+
+
+def _normal_logpdf(x: float, mu: float, sigma: float) -> float:
+    """Log density of a normal covariate, written out in plain floats because the quadrature calls it at every node
+    and scipy.stats' per-call dispatch would dominate the integrand"""
+    z = (x - mu) / sigma
+    return -0.5 * z * z - log(sigma) - _LOG_SQRT_2PI
+
+
+def _lognormal_logpdf(x: float, mu: float, sigma: float) -> float:
+    """Log density of a lognormal covariate, in plain floats like _normal_logpdf"""
+    if x <= 0:
+        return -np.inf
+    log_x = log(x)
+    return _normal_logpdf(log_x, mu, sigma) - log_x
+
+
+# switches (s, t) for the lower and upper rejection regions of the Wald test under each alternative
+_WALD_TAILS = {"less": (1, 0), "two-sided": (1, 1), "greater": (0, 1)}
+
+
+def _wald_power(z_alpha: float, shift: float, s: int, t: int) -> float:
+    """Power of the Wald test of a regression coefficient, given the critical value and the standardized shift
+    sqrt(n) * beta1 / sqrt(v1). s and t switch the lower and upper rejection regions on for the alternative"""
+    return s * ndtr(-z_alpha - shift) + t * ndtr(-z_alpha + shift)
+
+
+def _poisson_support(rate: float) -> np.ndarray:
+    """Counts carrying all but a negligible (< 1e-40) share of a Poisson distribution with the given rate, used in place
+    of a fixed 0, ..., 100000 grid so that the work scales with the rate"""
+    return np.arange(0, int(rate + 15 * sqrt(rate)) + 21)
+
+
+def _poisson_moments(beta0: float, beta1: float, log_density, a: float, b: float) -> np.ndarray:
+    """Zeroth, first and second moments of exp(beta0 + beta1 * x) under a covariate density. The three integrands only
+    differ by the prefactor 1, x and x^2, so they are integrated together and share every quadrature node. The density
+    is passed on the log scale so that the exponential mean never overflows far out in the tails"""
+
+    def integrand(x: float) -> np.ndarray:
+        weight = exp(beta0 + beta1 * x + log_density(x))
+        return np.array([weight, x * weight, x * x * weight])
+
+    return quad_vec(integrand, a, b)[0]
+
+
+def _logistic_moments(beta0: float, beta1: float, log_density, a: float, b: float) -> np.ndarray:
+    """Zeroth, first and second moments of p(x) * (1 - p(x)) under a covariate density, followed by the marginal mean
+    of p(x), where p is the logistic response. All four integrals share one adaptive set of quadrature nodes, and the
+    weights are assembled on the log scale so that neither a steep response nor a thin density tail underflows early"""
+
+    def integrand(x: float) -> np.ndarray:
+        z = beta0 + beta1 * x
+        log_prob = log_expit(z) + log_density(x)
+        weight = exp(log_prob + log_expit(-z))
+        return np.array([weight, x * weight, x * x * weight, exp(log_prob)])
+
+    return quad_vec(integrand, a, b, limit=100)[0]
+
+
+@lru_cache(maxsize=1024)
+def _poisson_values(exp0: float, exp1: float, family: str, parameter: Union[float, tuple]) -> float:
+    """Design quantity of the Poisson regression Wald test, beta1 / sqrt(v1), whose product with sqrt(n) is the shift of
+    the test statistic. It only depends on the rates and the covariate distribution, so it is memoized across instances
+    that only differ in n, alpha, power or the alternative"""
+    beta1 = log(exp1)
+    beta0 = log(exp0)
+    if family == "bernoulli":
+        # exp(beta0) and exp(beta0 + beta1) are just the two rates
+        d = (1 - parameter) * exp0 + parameter * exp0 * exp1
+        e = parameter * exp0 * exp1
+        f = e
+    elif family == "exponential":
+        if beta1 >= parameter:
+            raise ValueError(f"exp1 = {exp1} gives a Poisson mean with no finite moments under an exponential "
+                             f"covariate with rate {parameter}; log(exp1) has to be below the rate")
+        d, e, f = _poisson_moments(beta0, beta1, lambda x: log(parameter) - parameter * x, 0, np.inf)
+    elif family == "lognormal":
+        mu = parameter[0]
+        sigma = parameter[1]
+        if beta1 > 0:
+            raise ValueError(f"exp1 = {exp1} gives a Poisson mean with no finite moments under a lognormal covariate; "
+                             f"exp1 cannot exceed 1")
+        d, e, f = _poisson_moments(beta0, beta1, lambda x: _lognormal_logpdf(x, mu, sigma), 0, np.inf)
+    elif family == "normal":
+        mu = parameter[0]
+        sigma = parameter[1]
+        d, e, f = _poisson_moments(beta0, beta1, lambda x: _normal_logpdf(x, mu, sigma), -np.inf, np.inf)
+    elif family == "poisson":
+        # exp(beta1 * x) tilts the Poisson(parameter) pmf into a Poisson(parameter * exp1) one, so the support has to
+        # cover whichever rate is larger, and the weights are built on the log scale so the tilt cannot overflow
+        val_range = _poisson_support(parameter * max(1, exp1))
+        # d, e and f are the zeroth, first and second moments of the same weights, so the weights are built once
+        weights = np.exp(beta0 + beta1 * val_range + poisson.logpmf(val_range, parameter))
+        d = np.sum(weights)
+        e = np.dot(val_range, weights)
+        f = np.dot(np.square(val_range), weights)
+    elif family == "uniform":
+        l = parameter[0]
+        r = parameter[1]
+        d, e, f = _poisson_moments(beta0, beta1, lambda x: -log(r - l), l, r)
+    else:
+        raise ValueError(f"Do not recognize {family} for Poisson Regression")
+    v1 = d / (d * f - e * e)
+    if not np.isfinite(v1):
+        raise ValueError(f"The moments of the {family} covariate do not converge for exp1 = {exp1}")
+    return beta1 / sqrt(v1)
+
+
+@lru_cache(maxsize=1024)
+def _logistic_values(p0: float, p1: float, family: str, parameter: Union[float, tuple]) -> float:
+    """Design quantity of the logistic regression Wald test, laid out like _poisson_values and memoized across
+    instances in the same way"""
+    g = 0
+    odds = (p1 / (1 - p1)) / (p0 / (1 - p0))
+    beta1 = log(odds)
+    beta0 = log(p0 / (1 - p0))
+    if family == "bernoulli":
+        d = parameter * p1 * (1 - p1) + (
+                1 - parameter
+        ) * p0 * (1 - p0)
+        e = parameter * p1 * (1 - p1)
+        v1 = d / (d * e - e * e)
+        mu1 = parameter * p1 + (1 - parameter) * p0
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = parameter * a
+        v0 = b / (a * b - b * b)
+    elif family == "exponential":
+        d, e, f, mu1 = _logistic_moments(
+            beta0, beta1, lambda x: -x / parameter - log(parameter), 0, 100
+        )
+        v1 = d / (d * f - e * e)
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = 2 / (parameter * parameter) * pn * (1 - pn)
+        c = 1 / parameter * pn * (1 - pn)
+        v0 = a / (a * b - c * c)
+    elif family == "lognormal":
+        mu = parameter[0]
+        sigma = parameter[1]
+        d, e, f, mu1 = _logistic_moments(
+            beta0, beta1, lambda x: _lognormal_logpdf(x, mu, sigma), 0, 100
+        )
+        v1 = d / (d * f - e * e)
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = (exp(sigma * sigma) - 1) * exp(2 * mu + sigma * sigma) * pn * (1 - pn)
+        c = exp(mu + 0.5 * sigma * sigma) * pn * (1 - pn)
+        v0 = a / (a * b - c * c)
+    elif family == "normal":
+        mu = parameter[0]
+        sigma = parameter[1]
+        d, e, f, mu1 = _logistic_moments(
+            beta0, beta1, lambda x: _normal_logpdf(x, mu, sigma), -100, 100
+        )
+        v1 = d / (d * f - e * e)
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = (exp(sigma * sigma) - 1) * exp(2 * mu + sigma * sigma) * pn * (1 - pn)
+        c = exp(mu + 0.5 * sigma * sigma) * pn * (1 - pn)
+        v0 = a / (a * b - c * c)
+    elif family == "poisson":
+        val_range = _poisson_support(parameter)
+        # d, e and f are the zeroth, first and second moments of the same weights, so the weights are built once
+        pmf = poisson.pmf(val_range, parameter)
+        z = beta0 + beta1 * val_range
+        prob = expit(z)
+        # 1 - p(x) is taken as expit(-z) so that it keeps full precision where the response saturates at 1
+        weights = expit(-z) * prob * pmf
+        d = np.sum(weights)
+        e = np.dot(val_range, weights)
+        f = np.dot(np.square(val_range), weights)
+        v1 = d / (d * f - e * e)
+        mu1 = np.dot(prob, pmf)
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = parameter * pn * (1 - pn)
+        c = parameter * pn * (1 - pn)
+        v0 = a / (a * b - c * c)
+    elif family == "uniform":
+        L = parameter[0]
+        R = parameter[1]
+        d, e, f, mu1 = _logistic_moments(beta0, beta1, lambda x: -log(R - L), L, R)
+        v1 = d / (d * f - e * e)
+        i00 = log(mu1 / (1 - mu1))
+        pn = 1 / (1 + exp(-i00))
+        a = pn * (1 - pn)
+        b = (R - L) * (R - L) / 12 * pn * (1 - pn)
+        c = (R - L) * (R - L) * pn * (1 - pn)
+        v0 = a / (a * b - c * c)
+    else:
+        raise ValueError(f"Do not recognize {family} for Logistic Regression")
+    return beta1 / sqrt(g * v0 + (1 - g) * v1)
 
 
 class WPRegression:
+    method = "Power for multiple regression"
+    url = "http://psychstat.org/regression"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -26,8 +232,6 @@ class WPRegression:
         self.alpha = alpha
         self.power = power
         self.test_type = test_type.casefold()
-        self.method = "Power for multiple regression"
-        self.url = "http://psychstat.org/regression"
         self.u = p1 - p2
 
     def _get_power(self) -> float:
@@ -36,7 +240,7 @@ class WPRegression:
             lambda_ = self.f2 * (self.u + v + 1)
         else:
             lambda_ = self.f2 * self.n
-        power = ncf.sf(f_dist.isf(self.alpha, self.u, v), self.u, v, lambda_)
+        power = ncf.sf(fdtri(self.u, v, 1 - self.alpha), self.u, v, lambda_)
         return power
 
     def _get_effect_size(self, f2: float) -> float:
@@ -45,7 +249,7 @@ class WPRegression:
             lambda_ = f2 * (self.u + v + 1)
         else:
             lambda_ = f2 * self.n
-        f2 = ncf.sf(f_dist.isf(self.alpha, self.u, v), self.u, v, lambda_) - self.power
+        f2 = ncf.sf(fdtri(self.u, v, 1 - self.alpha), self.u, v, lambda_) - self.power
         return f2
 
     def _get_n(self, n: int) -> float:
@@ -54,7 +258,7 @@ class WPRegression:
             lambda_ = self.f2 * (self.u + v + 1)
         else:
             lambda_ = self.f2 * n
-        n = ncf.sf(f_dist.isf(self.alpha, self.u, v), self.u, v, lambda_) - self.power
+        n = ncf.sf(fdtri(self.u, v, 1 - self.alpha), self.u, v, lambda_) - self.power
         return n
 
     def _get_alpha(self, alpha: float) -> float:
@@ -63,7 +267,7 @@ class WPRegression:
             lambda_ = self.f2 * (self.u + v + 1)
         else:
             lambda_ = self.f2 * self.n
-        alpha = ncf.sf(f_dist.isf(alpha, self.u, v), self.u, v, lambda_) - self.power
+        alpha = ncf.sf(fdtri(self.u, v, 1 - alpha), self.u, v, lambda_) - self.power
         return alpha
 
     def pwr_test(self) -> Dict:
@@ -88,6 +292,9 @@ class WPRegression:
 
 
 class WpPoisson:
+    method = "Power for Poisson regression"
+    url = "http://psychstat.org/poisson"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -102,12 +309,15 @@ class WpPoisson:
         self.n = n
         self.exp0 = exp0
         self.exp1 = exp1
+        self.beta0 = log(exp0)
+        self.beta1 = log(exp1)
         if alpha is not None:
             self.alpha = alpha / 2 if alternative.casefold() == "two-sided" else alpha
         else:
             self.alpha = alpha
         self.power = power
         self.alternative = alternative.casefold()
+        self._tails = _WALD_TAILS.get(self.alternative, (0, 1))
         self.family = family.casefold()
         if parameter is None:
             if self.family == "bernoulli":
@@ -120,131 +330,30 @@ class WpPoisson:
                 raise ValueError(f"Do not recognize {family} for Poisson Regression")
         else:
             self.parameter = parameter
-        self.method = "Power for Poisson regression"
-        self.url = "http://psychstat.org/poisson"
+        # the design quantities only depend on the covariate distribution, so they are computed once and reused by
+        # every step of the root finder, and shared with other instances through a cache keyed on a hashable parameter
+        self._parameter_key = self.parameter if isinstance(self.parameter, (int, float)) else tuple(self.parameter)
+        self._values = None
 
     def _get_values(self) -> Tuple:
-        beta1 = log(self.exp1)
-        beta0 = log(self.exp0)
-        if self.family == "bernoulli":
-            d = (1 - self.parameter) * exp(beta0) + self.parameter * exp(beta0 + beta1)
-            e = self.parameter * exp(beta0 + beta1)
-            f = e
-        elif self.family == "exponential":
-            d = quad(
-                lambda x: exp(beta0 + (beta1 - self.parameter) * x) * self.parameter,
-                0,
-                np.inf,
-            )[0]
-            e = quad(
-                lambda x: x
-                          * exp(beta0 + (beta1 - self.parameter) * x)
-                          * self.parameter,
-                0,
-                np.inf,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * exp(beta0 + (beta1 - self.parameter) * x)
-                          * self.parameter,
-                0,
-                np.inf,
-            )[0]
-        elif self.family == "lognormal":
-            mu = self.parameter[0]
-            sigma = self.parameter[1]
-            d = quad(
-                lambda x: exp(beta0 + beta1 * x) * lognorm.pdf(x, sigma, 0, exp(mu)), 0, np.inf
-            )[0]
-            e = quad(
-                lambda x: x * exp(beta0 + beta1 * x) * lognorm.pdf(x, sigma, 0, exp(mu)),
-                0,
-                np.inf,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * exp(beta0 + beta1 * x)
-                          * lognorm.pdf(x, sigma, 0, exp(mu)),
-                0,
-                np.inf,
-            )[0]
-        elif self.family == "normal":
-            mu = self.parameter[0]
-            sigma = self.parameter[1]
-            d = quad(
-                lambda x: exp(beta0 + beta1 * x) * norm.pdf(x, mu, sigma),
-                -np.inf,
-                np.inf,
-            )[0]
-            e = quad(
-                lambda x: x * exp(beta0 + beta1 * x) * norm.pdf(x, mu, sigma),
-                -np.inf,
-                np.inf,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2) * exp(beta0 + beta1 * x) * norm.pdf(x, mu, sigma),
-                -np.inf,
-                np.inf,
-            )[0]
-        elif self.family == "poisson":
-            val_range = np.arange(0, int(1e05) + 1)
-            d = np.sum(
-                np.exp(beta0 + beta1 * val_range)
-                * poisson.pmf(val_range, self.parameter)
-            )
-            e = np.sum(
-                val_range
-                * np.exp(beta0 + beta1 * val_range)
-                * poisson.pmf(val_range, self.parameter)
-            )
-            f = np.sum(
-                np.square(val_range)
-                * np.exp(beta0 + beta1 * val_range)
-                * poisson.pmf(val_range, self.parameter)
-            )
-        elif self.family == "uniform":
-            l = self.parameter[0]
-            r = self.parameter[1]
-            d = quad(lambda x: exp(beta0 + beta1 * x) / (r - l), l, r)[0]
-            e = quad(lambda x: x * exp(beta0 + beta1 * x) / (r - l), l, r)[0]
-            f = quad(lambda x: pow(x, 2) * exp(beta0 + beta1 * x) / (r - l), l, r)[0]
-        else:
-            raise ValueError(f"Do not recognize {self.family} for Poisson Regression")
-        v1 = d / (d * f - pow(e, 2))
-        if self.alternative == "less":
-            s = 1
-            t = 0
-        elif self.alternative == "two-sided":
-            s = 1
-            t = 1
-        else:
-            s = 0
-            t = 1
-        return s, t, v1, beta1
+        if self._values is None:
+            scale = _poisson_values(self.exp0, self.exp1, self.family, self._parameter_key)
+            self._values = self._tails + (scale,)
+        return self._values
 
     def _get_power(self) -> float:
-        s, t, v1, beta1 = self._get_values()
-        power = s * norm.cdf(
-            -norm.ppf(1 - self.alpha) - sqrt(self.n) / sqrt(v1) * beta1
-        ) + t * norm.cdf(-norm.ppf(1 - self.alpha) + sqrt(self.n) / sqrt(v1) * beta1)
+        s, t, scale = self._get_values()
+        power = _wald_power(ndtri(1 - self.alpha), np.sqrt(self.n) * scale, s, t)
         return power
 
     def _get_n(self, n: int) -> float:
-        s, t, v1, beta1 = self._get_values()
-        n = (
-                s * norm.cdf(-norm.ppf(1 - self.alpha) - sqrt(n) / sqrt(v1) * beta1)
-                + t * norm.cdf(-norm.ppf(1 - self.alpha) + sqrt(n) / sqrt(v1) * beta1)
-                - self.power
-        )
+        s, t, scale = self._get_values()
+        n = _wald_power(ndtri(1 - self.alpha), np.sqrt(n) * scale, s, t) - self.power
         return n
 
     def _get_alpha(self, alpha: float) -> float:
-        s, t, v1, beta1 = self._get_values()
-        alpha = (
-                s * norm.cdf(-norm.ppf(1 - alpha) - sqrt(self.n) / sqrt(v1) * beta1)
-                + t * norm.cdf(-norm.ppf(1 - alpha) + sqrt(self.n) / sqrt(v1) * beta1)
-                - self.power
-        )
+        s, t, scale = self._get_values()
+        alpha = _wald_power(ndtri(1 - alpha), sqrt(self.n) * scale, s, t) - self.power
         return alpha
 
     def pwr_test(self) -> Dict:
@@ -260,14 +369,17 @@ class WpPoisson:
             "alpha": self.alpha,
             "exp0": self.exp0,
             "exp1": self.exp1,
-            "beta0": log(self.exp0),
-            "beta1": log(self.exp1),
+            "beta0": self.beta0,
+            "beta1": self.beta1,
             "method": self.method,
             "url": self.url,
         }
 
 
 class WpLogistic:
+    method = "Power for Logistic regression"
+    url = "http://psychstat.org/logistic"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -286,12 +398,15 @@ class WpLogistic:
         if abs(p1) > 1:
             raise ValueError("p1 must be a float between 0 and 1")
         self.p1 = p1
+        self.beta0 = log(p0 / (1 - p0))
+        self.beta1 = log((p1 / (1 - p1)) / (p0 / (1 - p0)))
         if alpha is not None:
             self.alpha = alpha / 2 if alternative.casefold() == "two-sided" else alpha
         else:
             self.alpha = alpha
         self.power = power
         self.alternative = alternative.casefold()
+        self._tails = _WALD_TAILS.get(self.alternative, (0, 1))
         self.family = family.casefold()
 
         if parameter is None:
@@ -305,283 +420,30 @@ class WpLogistic:
                 raise ValueError(f"Do not recognize {family} for Poisson Regression")
         else:
             self.parameter = parameter
-        self.method = "Power for Logistic regression"
-        self.url = "http://psychstat.org/logistic"
+        # the design quantities only depend on the covariate distribution, so they are computed once and reused by
+        # every step of the root finder, and shared with other instances through a cache keyed on a hashable parameter
+        self._parameter_key = self.parameter if isinstance(self.parameter, (int, float)) else tuple(self.parameter)
+        self._values = None
 
     def _get_values(self) -> Tuple:
-        g = 0
-        odds = (self.p1 / (1 - self.p1)) / (self.p0 / (1 - self.p0))
-        self.beta1 = log(odds)
-        self.beta0 = log(self.p0 / (1 - self.p0))
-        if self.family == "bernoulli":
-            d = self.parameter * self.p1 * (1 - self.p1) + (
-                    1 - self.parameter
-            ) * self.p0 * (1 - self.p0)
-            e = self.parameter * self.p1 * (1 - self.p1)
-            v1 = d / (d * e - pow(e, 2))
-            mu1 = self.parameter * self.p1 + (1 - self.parameter) * self.p0
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = self.parameter * a
-            v0 = b / (a * b - pow(b, 2))
-        elif self.family == "exponential":
-            d = quad(
-                lambda x: (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * expon.pdf(x, scale=self.parameter),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            e = quad(
-                lambda x: x
-                          * (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * expon.pdf(x, scale=self.parameter),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * expon.pdf(x, scale=self.parameter),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            v1 = d / (d * f - pow(e, 2))
-            mu1 = quad(
-                lambda x: 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * expon.pdf(x, scale=self.parameter),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = 2 * pow(self.parameter, -2) * pn * (1 - pn)
-            c = pow(self.parameter, -1) * pn * (1 - pn)
-            v0 = a / (a * b - pow(c, 2))
-        elif self.family == "lognormal":
-            mu = self.parameter[0]
-            sigma = self.parameter[1]
-            d = quad(
-                lambda x: (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * lognorm.pdf(x, sigma, scale=exp(mu)),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            e = quad(
-                lambda x: x
-                          * (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * lognorm.pdf(x, sigma, scale=exp(mu)),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * lognorm.pdf(x, sigma, scale=exp(mu)),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            v1 = d / (d * f - pow(e, 2))
-            mu1 = quad(
-                lambda x: 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * lognorm.pdf(x, sigma, scale=exp(mu)),
-                a=0,
-                b=100,
-                limit=100,
-            )[0]
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = (exp(pow(sigma, 2)) - 1) * exp(2 * mu + pow(sigma, 2)) * pn * (1 - pn)
-            c = exp(mu + 0.5 * pow(sigma, 2)) * pn * (1 - pn)
-            v0 = a / (a * b - pow(c, 2))
-        elif self.family == "normal":
-            mu = self.parameter[0]
-            sigma = self.parameter[1]
-            d = quad(
-                lambda x: (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * norm.pdf(x, mu, sigma),
-                a=-100,
-                b=100,
-                limit=100,
-            )[0]
-            e = quad(
-                lambda x: x
-                          * (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * norm.pdf(x, mu, sigma),
-                a=-100,
-                b=100,
-                limit=100,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * (1 - 1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          * 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * norm.pdf(x, mu, sigma),
-                a=-100,
-                b=100,
-                limit=100,
-            )[0]
-            v1 = d / (d * f - pow(e, 2))
-            mu1 = quad(
-                lambda x: 1
-                          / (1 + exp(-self.beta0 - self.beta1 * x))
-                          * norm.pdf(x, mu, sigma),
-                a=-100,
-                b=100,
-                limit=100,
-            )[0]
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = (exp(pow(sigma, 2)) - 1) * exp(2 * mu + pow(sigma, 2)) * pn * (1 - pn)
-            c = exp(mu + 0.5 * pow(sigma, 2)) * pn * (1 - pn)
-            v0 = a / (a * b - pow(c, 2))
-        elif self.family == "poisson":
-            val_range = np.arange(0, int(1e05) + 1)
-            d = np.sum(
-                (1 - 1 / (1 + np.exp(-self.beta0 - self.beta1 * val_range)))
-                * 1
-                / (1 + np.exp(-self.beta0 - self.beta1 * val_range))
-                * poisson.pmf(val_range, self.parameter)
-            )
-            e = val_range * np.sum(
-                (1 - 1 / (1 + np.exp(-self.beta0 - self.beta1 * val_range)))
-                * 1
-                / (1 + np.exp(-self.beta0 - self.beta1 * val_range))
-                * poisson.pmf(val_range, self.parameter)
-            )
-            f = np.square(val_range) * np.sum(
-                (1 - 1 / (1 + np.exp(-self.beta0 - self.beta1 * val_range)))
-                * 1
-                / (1 + np.exp(-self.beta0 - self.beta1 * val_range))
-                * poisson.pmf(val_range, self.parameter)
-            )
-            v1 = d / (d * f - pow(e, 2))
-            mu1 = np.sum(
-                1
-                / (1 + np.exp(-self.beta0 - self.beta1 * val_range))
-                * poisson.pmf(val_range, self.parameter)
-            )
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = self.parameter * pn * (1 - pn)
-            c = self.parameter * pn * (1 - pn)
-            v0 = a / (a * b - pow(c, 2))
-        elif self.family == "uniform":
-            L = self.parameter[0]
-            R = self.parameter[1]
-            d = quad(
-                lambda x: (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * (1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          / (R - L),
-                a=L,
-                b=R,
-                limit=100,
-            )[0]
-            e = quad(
-                lambda x: x
-                          * (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * (1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          / (R - L),
-                a=L,
-                b=R,
-                limit=100,
-            )[0]
-            f = quad(
-                lambda x: pow(x, 2)
-                          * (1 - (1 / (1 + exp(-self.beta0 - self.beta1 * x))))
-                          * (1 / (1 + exp(-self.beta0 - self.beta1 * x)))
-                          / (R - L),
-                a=L,
-                b=R,
-                limit=100,
-            )[0]
-            v1 = d / (d * f - pow(e, 2))
-            mu1 = quad(
-                lambda x: 1 / (1 + exp(-self.beta0 - self.beta1 * x)) / (R - L),
-                a=L,
-                b=R,
-                limit=100,
-            )[0]
-            i00 = log(mu1 / (1 - mu1))
-            pn = 1 / (1 + exp(-i00))
-            a = pn * (1 - pn)
-            b = pow(R - L, 2) / 12 * pn * (1 - pn)
-            c = pow(R - L, 2) * pn * (1 - pn)
-            v0 = a / (a * b - pow(c, 2))
-        else:
-            raise ValueError(f"Do not recognize {self.family} for Logistic Regression")
-        if self.alternative == "less":
-            s = 1
-            t = 0
-        elif self.alternative == "two-sided":
-            s = 1
-            t = 1
-        else:
-            s = 0
-            t = 1
-        return s, t, g, v0, v1
+        if self._values is None:
+            scale = _logistic_values(self.p0, self.p1, self.family, self._parameter_key)
+            self._values = self._tails + (scale,)
+        return self._values
 
     def _get_power(self) -> float:
-        s, t, g, v0, v1 = self._get_values()
-        power = s * norm.cdf(
-            -norm.ppf(1 - self.alpha)
-            - sqrt(self.n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        ) + t * norm.cdf(
-            -norm.ppf(1 - self.alpha)
-            + sqrt(self.n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        )
+        s, t, scale = self._get_values()
+        power = _wald_power(ndtri(1 - self.alpha), sqrt(self.n) * scale, s, t)
         return power
 
     def _get_n(self, n: int) -> float:
-        s, t, g, v0, v1 = self._get_values()
-        n = s * norm.cdf(
-            -norm.ppf(1 - self.alpha)
-            - sqrt(n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        ) + t * norm.cdf(
-            -norm.ppf(1 - self.alpha)
-            + sqrt(n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        ) - self.power
+        s, t, scale = self._get_values()
+        n = _wald_power(ndtri(1 - self.alpha), sqrt(n) * scale, s, t) - self.power
         return n
 
     def _get_alpha(self, alpha):
-        s, t, g, v0, v1 = self._get_values()
-        alpha = s * norm.cdf(
-            -norm.ppf(1 - alpha)
-            - sqrt(self.n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        ) + t * norm.cdf(
-            -norm.ppf(1 - alpha)
-            + sqrt(self.n) / sqrt(g * v0 + (1 - g) * v1) * self.beta1
-        ) - self.power
+        s, t, scale = self._get_values()
+        alpha = _wald_power(ndtri(1 - alpha), sqrt(self.n) * scale, s, t) - self.power
         return alpha
 
     def pwr_test(self):
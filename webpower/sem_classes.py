@@ -1,11 +1,16 @@
-from math import ceil
+from math import ceil, sqrt
 from typing import Dict, Optional
 
-from scipy.stats import ncx2, chi2
+from scipy.special import chdtri, chndtr, chndtrinc, chndtrix, ndtri
 from scipy.optimize import brentq
 
+from webpower.utils import ceil_root
+
 
 class WPSEMChisq:
+    method = "Power for SEM (Satorra & Saris, 1985)"
+    url = "http://psychstat.org/semchisq"
+
     def __init__(
         self,
         n: Optional[int] = None,
@@ -19,46 +24,51 @@ class WPSEMChisq:
         self.effect = effect
         self.power = power
         self.alpha = alpha
-        self.method = "Power for SEM (Satorra & Saris, 1985)"
-        self.url = "http://psychstat.org/semchisq"
+        # the critical value stays fixed while solving for n or the effect size, so it is computed once here
+        self._c_alpha = chdtri(df, alpha) if df is not None and alpha is not None else None
 
     def _get_power(self) -> float:
         ncp = (self.n - 1) * self.effect
-        c_alpha = chi2.ppf(1 - self.alpha, self.df)
-        power = ncx2.sf(c_alpha, self.df, ncp)
+        power = 1 - chndtr(self._c_alpha, self.df, ncp)
         return power
 
     def _get_n(self, n: int) -> float:
         ncp = (n - 1) * self.effect
-        c_alpha = chi2.ppf(1 - self.alpha, self.df)
-        n = ncx2.sf(c_alpha, self.df, ncp) - self.power
+        n = 1 - chndtr(self._c_alpha, self.df, ncp) - self.power
         return n
 
     def _get_df(self, df: int) -> float:
         ncp = (self.n - 1) * self.effect
-        c_alpha = chi2.ppf(1 - self.alpha, df)
-        df = ncx2.sf(c_alpha, df, ncp) - self.power
+        c_alpha = chdtri(df, self.alpha)
+        df = 1 - chndtr(c_alpha, df, ncp) - self.power
         return df
 
     def _get_alpha(self, alpha: float) -> float:
         ncp = (self.n - 1) * self.effect
-        c_alpha = chi2.ppf(1 - alpha, self.df)
-        alpha = ncx2.sf(c_alpha, self.df, ncp) - self.power
+        c_alpha = chdtri(self.df, alpha)
+        alpha = 1 - chndtr(c_alpha, self.df, ncp) - self.power
         return alpha
 
     def _get_effect_size(self, effect: float) -> float:
         ncp = (self.n - 1) * effect
-        c_alpha = chi2.ppf(1 - self.alpha, self.df)
-        effect = ncx2.sf(c_alpha, self.df, ncp) - self.power
+        effect = 1 - chndtr(self._c_alpha, self.df, ncp) - self.power
         return effect
 
+    def _n_guess(self) -> Optional[float]:
+        """Sample size at which the noncentrality reaches the value that gives the target power, found directly by
+        inverting the noncentral chi-squared distribution in its noncentrality"""
+        if self.effect <= 0 or not 0 < self.power < 1:
+            return None
+        ncp = chndtrinc(self._c_alpha, self.df, 1 - self.power)
+        return ncp / self.effect + 1 if ncp > 0 else None
+
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
         elif self.effect is None:
             self.effect = brentq(self._get_effect_size, 0, 1)
         elif self.n is None:
-            self.n = ceil(brentq(self._get_n, 10 + 1e-10, 1e09))
+            self.n = ceil_root(self._get_n, self._n_guess(), 10 + 1e-10)
         elif self.df is None:
             self.df = ceil(brentq(self._get_df, 1, 1e04))
         else:
@@ -75,6 +85,9 @@ class WPSEMChisq:
 
 
 class WPSEMRMSEA:
+    method = "Power for SEM based on RMSEA"
+    url = "http://psychstat.org/rmsea"
+
     def __init__(
             self,
             n: Optional[int] = None,
@@ -92,69 +105,76 @@ class WPSEMRMSEA:
         self.power = power
         self.alpha = alpha
         self.test_type = test_type.casefold()
-        self.method = "Power for SEM based on RMSEA"
-        self.url = "http://psychstat.org/rmsea"
+        # the noncentralities and the critical value stay fixed while solving for anything but n, df or the quantity
+        # they are built from, so they are computed once here
+        known = n is not None and df is not None
+        self._ncp0 = (n - 1) * df * (rmsea0 * rmsea0) if known and rmsea0 is not None else None
+        self._ncp1 = (n - 1) * df * (rmsea1 * rmsea1) if known and rmsea1 is not None else None
+        if self._ncp0 is not None and alpha is not None:
+            self._c_alpha = self._critical_value(alpha, df, self._ncp0)
+        else:
+            self._c_alpha = None
 
-    def _get_power(self) -> float:
-        ncp0 = (self.n - 1) * self.df * pow(self.rmsea0, 2)
-        ncp1 = (self.n - 1) * self.df * pow(self.rmsea1, 2)
+    def _critical_value(self, alpha: float, df: float, ncp0: float) -> float:
+        """Critical value of the test under the null RMSEA, from the upper tail for a test of close fit and the lower
+        tail for a test of not-close fit"""
         if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - self.alpha, self.df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(self.alpha, self.df, ncp0)
-        power = ncx2.sf(c_alpha, self.df, ncp1)
+            return chndtrix(1 - alpha, df, ncp0)
+        return chndtrix(alpha, df, ncp0)
+
+    def _get_power(self) -> float:
+        power = 1 - chndtr(self._c_alpha, self.df, self._ncp1)
         return power
 
+    def _power_at(self, n: float, df: float) -> float:
+        """Power for a given n and df, which both enter the two noncentralities and the critical value, so nothing
+        can be reused between the steps of an n or df solve"""
+        scale = (n - 1) * df
+        c_alpha = self._critical_value(self.alpha, df, scale * (self.rmsea0 * self.rmsea0))
+        return 1 - chndtr(c_alpha, df, scale * (self.rmsea1 * self.rmsea1))
+
     def _get_n(self, n: int) -> float:
-        ncp0 = (n - 1) * self.df * pow(self.rmsea0, 2)
-        ncp1 = (n - 1) * self.df * pow(self.rmsea1, 2)
-        if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - self.alpha, self.df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(self.alpha, self.df, ncp0)
-        n = ncx2.sf(c_alpha, self.df, ncp1) - self.power
-        return n
+        return self._power_at(n, self.df) - self.power
 
     def _get_df(self, df: int) -> float:
-        ncp0 = (self.n - 1) * df * pow(self.rmsea0, 2)
-        ncp1 = (self.n - 1) * df * pow(self.rmsea1, 2)
-        if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - self.alpha, df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(self.alpha, df, ncp0)
-        df = ncx2.sf(c_alpha, df, ncp1) - self.power
-        return df
+        return self._power_at(self.n, df) - self.power
 
     def _get_rmsea0(self, rmsea0: float) -> float:
-        ncp0 = (self.n - 1) * self.df * pow(rmsea0, 2)
-        ncp1 = (self.n - 1) * self.df * pow(self.rmsea1, 2)
-        if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - self.alpha, self.df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(self.alpha, self.df, ncp0)
-        rmsea0 = ncx2.sf(c_alpha, self.df, ncp1) - self.power
+        ncp0 = (self.n - 1) * self.df * (rmsea0 * rmsea0)
+        c_alpha = self._critical_value(self.alpha, self.df, ncp0)
+        rmsea0 = 1 - chndtr(c_alpha, self.df, self._ncp1) - self.power
         return rmsea0
 
     def _get_rmsea1(self, rmsea1: float) -> float:
-        ncp0 = (self.n - 1) * self.df * pow(self.rmsea0, 2)
-        ncp1 = (self.n - 1) * self.df * pow(rmsea1, 2)
-        if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - self.alpha, self.df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(self.alpha, self.df, ncp0)
-        rmsea1 = ncx2.sf(c_alpha, self.df, ncp1) - self.power
+        ncp1 = (self.n - 1) * self.df * (rmsea1 * rmsea1)
+        rmsea1 = 1 - chndtr(self._c_alpha, self.df, ncp1) - self.power
         return rmsea1
 
     def _get_alpha(self, alpha: float) -> float:
-        ncp0 = (self.n - 1) * self.df * pow(self.rmsea0, 2)
-        ncp1 = (self.n - 1) * self.df * pow(self.rmsea1, 2)
-        if self.test_type == "close":
-            c_alpha = ncx2.ppf(1 - alpha, self.df, ncp0)
-        else:
-            c_alpha = ncx2.ppf(alpha, self.df, ncp0)
-        alpha = ncx2.sf(c_alpha, self.df, ncp1) - self.power
+        c_alpha = self._critical_value(alpha, self.df, self._ncp0)
+        alpha = 1 - chndtr(c_alpha, self.df, self._ncp1) - self.power
         return alpha
 
+    def _n_guess(self) -> Optional[float]:
+        """Sample size for a test of close fit from the normal approximation to the noncentral chi-squared statistic,
+        under which the critical value df + ncp0 + z_alpha * sqrt(2 * (df + 2 * ncp0)) is also
+        df + ncp1 - z_beta * sqrt(2 * (df + 2 * ncp1)), with both noncentralities proportional to n - 1. This is solved
+        for n - 1 by a few fixed-point steps"""
+        # only a test of close fit against a larger RMSEA is sure to gain power with n
+        if self.test_type != "close" or self.rmsea1 <= self.rmsea0 or not 0 < self.power < 1:
+            return None
+        misfit0 = self.df * (self.rmsea0 * self.rmsea0)
+        misfit1 = self.df * (self.rmsea1 * self.rmsea1)
+        gap = misfit1 - misfit0
+        z_alpha = ndtri(1 - self.alpha)
+        z_beta = ndtri(self.power)
+        m = 0.0
+        for _ in range(5):
+            m = (z_alpha * sqrt(2 * (self.df + 2 * m * misfit0)) + z_beta * sqrt(2 * (self.df + 2 * m * misfit1))) / gap
+            if m <= 0:
+                return None
+        return m + 1
+
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
@@ -163,7 +183,7 @@ class WPSEMRMSEA:
         elif self.rmsea1 is None:
             self.rmsea1 = brentq(self._get_rmsea1, 0, 1)
         elif self.n is None:
-            self.n = ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            self.n = ceil_root(self._get_n, self._n_guess())
         elif self.df is None:
             self.df = ceil(brentq(self._get_df, 1, 1e04))
         else:
@@ -1,11 +1,85 @@
-from math import ceil, sqrt
+import numpy as np
+
 from typing import Dict, Optional
 
-from scipy.stats import nct, t as t_dist
+from scipy.special import ndtri, stdtrit
+from scipy.stats import nct
 from scipy.optimize import brentq
 
+from webpower.utils import ceil_root
+
+
+def _critical_two_sided(alpha: float, nu: float) -> float:
+    """Critical value of the two-sided t-test, the upper alpha / 2 quantile, taken by symmetry from the lower one"""
+    return -stdtrit(nu, alpha / 2)
+
+
+def _critical_greater(alpha: float, nu: float) -> float:
+    """Critical value of the t-test when the alternative is greater, the upper alpha quantile, taken by symmetry from the
+    lower one"""
+    return -stdtrit(nu, alpha)
+
+
+def _critical_less(alpha: float, nu: float) -> float:
+    """Critical value of the t-test when the alternative is less, the lower alpha quantile"""
+    return stdtrit(nu, alpha)
+
+
+# either tail of the two-sided test beyond the critical value on the far side of the non-centrality is at most
+# Phi(-|ncp|), which is below 1.2e-19 past this point
+_FAR_TAIL_NCP = 9.0
+
+
+def _power_two_sided(qu: float, nu: float, ncp: float) -> float:
+    """Power of the two-sided t-test given its critical value, degrees of freedom and non-centrality parameter. The
+    lower tail at -qu is the upper tail at qu with the non-centrality reflected, so both tails come from a single call.
+    For a single large non-centrality the negligible far tail is not evaluated"""
+    if np.ndim(ncp) == 0:
+        if ncp >= _FAR_TAIL_NCP:
+            return nct.sf(qu, nu, ncp)
+        if ncp <= -_FAR_TAIL_NCP:
+            return nct.cdf(-qu, nu, ncp)
+    qu, nu, ncp = np.broadcast_arrays(qu, nu, ncp)
+    return nct.sf(qu, nu, np.stack([ncp, -ncp])).sum(axis=0)
+
+
+def _power_greater(qu: float, nu: float, ncp: float) -> float:
+    """Power of the t-test when the alternative is greater"""
+    return nct.sf(qu, nu, ncp)
+
+
+def _power_less(qu: float, nu: float, ncp: float) -> float:
+    """Power of the t-test when the alternative is less"""
+    return nct.cdf(qu, nu, ncp)
+
+
+def _scale_guess(d: float, alpha: float, power: float, alternative: str) -> Optional[float]:
+    """Squared scale of the non-centrality parameter from the large-sample formula ((z_alpha + z_beta) / d) ** 2, or
+    None when the power does not grow towards the target with the sample size"""
+    if d == 0 or not 0 < power < 1:
+        return None
+    if alternative == "two-sided":
+        z_alpha = ndtri(1 - alpha / 2)
+    elif (alternative == "greater") == (d > 0):
+        z_alpha = ndtri(1 - alpha)
+    else:
+        return None
+    shift = z_alpha + ndtri(power)
+    return (shift / d) ** 2 if shift > 0 else None
+
+
+# the critical value and power functions for each alternative, looked up once per instance rather than branched on
+# at every step of a root search
+_TAILS = {
+    "two-sided": (_critical_two_sided, _power_two_sided),
+    "greater": (_critical_greater, _power_greater),
+    "less": (_critical_less, _power_less),
+}
+
 
 class WpOneT:
+    url = "http://psychstat.org/ttest"
+
     def __init__(
         self,
         n: Optional[int] = None,
@@ -22,114 +96,40 @@ class WpOneT:
         self.test_type = test_type.casefold()
         self.alternative = alternative.casefold()
         if self.test_type == "one-sample":
-            self.method = "One Sample"
+            self.method = "One Sample t test power calculation"
             self.note = None
             self.t_sample = 1
         elif self.test_type == "paired":
-            self.method = "Paired Sample"
+            self.method = "Paired Sample t test power calculation"
             self.note = "n is number of *pairs*"
             self.t_sample = 1
         else:
-            self.method = "Two Sample"
+            self.method = "Two Sample t test power calculation"
             self.note = "n is the number in *each* group"
             self.t_sample = 2
-        self.url = "http://psychstat.org/ttest"
+        self._critical_value, self._power_at = _TAILS.get(self.alternative, _TAILS["less"])
+        # the degrees of freedom, the scale of the non-centrality parameter and the critical value only depend on n
+        # and alpha, so they are worked out once rather than on every iteration of a search for the effect size
+        if n is not None:
+            self._nu = (n - 1) * self.t_sample
+            self._scale = np.sqrt(n / self.t_sample)
+            if alpha is not None:
+                self._qu = self._critical_value(alpha, self._nu)
 
     def _get_power(self) -> float:
-        nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            power = nct.sf(qu, nu, sqrt(self.n / self.t_sample) * self.d) + nct.cdf(
-                -qu, nu, sqrt(self.n / self.t_sample) * self.d
-            )
-        elif self.alternative == "greater":
-            power = nct.sf(
-                t_dist.isf(self.alpha, nu),
-                nu,
-                sqrt(self.n / self.t_sample) * self.d,
-            )
-        else:
-            power = nct.cdf(
-                t_dist.ppf(self.alpha, nu),
-                nu,
-                sqrt(self.n / self.t_sample) * self.d,
-            )
-        return power
+        return self._power_at(self._qu, self._nu, self._scale * self.d)
 
     def _get_effect_size(self, effect_size: float) -> float:
-        nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            effect_size = (
-                nct.sf(qu, nu, sqrt(self.n / self.t_sample) * effect_size)
-                + nct.cdf(-qu, nu, sqrt(self.n / self.t_sample) * effect_size)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            effect_size = (
-                nct.sf(
-                    t_dist.isf(self.alpha, nu),
-                    nu,
-                    sqrt(self.n / self.t_sample) * effect_size,
-                )
-                - self.power
-            )
-        else:
-            effect_size = (
-                nct.cdf(
-                    t_dist.ppf(self.alpha, nu),
-                    nu,
-                    sqrt(self.n / self.t_sample) * effect_size,
-                )
-                - self.power
-            )
-        return effect_size
+        return self._power_at(self._qu, self._nu, self._scale * effect_size) - self.power
 
     def _get_n(self, n: int) -> float:
         nu = (n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            n = (
-                nct.sf(qu, nu, sqrt(n / self.t_sample) * self.d)
-                + nct.cdf(-qu, nu, sqrt(n / self.t_sample) * self.d)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = (
-                nct.sf(t_dist.isf(self.alpha, nu), nu, sqrt(n / self.t_sample) * self.d)
-                - self.power
-            )
-        else:
-            n = (
-                nct.cdf(
-                    t_dist.ppf(self.alpha, nu), nu, sqrt(n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        return n
+        qu = self._critical_value(self.alpha, nu)
+        return self._power_at(qu, nu, np.sqrt(n / self.t_sample) * self.d) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(alpha / 2, nu)
-            alpha = (
-                nct.sf(qu, nu, sqrt(self.n / self.t_sample) * self.d)
-                + nct.cdf(-qu, nu, sqrt(self.n / self.t_sample) * self.d)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            alpha = (
-                nct.sf(t_dist.isf(alpha, nu), nu, sqrt(self.n / self.t_sample) * self.d)
-                - self.power
-            )
-        else:
-            alpha = (
-                nct.cdf(
-                    t_dist.ppf(alpha, nu), nu, sqrt(self.n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        return alpha
+        qu = self._critical_value(alpha, self._nu)
+        return self._power_at(qu, self._nu, self._scale * self.d) - self.power
 
     def pwr_test(self) -> Dict:
         if self.power is None:
@@ -142,33 +142,29 @@ class WpOneT:
             else:
                 self.d = brentq(self._get_effect_size, -10, 5)
         elif self.n is None:
-            self.n = ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            scale2 = _scale_guess(self.d, self.alpha, self.power, self.alternative)
+            self.n = ceil_root(self._get_n, self.t_sample * scale2 if scale2 is not None else None)
         else:
             self.alpha = brentq(self._get_alpha, 1e-10, 1 - 1e-10)
+        results = {
+            "n": self.n,
+            "effect_size": self.d,
+            "alpha": self.alpha,
+            "power": self.power,
+            "alternative": self.alternative,
+            "method": self.method,
+            "url": self.url,
+        }
         if self.note is not None:
-            return {
-                "n": self.n,
-                "effect_size": self.d,
-                "alpha": self.alpha,
-                "power": self.power,
-                "alternative": self.alternative,
-                "method": "{} t test power calculation".format(self.method),
-                "note": self.note,
-                "url": self.url,
-            }
-        else:
-            return {
-                "n": self.n,
-                "effect_size": self.d,
-                "alpha": self.alpha,
-                "power": self.power,
-                "alternative": self.alternative,
-                "method": "{} t test power calculation".format(self.method),
-                "url": self.url,
-            }
+            results["note"] = self.note
+        return results
 
 
 class WpTwoT:
+    note = "NOTE: n1 and n2 are number in *each* group"
+    method = "Unbalanced two-sample t-test"
+    url = "http://psychstat.org/ttest2n"
+
     def __init__(
         self,
         n1: Optional[int] = None,
@@ -184,146 +180,40 @@ class WpTwoT:
         self.alpha = alpha
         self.power = power
         self.alternative = alternative.casefold()
-        self.note = "NOTE: n1 and n2 are number in *each* group"
-        self.method = "Unbalanced two-sample t-test"
-        self.url = "http://psychstat.org/ttest2n"
+        self._critical_value, self._power_at = _TAILS.get(self.alternative, _TAILS["less"])
+        if n1 is not None and n2 is not None:
+            self._nu = n1 + n2 - 2
+            self._scale = 1 / np.sqrt(1 / n1 + 1 / n2)
+            if alpha is not None:
+                self._qu = self._critical_value(alpha, self._nu)
 
     def _get_power(self) -> float:
-        nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            power = nct.sf(
-                qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2))
-            ) + nct.cdf(-qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-        elif self.alternative == "greater":
-            power = nct.sf(
-                t_dist.isf(self.alpha, nu),
-                nu,
-                self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-            )
-        else:
-            power = nct.cdf(
-                t_dist.ppf(self.alpha, nu),
-                nu,
-                self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-            )
-        return power
+        return self._power_at(self._qu, self._nu, self.d * self._scale)
 
     def _get_effect_size(self, effect_size: float) -> float:
-        nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            effect_size = (
-                nct.sf(qu, nu, effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                + nct.cdf(-qu, nu, effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            effect_size = (
-                nct.sf(
-                    t_dist.isf(self.alpha, nu),
-                    nu,
-                    effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            effect_size = (
-                nct.cdf(
-                    t_dist.ppf(self.alpha, nu),
-                    nu,
-                    effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return effect_size
+        return self._power_at(self._qu, self._nu, effect_size * self._scale) - self.power
 
     def _get_n1(self, n1: int) -> float:
         nu = n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            n1 = (
-                nct.sf(qu, nu, self.d * (1 / sqrt(1 / n1 + 1 / self.n2)))
-                + nct.cdf(-qu, nu, self.d * (1 / sqrt(1 / n1 + 1 / self.n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n1 = (
-                nct.sf(
-                    t_dist.isf(self.alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            n1 = (
-                nct.cdf(
-                    t_dist.ppf(self.alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return n1
+        qu = self._critical_value(self.alpha, nu)
+        return self._power_at(qu, nu, self.d * (1 / np.sqrt(1 / n1 + 1 / self.n2))) - self.power
 
     def _get_n2(self, n2: int) -> float:
         nu = self.n1 + n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.alpha / 2, nu)
-            n2 = (
-                nct.sf(qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / n2)))
-                + nct.cdf(-qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n2 = (
-                nct.sf(
-                    t_dist.isf(self.alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / self.n1 + 1 / n2)),
-                )
-                - self.power
-            )
-        else:
-            n2 = (
-                nct.cdf(
-                    t_dist.ppf(self.alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / self.n1 + 1 / n2)),
-                )
-                - self.power
-            )
-        return n2
+        qu = self._critical_value(self.alpha, nu)
+        return self._power_at(qu, nu, self.d * (1 / np.sqrt(1 / self.n1 + 1 / n2))) - self.power
 
     def _get_alpha(self, alpha: float) -> float:
-        nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(alpha / 2, nu)
-            alpha = (
-                nct.sf(qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                + nct.cdf(-qu, nu, self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            alpha = (
-                nct.sf(
-                    t_dist.isf(alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            alpha = (
-                nct.cdf(
-                    t_dist.ppf(alpha, nu),
-                    nu,
-                    self.d * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return alpha
+        qu = self._critical_value(alpha, self._nu)
+        return self._power_at(qu, self._nu, self.d * self._scale) - self.power
+
+    def _solve_group(self, resid, other: int) -> int:
+        """Size of one group given the size of the other, bracketed around the solution of
+        n1 * n2 / (n1 + n2) = scale ** 2 when there is one"""
+        scale2 = _scale_guess(self.d, self.alpha, self.power, self.alternative)
+        if scale2 is None or other <= scale2:
+            return ceil_root(resid, None)
+        return ceil_root(resid, scale2 * other / (other - scale2))
 
     def pwr_test(self) -> Dict:
         if self.power is None:
@@ -336,9 +226,9 @@ class WpTwoT:
             else:
                 self.d = brentq(self._get_effect_size, -10, 5)
         elif self.n1 is None:
-            self.n1 = ceil(brentq(self._get_n1, 2 + 1e-10, 1e09))
+            self.n1 = self._solve_group(self._get_n1, self.n2)
         elif self.n2 is None:
-            self.n2 = ceil(brentq(self._get_n2, 2 + 1e-10, 1e09))
+            self.n2 = self._solve_group(self._get_n2, self.n1)
         else:
             self.alpha = brentq(self._get_alpha, 1e-10, 1 - 1e-10)
         return {
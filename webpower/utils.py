@@ -1,9 +1,28 @@
-from scipy.optimize import bisect
+from math import ceil
+from typing import Optional, Tuple
+
+from scipy.optimize import brentq, toms748
 
 import numpy as np
 
 
-def nuniroot(f, low_val: float = 0, high_val: float = 1, max_length: int = 100) -> float:
+def _bracket(f, low_val: float, high_val: float, max_length: int, vectorized: bool) -> Tuple[float, float]:
+    """Scans f over an even grid between low_val and high_val and returns the grid points either side of its root,
+    ordered so that f is negative at the first and positive at the second"""
+    x = np.linspace(low_val, high_val, max_length)
+    f_output = np.asarray(f(x)) if vectorized else np.array([f(x_i) for x_i in x])
+    negative, positive = f_output < 0, f_output > 0
+    if not (negative.any() and positive.any()):
+        raise ValueError(
+            "The specified parameters do not yield valid results. Please try to supply a different interval, e.g., "
+            "using interval=[0, 1], for your parameter.")
+    # the grid points whose values are closest to zero on either side of it
+    low = np.argmax(np.where(negative, f_output, -np.inf))
+    high = np.argmin(np.where(positive, f_output, np.inf))
+    return x[low], x[high]
+
+
+def nuniroot(f, low_val: float = 0, high_val: float = 1, max_length: int = 100, vectorized: bool = False) -> float:
     """Calculates the root of our function f given low_val and high_val
 
     Parameters
@@ -16,19 +35,156 @@ def nuniroot(f, low_val: float = 0, high_val: float = 1, max_length: int = 100)
         The high end of our interval for bisection
     max_length: int, default=100
         How many intervals between low_val and high_val we will have
+    vectorized: bool, default=False
+        Whether f accepts an array, in which case the whole grid is evaluated in a single call rather than one call per
+        point
 
     Returns
     -------
     The root of our function given low_val and high_val
     """
-    x = np.linspace(low_val, high_val, max_length)
-    f_output = np.array([f(x_i) for x_i in x])
-    if min(f_output) * max(f_output) > 0:
+    negative, positive = _bracket(f, low_val, high_val, max_length, vectorized)
+    return brentq(f, negative, positive)
+
+
+def nuniroot_ceil(f, low_val: float = 0, high_val: float = 1, max_length: int = 100, vectorized: bool = False) -> int:
+    """Calculates the smallest integer at or above the root of our function f given low_val and high_val. Since only
+    that integer is needed, the root is located to within half a unit and its ceiling is then checked against the sign
+    of f either side of it
+
+    Parameters
+    ----------
+    f: function
+        The function whose root we are rounding up
+    low_val: float, default=0
+        The low end of our interval
+    high_val: float, default=1
+        The high end of our interval
+    max_length: int, default=100
+        How many intervals between low_val and high_val we will have
+    vectorized: bool, default=False
+        Whether f accepts an array, in which case the whole grid is evaluated in a single call rather than one call per
+        point
+
+    Returns
+    -------
+    The ceiling of the root of our function given low_val and high_val
+    """
+    negative, positive = _bracket(f, low_val, high_val, max_length, vectorized)
+    low, high = min(negative, positive), max(negative, positive)
+    increasing = negative < positive
+
+    def past_root(x: float) -> bool:
+        value = f(x)
+        return value == 0 or (value > 0) == increasing
+
+    root = ceil(toms748(f, low, high, xtol=0.5))
+    while root < high and not past_root(root):
+        root += 1
+    while root - 1 > low and past_root(root - 1):
+        root -= 1
+    return root
+
+
+def ceil_root(resid, guess: Optional[float], low: float = 2 + 1e-10, high: float = 1e09) -> int:
+    """Smallest whole sample size, above low, at which the increasing residual resid turns non-negative. The root is
+    bracketed around the large-sample guess and only solved to within half a unit before being rounded up. When the
+    guess does not bracket it, the root is solved to full precision over [low, high] and rounded up
+
+    Parameters
+    ----------
+    resid: function
+        Power at a given sample size minus the target power
+    guess: float, optional
+        Approximate root
+    low: float, default=2 + 1e-10
+        The low end of our interval
+    high: float, default=1e09
+        The high end of our interval
+
+    Returns
+    -------
+    The required sample size
+    """
+    if guess is None:
+        return ceil(brentq(resid, low, high))
+    try:
+        root = brentq(resid, max(low, guess / 2), max(low, 2 * guess), xtol=0.5, maxiter=50)
+    except ValueError:
+        return ceil(brentq(resid, low, high))
+    n = ceil(root)
+    # the root is only known to within xtol, so step onto the exact ceiling
+    while n - 1 > low and resid(n - 1) >= 0:
+        n -= 1
+    while resid(n) < 0:
+        n += 1
+    return n
+
+
+def vec_chandrupatla(f, low_val, high_val, xtol: float = 1e-12, max_iter: int = 100) -> np.ndarray:
+    """Calculates the roots of a vectorized function f with Chandrupatla's algorithm, which takes an inverse quadratic
+    interpolation step wherever the last three points make it safe and bisects otherwise. Every element is solved at
+    once, so a batch of root-finding problems costs one NumPy call per iteration rather than one brentq per element
+
+    Parameters
+    ----------
+    f: function
+        The function we are finding the roots of; it must accept an array and return an array of the same shape
+    low_val: float or array_like
+        The low end of our intervals
+    high_val: float or array_like
+        The high end of our intervals
+    xtol: float, default=1e-12
+        The absolute tolerance on each root, on top of a relative tolerance of a few machine epsilons
+    max_iter: int, default=100
+        The maximum number of iterations
+
+    Returns
+    -------
+    An array with the root of f within each interval
+    """
+    f_low = f(np.asarray(low_val, dtype=float))
+    f_high = f(np.asarray(high_val, dtype=float))
+    if np.any(f_low * f_high > 0):
         raise ValueError(
             "The specified parameters do not yield valid results. Please try to supply a different interval, e.g., "
-            "using interval=[0, 1], for your parameter.") 
-    else:
-        low = max(f_output[f_output < 0])
-        high = min(f_output[f_output > 0])
-        interval = [x[f_output == low][0], x[f_output == high][0]]
-        return bisect(f, interval[0], interval[1])
+            "using interval=[0, 1], for your parameter.")
+    shape = np.broadcast(f_low, f_high).shape
+    a = np.array(np.broadcast_to(high_val, shape), dtype=float)
+    b = np.array(np.broadcast_to(low_val, shape), dtype=float)
+    c = a.copy()
+    f_a = np.array(np.broadcast_to(f_high, shape), dtype=float)
+    f_b = np.array(np.broadcast_to(f_low, shape), dtype=float)
+    f_c = f_a.copy()
+    t = np.full(shape, 0.5)
+    active = np.ones(shape, dtype=bool)
+    x_m = np.where(np.abs(f_a) < np.abs(f_b), a, b)
+    for _ in range(max_iter):
+        x_t = a + t * (b - a)
+        f_t = f(x_t)
+        # the new point replaces whichever end of the bracket has the same sign, and the discarded end becomes c
+        # converged elements are carried along unchanged
+        same = np.signbit(f_t) == np.signbit(f_a)
+        c = np.where(active, np.where(same, a, b), c)
+        f_c = np.where(active, np.where(same, f_a, f_b), f_c)
+        b = np.where(active & ~same, a, b)
+        f_b = np.where(active & ~same, f_a, f_b)
+        a = np.where(active, x_t, a)
+        f_a = np.where(active, f_t, f_a)
+        x_m = np.where(np.abs(f_a) < np.abs(f_b), a, b)
+        f_m = np.minimum(np.abs(f_a), np.abs(f_b))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_lim = (2 * np.finfo(float).eps * np.abs(x_m) + xtol) / np.abs(b - c)
+            active &= (t_lim <= 0.5) & (f_m != 0)
+            if not np.any(active):
+                break
+            xi = (a - b) / (c - b)
+            phi = (f_a - f_b) / (f_c - f_b)
+            iqi = (phi * phi < xi) & ((1 - phi) * (1 - phi) < 1 - xi)
+            t = np.where(
+                iqi,
+                f_a / (f_b - f_a) * f_c / (f_b - f_c) + (c - a) / (b - a) * f_a / (f_c - f_a) * f_b / (f_c - f_b),
+                0.5,
+            )
+        t = np.clip(t, t_lim, 1 - t_lim)
+    return x_m